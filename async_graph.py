@@ -0,0 +1,201 @@
+# asyncio facade for the Directed Graph Data Structure
+
+import asyncio
+import threading
+
+from graph import DirectedGraph, GraphException
+
+# Returned by _advance() once the traversal iterator is exhausted
+_EXHAUSTED = object()
+
+
+class AsyncDirectedGraph:
+    """
+    asyncio facade over a DirectedGraph, so traversals do not block the event loop. In "cooperative" mode traversals
+    run on the event loop thread and yield to it every yield_every expansions. In "executor" mode they run in an
+    executor thread. Either way, cancelling the awaiting task stops the traversal at its next expansion checkpoint; in
+    "executor" mode the cancelled call finishes only once its thread has stopped, so max_concurrency also bounds the
+    threads still running.
+
+    Traversals walk the live graph, so it must not be mutated while traversals are in flight in either mode - in
+    "cooperative" mode other tasks run at every checkpoint, in "executor" mode they run alongside. A mutation the
+    traversal runs into, such as a removed vertex, raises GraphException; other changes may be reflected only partly
+    in the result. Serialize mutations with traversals, or traverse a separate copy (e.g. induced_subgraph()), if the
+    graph changes while requests are served.
+
+    :param graph:               DirectedGraph to traverse.
+    :param mode:                String. "cooperative" or "executor". Defaults to "cooperative".
+    :param yield_every:         Integer number of vertices expanded between checkpoints. Defaults to 1000.
+    :param max_concurrency:     Integer maximum number of traversals running at once. Further calls wait for a slot.
+                                Optional value, if none supplied, traversals are not limited.
+    :param executor:            concurrent.futures.Executor used in "executor" mode. Optional value, if none
+                                supplied, the event loop's default executor is used.
+    """
+
+    def __init__(self, graph: DirectedGraph, mode: str = "cooperative", yield_every: int = 1000,
+                 max_concurrency: int = None, executor=None):
+        if mode not in ("cooperative", "executor"):
+            raise GraphException("Error: mode must be one of 'cooperative' or 'executor'.")
+        elif yield_every < 1:
+            raise GraphException("Error: yield_every must be at least 1.")
+
+        self.graph = graph
+        self._mode = mode
+        self._yield_every = yield_every
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self._executor = executor
+
+    async def min_path(self, source_id: str) -> tuple:
+        """
+        Awaitable DirectedGraph.min_path().
+
+        :param source_id:   String representing the identifier of the vertex we are searching from.
+
+        :return:            Tuple containing a list of vertices ordered from the smallest distance to the largest, and a
+                            dictionary containing each vertex and its associated distance as key-value pairs.
+        """
+        visited_vert = {}
+
+        def consume(item: tuple) -> bool:
+            visited_vert[item[0]] = item[1]
+            return False
+
+        await self._traverse(lambda: self.graph.iter_min_path(source_id), consume)
+        return [vert for vert in visited_vert], visited_vert
+
+    async def breadth_first_search(self, source_id: str, target_id: str = None) -> tuple | list:
+        """
+        Awaitable DirectedGraph.breadth_first_search().
+
+        :param source_id:       String representing the identifier of the vertex we are searching FROM.
+        :param target_id:       String representing the identifier of the vertex we are searching FOR. Optional value.
+
+        :return:                If target_id supplied, tuple of (Boolean indicating target reachable, list of reachable
+                                vertices). Otherwise, list of reachable vertices.
+        """
+        if target_id and not self.graph.vertex_exists(target_id):
+            raise GraphException("Error: There is no vertex in the graph with the provided target identifier.")
+        reachable_vert = []
+
+        def consume(item: tuple) -> bool:
+            reachable_vert.append(item[0])
+            return False
+
+        await self._traverse(lambda: self.graph.iter_bfs(source_id), consume)
+        if target_id:
+            return target_id in set(reachable_vert), reachable_vert
+        return reachable_vert
+
+    async def depth_first_search(self, source_id: str, target_id: str) -> bool:
+        """
+        Awaitable DirectedGraph.depth_first_search(). Stops as soon as the target is found.
+
+        :param source_id:       String representing the identifier of the vertex we are searching FROM.
+        :param target_id:       String representing the identifier of the vertex we are searching FOR.
+
+        :return:                Boolean. True if target reachable from source, False otherwise.
+        """
+        if not self.graph.vertex_exists(target_id):
+            raise GraphException("Error: There is no vertex in the graph with the provided target identifier.")
+        found = []
+
+        def consume(item: tuple) -> bool:
+            if item[0] == target_id:
+                found.append(True)
+                return True
+            return False
+
+        await self._traverse(lambda: self.graph.iter_dfs(source_id), consume)
+        return bool(found)
+
+    async def _traverse(self, make_iter, consume) -> None:
+        """
+        Drains the iterator returned by make_iter into consume, which returns True to stop early. Waits for a
+        concurrency slot first, then runs in the configured mode.
+
+        :param make_iter:       Callable returning the traversal iterator. Called before the traversal starts, so
+                                invalid arguments raise immediately.
+        :param consume:         Callable taking each yielded item and returning True to stop the traversal.
+
+        :return:                None.
+        """
+        iterator = make_iter()
+        if self._semaphore is None:
+            await self._run(iterator, consume)
+            return
+        async with self._semaphore:
+            await self._run(iterator, consume)
+
+    async def _run(self, iterator, consume) -> None:
+        """
+        Runs the traversal cooperatively or in the executor. Raises exception if the graph is mutated under the
+        traversal in a way it detects.
+
+        :param iterator:        Traversal iterator.
+        :param consume:         Callable taking each yielded item and returning True to stop the traversal.
+
+        :return:                None.
+        """
+        if self._mode == "cooperative":
+            expanded = 0
+            while True:
+                item = _advance(iterator)
+                if item is _EXHAUSTED or consume(item):
+                    return
+                expanded += 1
+                # Hand control back to the event loop periodically - cancellation is delivered here
+                if expanded % self._yield_every == 0:
+                    await asyncio.sleep(0)
+
+        cancelled = threading.Event()
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, self._drain, iterator, consume, cancelled)
+        try:
+            await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # The executor thread cannot be interrupted, so signal it to stop at its next checkpoint. Keep the
+            # concurrency slot until it has actually returned, so max_concurrency holds for running threads.
+            cancelled.set()
+            while not future.done():
+                try:
+                    await asyncio.wait({future})
+                except asyncio.CancelledError:
+                    pass
+            # The traversal's outcome is discarded - mark any exception as retrieved
+            future.exception()
+            raise
+
+    def _drain(self, iterator, consume, cancelled: threading.Event) -> None:
+        """
+        Executor body of _run(). Checks the cancellation flag every yield_every expansions.
+
+        :param iterator:        Traversal iterator.
+        :param consume:         Callable taking each yielded item and returning True to stop the traversal.
+        :param cancelled:       Event set when the awaiting task is cancelled.
+
+        :return:                None.
+        """
+        expanded = 0
+        while True:
+            item = _advance(iterator)
+            if item is _EXHAUSTED or consume(item):
+                return
+            expanded += 1
+            if expanded % self._yield_every == 0 and cancelled.is_set():
+                return
+
+
+def _advance(iterator):
+    """
+    Returns the next item of a traversal iterator, or _EXHAUSTED once it is finished. Only errors raised while
+    advancing the traversal are translated - a removed vertex surfaces there as KeyError and a resized adjacency
+    dictionary as RuntimeError.
+
+    :param iterator:        Traversal iterator over the live graph.
+
+    :return:                Next item of the iterator, or _EXHAUSTED.
+    """
+    try:
+        return next(iterator, _EXHAUSTED)
+    except (KeyError, RuntimeError) as error:
+        raise GraphException("Error: Graph was modified during traversal.") from error
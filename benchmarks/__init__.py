@@ -0,0 +1,5 @@
+# Benchmark and profiling suite for graph.py and ds_library.py. Run from the repository root as a package so that the
+# top-level modules are importable without any path manipulation:
+#
+#     python -m benchmarks --help           # full suite
+#     python -m benchmarks.memory --help    # a single benchmark module
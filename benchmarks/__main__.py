@@ -0,0 +1,53 @@
+# Command-line interface for the benchmark suite
+
+import argparse
+import json
+import sys
+
+from benchmarks.generators import GENERATORS
+from benchmarks.suite import compare_runs, run_suite
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark graph.py and ds_library.py.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the suite and emit JSON")
+    run_parser.add_argument("--generators", nargs="+", choices=sorted(GENERATORS), default=sorted(GENERATORS))
+    run_parser.add_argument("--sizes", nargs="+", type=int, default=[1000, 10000])
+    run_parser.add_argument("--repeat", type=int, default=3, help="runs per timing; the fastest is kept")
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--output", "-o", help="write JSON here instead of stdout")
+
+    compare_parser = commands.add_parser("compare", help="compare two JSON runs and flag regressions")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.1, help="allowed fractional slowdown")
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        report = json.dumps(run_suite(args.generators, args.sizes, args.repeat, args.seed), indent=2)
+        if args.output:
+            with open(args.output, "w") as file:
+                file.write(report + "\n")
+        else:
+            print(report)
+        return 0
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    with open(args.current) as file:
+        current = json.load(file)
+
+    rows = compare_runs(baseline, current, args.threshold)
+    print(f"{'measurement':<45}{'baseline':>14}{'current':>14}{'ratio':>8}")
+    for key, old, new, ratio, regressed in rows:
+        print(f"{key:<45}{old:>14.6g}{new:>14.6g}{ratio:>8.2f}{'  REGRESSION' if regressed else ''}")
+
+    # Non-zero exit status lets CI fail on a regression
+    return 1 if any(row[4] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,34 @@
+# Benchmark comparing vertices settled by min_path (Dijkstra's Algorithm) and expanded by A* on a grid graph
+
+import argparse
+import time
+
+from benchmarks.generators import build_graph, grid_spec
+from graph import euclidean_heuristic
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare A* and min_path on a grid graph.")
+    parser.add_argument("--side", type=int, default=200, help="vertices along each side of the grid")
+    args = parser.parse_args()
+
+    graph = build_graph(grid_spec(args.side * args.side))
+    source = "0,0"
+    target = f"{args.side // 2},{args.side // 2}"
+
+    start = time.perf_counter()
+    order, distances = graph.min_path(source)
+    dijkstra_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    distance, _, expanded = graph._astar_search(source, target, euclidean_heuristic)
+    astar_time = time.perf_counter() - start
+
+    assert distance == distances[target]
+    print(f"grid {args.side}x{args.side}, {source} -> {target}, distance {distance}")
+    print(f"min_path: {len(order):>9} settled  {dijkstra_time:.3f}s")
+    print(f"astar:    {expanded:>9} expanded {astar_time:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# Stress benchmark measuring ConcurrentDirectedGraph read throughput as the number of reader threads grows
+
+import argparse
+import random
+import threading
+import time
+
+from concurrent_graph import ConcurrentDirectedGraph
+from graph import DirectedGraph
+
+
+def build_graph(size: int, degree: int, rng: random.Random) -> DirectedGraph:
+    """
+    Builds a random unweighted graph with the given number of vertices and outbound edges per vertex.
+
+    :param size:        Integer number of vertices.
+    :param degree:      Integer number of outbound edges per vertex.
+    :param rng:         Random number generator.
+
+    :return:            DirectedGraph holding the random graph.
+    """
+    graph = DirectedGraph()
+    graph.add_vertices((str(ind), None) for ind in range(size))
+    graph.add_edges((str(ind), str(rng.randrange(size))) for ind in range(size) for _ in range(degree))
+
+    return graph
+
+
+def run(graph: ConcurrentDirectedGraph, threads: int, duration: float, use_snapshot: bool, size: int) -> tuple:
+    """
+    Runs reader threads doing BFS from random sources alongside one writer thread adding and removing edges.
+
+    :param graph:           ConcurrentDirectedGraph under test.
+    :param threads:         Integer number of reader threads.
+    :param duration:        Float number of seconds to run for.
+    :param use_snapshot:    Bool indicating if readers traverse a snapshot instead of taking the read lock.
+    :param size:            Integer number of vertices in the graph.
+
+    :return:                Tuple of (reads per second, writes per second).
+    """
+    stop = threading.Event()
+    counts = [0] * (threads + 1)
+
+    def reader(slot: int) -> None:
+        rng = random.Random(slot)
+        while not stop.is_set():
+            source_id = str(rng.randrange(size))
+            if use_snapshot:
+                graph.snapshot().breadth_first_search(source_id)
+            else:
+                graph.breadth_first_search(source_id)
+            counts[slot] += 1
+
+    def writer() -> None:
+        rng = random.Random(-1)
+        while not stop.is_set():
+            source_id, dest_id = str(rng.randrange(size)), str(rng.randrange(size))
+            if graph.edge_exists(source_id, dest_id):
+                graph.remove_edge(source_id, dest_id)
+            else:
+                graph.add_edge(source_id, dest_id)
+            counts[threads] += 1
+            time.sleep(0.001)
+
+    workers = [threading.Thread(target=reader, args=(slot,)) for slot in range(threads)]
+    workers.append(threading.Thread(target=writer))
+    for worker in workers:
+        worker.start()
+    time.sleep(duration)
+    stop.set()
+    for worker in workers:
+        worker.join()
+
+    return sum(counts[:threads]) / duration, counts[threads] / duration
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure ConcurrentDirectedGraph read throughput per thread count.")
+    parser.add_argument("--size", type=int, default=2000, help="number of vertices")
+    parser.add_argument("--degree", type=int, default=2, help="outbound edges per vertex")
+    parser.add_argument("--duration", type=float, default=2.0, help="seconds per measurement")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    graph = ConcurrentDirectedGraph(build_graph(args.size, args.degree, random.Random(0)))
+    print(f"{'mode':<10}{'threads':>8}{'reads/s':>12}{'writes/s':>12}")
+    for use_snapshot in (False, True):
+        for threads in args.threads:
+            reads, writes = run(graph, threads, args.duration, use_snapshot, args.size)
+            print(f"{'snapshot' if use_snapshot else 'locked':<10}{threads:>8}{reads:>12,.0f}{writes:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# Synthetic graph generators used by the benchmark suite
+
+import math
+import random
+
+from graph import DirectedGraph
+
+
+def random_spec(size: int, degree: int = 4, seed: int = 0) -> tuple:
+    """
+    Returns the vertices and edges of a random graph where each vertex has edges to degree uniformly chosen vertices.
+
+    :param size:        Integer number of vertices.
+    :param degree:      Integer number of outbound edges per vertex.
+    :param seed:        Integer random seed.
+
+    :return:            Tuple of (list of (identifier, value) tuples, list of (source, dest, weight) tuples).
+    """
+    rng = random.Random(seed)
+    names = [str(ind) for ind in range(size)]
+    edges = [(names[ind], names[rng.randrange(size)], rng.randint(1, 100))
+             for ind in range(size) for _ in range(degree)]
+
+    return [(name, None) for name in names], edges
+
+
+def grid_spec(size: int, seed: int = 0) -> tuple:
+    """
+    Returns the vertices and edges of a square grid with about size vertices, identified "x,y" and holding their
+    (x, y) coordinates, with edges in both directions between horizontal and vertical neighbours. Edge weights are 1.
+
+    :param size:        Integer approximate number of vertices. Rounded down to a square.
+    :param seed:        Unused. Accepted so every generator has the same signature.
+
+    :return:            Tuple of (list of (identifier, value) tuples, list of (source, dest, weight) tuples).
+    """
+    side = max(1, math.isqrt(size))
+    vertices = [(f"{x},{y}", (x, y)) for x in range(side) for y in range(side)]
+
+    edges = []
+    for x in range(side):
+        for y in range(side):
+            for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+                if 0 <= x + dx < side and 0 <= y + dy < side:
+                    edges.append((f"{x},{y}", f"{x + dx},{y + dy}", 1))
+
+    return vertices, edges
+
+
+def scale_free_spec(size: int, degree: int = 3, seed: int = 0) -> tuple:
+    """
+    Returns the vertices and edges of a scale-free graph built by preferential attachment: each new vertex adds edges
+    from degree existing vertices chosen with probability proportional to their current degree, so early vertices
+    become high out-degree hubs that reach the rest of the graph.
+
+    :param size:        Integer number of vertices.
+    :param degree:      Integer number of edges added by each new vertex.
+    :param seed:        Integer random seed.
+
+    :return:            Tuple of (list of (identifier, value) tuples, list of (source, dest, weight) tuples).
+    """
+    rng = random.Random(seed)
+    names = [str(ind) for ind in range(size)]
+    # Each vertex appears in endpoints once per edge it touches, so uniform picks from it follow degree
+    endpoints = list(range(min(degree, size)))
+    edges = []
+
+    for ind in range(len(endpoints), size):
+        for dest in {rng.choice(endpoints) for _ in range(degree)}:
+            edges.append((names[dest], names[ind], rng.randint(1, 100)))
+            endpoints.extend((ind, dest))
+
+    return [(name, None) for name in names], edges
+
+
+def dag_spec(size: int, degree: int = 4, seed: int = 0) -> tuple:
+    """
+    Returns the vertices and edges of a random DAG: every edge goes from a lower-numbered vertex to a higher one.
+
+    :param size:        Integer number of vertices.
+    :param degree:      Integer number of outbound edges per vertex (fewer near the end).
+    :param seed:        Integer random seed.
+
+    :return:            Tuple of (list of (identifier, value) tuples, list of (source, dest, weight) tuples).
+    """
+    rng = random.Random(seed)
+    names = [str(ind) for ind in range(size)]
+    edges = [(names[ind], names[rng.randrange(ind + 1, size)], rng.randint(1, 100))
+             for ind in range(size - 1) for _ in range(degree)]
+
+    return [(name, None) for name in names], edges
+
+
+GENERATORS = {
+    "random": random_spec,
+    "grid": grid_spec,
+    "scale_free": scale_free_spec,
+    "dag": dag_spec,
+}
+
+
+def build_graph(spec: tuple, weighted: bool = True) -> DirectedGraph:
+    """
+    Builds a DirectedGraph from the vertices and edges returned by a generator.
+
+    :param spec:        Tuple of (vertices, edges) returned by a generator.
+    :param weighted:    Bool indicating if the graph is weighted. Defaults to True.
+
+    :return:            DirectedGraph holding the generated graph.
+    """
+    vertices, edges = spec
+    graph = DirectedGraph(weighted)
+    graph.add_vertices(vertices)
+    graph.add_edges(edges)
+
+    return graph
@@ -0,0 +1,57 @@
+# Micro-benchmark comparing PriorityQueue push/pop throughput across heap backends
+
+import argparse
+import random
+import time
+
+from ds_library import PriorityQueue
+
+BACKENDS = (("heapq", {}), ("dary", {"d": 2}), ("dary", {"d": 4}), ("dary", {"d": 8}), ("pairing", {}),
+            ("binary", {}))
+
+
+def time_backend(backend: str, options: dict, priorities: list) -> tuple:
+    """
+    Pushes every priority into a new PriorityQueue, then pops until empty.
+
+    :param backend:     String naming the PriorityQueue backend.
+    :param options:     Dictionary of extra PriorityQueue keyword arguments.
+    :param priorities:  List of priorities to push.
+
+    :return:            Tuple of (push operations per second, pop operations per second).
+    """
+    p_queue = PriorityQueue(backend, **options)
+    enqueue, dequeue = p_queue.enqueue, p_queue.dequeue
+
+    start = time.perf_counter()
+    for ind, priority in enumerate(priorities):
+        enqueue(priority, ind)
+    push_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(len(priorities)):
+        dequeue()
+    pop_time = time.perf_counter() - start
+
+    return len(priorities) / push_time, len(priorities) / pop_time
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare PriorityQueue backend push/pop throughput.")
+    parser.add_argument("--min-exp", type=int, default=3, help="smallest size as a power of ten")
+    parser.add_argument("--max-exp", type=int, default=6, help="largest size as a power of ten (up to 7)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'backend':<10}{'size':>10}{'push/s':>14}{'pop/s':>14}")
+    for exp in range(args.min_exp, args.max_exp + 1):
+        priorities = [rng.random() for _ in range(10 ** exp)]
+        for backend, options in BACKENDS:
+            name = backend + (f"-{options['d']}" if "d" in options else "")
+            push_rate, pop_rate = time_backend(backend, options, priorities)
+            print(f"{name:<10}{10 ** exp:>10}{push_rate:>14,.0f}{pop_rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# Benchmark reporting DirectedGraph memory use per vertex and per edge, with and without Vertex.__slots__
+
+import argparse
+import random
+import tracemalloc
+
+import graph
+
+
+class UnslottedVertex:
+    """Vertex as laid out before __slots__ was added, with a per-instance __dict__. Used as the comparison baseline."""
+
+    def __init__(self, identifier: str, value: object, adj_vert: dict = None, in_vert: dict = None):
+        self.id = identifier
+        self.value = value
+        self.adj_dict = {} if adj_vert is None else adj_vert
+        self.in_dict = {} if in_vert is None else in_vert
+
+
+def measure(size: int, degree: int, seed: int, vertex_class: type = graph.Vertex) -> tuple:
+    """
+    Measures the memory allocated by a graph of the given size, first with its vertices only and then with its edges.
+    Identifier strings are created before measuring, as callers usually already hold them.
+
+    :param size:            Integer number of vertices.
+    :param degree:          Integer number of outbound edges per vertex.
+    :param seed:            Integer random seed for edge destinations.
+    :param vertex_class:    Class DirectedGraph builds its vertices from during the measurement. Defaults to Vertex.
+
+    :return:                Tuple of (bytes per vertex, bytes per edge, number of edges).
+    """
+    rng = random.Random(seed)
+    names = [f"vertex-{ind}" for ind in range(size)]
+    edges = [(names[ind], names[rng.randrange(size)], rng.randint(1, 100))
+             for ind in range(size) for _ in range(degree)]
+
+    # DirectedGraph looks Vertex up in its module on every insert, so swapping it changes the layout under test
+    original_class, graph.Vertex = graph.Vertex, vertex_class
+    try:
+        tracemalloc.start()
+        directed_graph = graph.DirectedGraph(weighted=True)
+        for name in names:
+            directed_graph.add_vertex(name, None)
+        vertex_bytes = tracemalloc.get_traced_memory()[0]
+        for source_id, dest_id, weight in edges:
+            directed_graph.add_edge(source_id, dest_id, weight)
+        total_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+    finally:
+        graph.Vertex = original_class
+
+    edge_count = sum(directed_graph.out_degree(name) for name in names)
+    return vertex_bytes / size, (total_bytes - vertex_bytes) / edge_count, edge_count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare DirectedGraph bytes per vertex and per edge with and "
+                                                 "without Vertex.__slots__.")
+    parser.add_argument("--size", type=int, default=1_000_000, help="number of vertices")
+    parser.add_argument("--degree", type=int, default=4, help="outbound edges per vertex")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    before_vertex, before_edge, edge_count = measure(args.size, args.degree, args.seed, UnslottedVertex)
+    after_vertex, after_edge, _ = measure(args.size, args.degree, args.seed)
+    print(f"{args.size:,} vertices, {edge_count:,} edges")
+    print(f"{'':<22}{'bytes/vertex':>14}{'bytes/edge':>12}")
+    print(f"{'before (__dict__)':<22}{before_vertex:>14,.1f}{before_edge:>12,.1f}")
+    print(f"{'after (__slots__)':<22}{after_vertex:>14,.1f}{after_edge:>12,.1f}")
+    print(f"{'saved':<22}{before_vertex - after_vertex:>14,.1f}{before_edge - after_edge:>12,.1f}")
+
+
+if __name__ == "__main__":
+    main()
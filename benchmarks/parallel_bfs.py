@@ -0,0 +1,66 @@
+# Benchmark comparing the queue-based BFS with the level-synchronous bfs_hop_distances(). Rows marked "freeze() +"
+# include building the snapshot, which is what a DirectedGraph caller pays; the other frozen rows reuse one snapshot.
+
+import argparse
+import os
+import time
+
+from benchmarks.generators import build_graph, random_spec
+import graph
+
+
+def best_time(operation, repeat: int) -> float:
+    """
+    Runs the operation repeat times and returns the fastest wall time in seconds.
+
+    :param operation:   Callable taking no arguments.
+    :param repeat:      Integer number of runs.
+
+    :return:            Float. Fastest run in seconds.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operation()
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare queue-based BFS with level-synchronous BFS.")
+    parser.add_argument("--size", type=int, default=200_000, help="number of vertices")
+    parser.add_argument("--degree", type=int, default=8, help="outbound edges per vertex")
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, os.cpu_count() or 1],
+                        help="process pool sizes to time")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    dynamic = build_graph(random_spec(args.size, args.degree, args.seed))
+    frozen = dynamic.freeze()
+    print(f"random graph: {args.size:,} vertices, {args.size * args.degree:,} edges, "
+          f"NumPy {'installed' if graph.np is not None else 'not installed'}, {os.cpu_count()} CPUs")
+
+    rows = [
+        ("DirectedGraph.breadth_first_search", lambda: dynamic.breadth_first_search("0")),
+        ("freeze()", dynamic.freeze),
+        ("freeze() + bfs_hop_distances workers=1", lambda: dynamic.freeze().bfs_hop_distances("0")),
+        ("FrozenDirectedGraph.breadth_first_search", lambda: frozen.breadth_first_search("0")),
+        ("bfs_hop_distances workers=1", lambda: frozen.bfs_hop_distances("0")),
+    ]
+    for workers in sorted(set(args.workers) - {1}):
+        rows.append((f"freeze() + bfs_hop_distances workers={workers}",
+                     lambda workers=workers: dynamic.freeze().bfs_hop_distances("0", workers)))
+        rows.append((f"bfs_hop_distances workers={workers}",
+                     lambda workers=workers: frozen.bfs_hop_distances("0", workers)))
+
+    baseline = None
+    for name, operation in rows:
+        elapsed = best_time(operation, args.repeat)
+        baseline = baseline or elapsed
+        print(f"{name:<42}{elapsed:>10.3f}s{baseline / elapsed:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
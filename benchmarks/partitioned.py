@@ -0,0 +1,78 @@
+# Benchmark measuring PartitionedDirectedGraph construction and traversal throughput as the shard count grows
+
+import argparse
+import os
+import random
+import time
+
+from benchmarks.generators import build_graph, random_spec
+from partitioned_graph import PartitionedDirectedGraph
+
+
+def run(spec: tuple, shards: int, sources: list) -> tuple:
+    """
+    Loads the graph into a PartitionedDirectedGraph, then runs a BFS and a min_path from each source.
+
+    :param spec:        Tuple of (vertices, edges) returned by a generator.
+    :param shards:      Integer number of shards.
+    :param sources:     List of source vertex identifiers.
+
+    :return:            Tuple of (edges loaded per second, BFS per second, min_path per second, fraction of edges
+                        crossing shards).
+    """
+    vertices, edges = spec
+    with PartitionedDirectedGraph(shards, weighted=True) as graph:
+        start = time.perf_counter()
+        graph.add_vertices(vertices)
+        graph.add_edges(edges)
+        load_rate = len(edges) / (time.perf_counter() - start)
+
+        stats = graph.shard_stats()
+        boundary = sum(shard["boundary_edges"] for shard in stats) / max(1, len(edges))
+
+        start = time.perf_counter()
+        for source_id in sources:
+            graph.breadth_first_search(source_id)
+        bfs_rate = len(sources) / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for source_id in sources:
+            graph.min_path(source_id)
+        min_path_rate = len(sources) / (time.perf_counter() - start)
+
+    return load_rate, bfs_rate, min_path_rate, boundary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure PartitionedDirectedGraph throughput per shard count.")
+    parser.add_argument("--size", type=int, default=100_000, help="number of vertices")
+    parser.add_argument("--degree", type=int, default=4, help="outbound edges per vertex")
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--searches", type=int, default=5, help="BFS and min_path runs per shard count")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    spec = random_spec(args.size, args.degree, args.seed)
+    rng = random.Random(args.seed)
+    sources = [str(rng.randrange(args.size)) for _ in range(args.searches)]
+
+    graph = build_graph(spec)
+    start = time.perf_counter()
+    for source_id in sources:
+        graph.breadth_first_search(source_id)
+    bfs_rate = len(sources) / (time.perf_counter() - start)
+    start = time.perf_counter()
+    for source_id in sources:
+        graph.min_path(source_id)
+    min_path_rate = len(sources) / (time.perf_counter() - start)
+
+    print(f"random graph: {args.size:,} vertices, {len(spec[1]):,} edges, {os.cpu_count()} CPUs")
+    print(f"{'shards':>6}{'edges loaded/s':>16}{'BFS/s':>10}{'min_path/s':>12}{'boundary':>10}")
+    print(f"{'local':>6}{'':>16}{bfs_rate:>10,.2f}{min_path_rate:>12,.2f}{'':>10}")
+    for shards in args.shards:
+        load_rate, bfs_rate, min_path_rate, boundary = run(spec, shards, sources)
+        print(f"{shards:>6}{load_rate:>16,.0f}{bfs_rate:>10,.2f}{min_path_rate:>12,.2f}{boundary:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
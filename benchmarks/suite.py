@@ -0,0 +1,111 @@
+# Benchmark suite timing DirectedGraph operations on synthetic graphs and comparing runs
+
+import gc
+import platform
+import sys
+import time
+import tracemalloc
+
+from benchmarks.generators import GENERATORS, build_graph
+
+
+def _best_time(operation, repeat: int) -> float:
+    """
+    Runs the operation repeat times with garbage collection disabled and returns the fastest wall time.
+
+    :param operation:   Callable taking no arguments.
+    :param repeat:      Integer number of runs.
+
+    :return:            Float. Fastest run in seconds.
+    """
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            operation()
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best
+
+
+def run_suite(generators: list, sizes: list, repeat: int = 3, seed: int = 0) -> dict:
+    """
+    Times construction, remove_vertex, depth_first_search, breadth_first_search and min_path on each generator and
+    size, and measures peak memory of construction with tracemalloc. Results are keyed "generator/size/operation".
+
+    :param generators:  List of generator names from GENERATORS.
+    :param sizes:       List of integer graph sizes.
+    :param repeat:      Integer number of runs per timing; the fastest is kept. Defaults to 3.
+    :param seed:        Integer random seed passed to the generators. Defaults to 0.
+
+    :return:            Dictionary with "meta" describing the run and "results" mapping keys to measurements.
+    """
+    results = {}
+    for name in generators:
+        for size in sizes:
+            spec = GENERATORS[name](size, seed=seed)
+            prefix = f"{name}/{size}"
+            source_id = spec[0][0][0]
+            target_id = spec[0][-1][0]
+
+            results[f"{prefix}/construction"] = _best_time(lambda: build_graph(spec), repeat)
+
+            tracemalloc.start()
+            graph = build_graph(spec)
+            results[f"{prefix}/peak_memory"] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            results[f"{prefix}/depth_first_search"] = _best_time(
+                lambda: graph.depth_first_search(source_id, target_id), repeat)
+            results[f"{prefix}/breadth_first_search"] = _best_time(
+                lambda: graph.breadth_first_search(source_id), repeat)
+            results[f"{prefix}/min_path"] = _best_time(lambda: graph.min_path(source_id), repeat)
+
+            # Remove every 100th vertex, from a fresh copy on each run
+            removed = [vertex_id for vertex_id, _ in spec[0][::100]]
+            copies = [build_graph(spec) for _ in range(repeat)]
+
+            def remove_vertices():
+                copy = copies.pop()
+                for vertex_id in removed:
+                    copy.remove_vertex(vertex_id)
+
+            results[f"{prefix}/remove_vertex"] = _best_time(remove_vertices, repeat)
+
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def compare_runs(baseline: dict, current: dict, threshold: float = 0.1) -> list:
+    """
+    Compares the measurements of two runs. A measurement regresses if the current value exceeds the baseline value
+    by more than the threshold fraction. Keys missing from either run are skipped.
+
+    :param baseline:    Dictionary returned by run_suite() for the reference run.
+    :param current:     Dictionary returned by run_suite() for the run being checked.
+    :param threshold:   Float. Allowed fractional slowdown or memory growth. Defaults to 0.1 (10%).
+
+    :return:            List of (key, baseline value, current value, ratio, regressed) tuples, sorted by key.
+    """
+    rows = []
+    base_results, current_results = baseline["results"], current["results"]
+    for key in sorted(base_results.keys() & current_results.keys()):
+        old, new = base_results[key], current_results[key]
+        ratio = new / old if old else float("inf")
+        rows.append((key, old, new, ratio, ratio > 1 + threshold))
+
+    return rows
@@ -0,0 +1,282 @@
+# Thread-safe wrapper for the Directed Graph Data Structure
+
+from contextlib import contextmanager
+import threading
+
+from graph import DirectedGraph, FrozenDirectedGraph
+
+
+class ReadWriteLock:
+    """
+    Lock allowing many concurrent readers or a single writer. Waiting writers block new readers, so a steady stream of
+    reads cannot starve writes.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    def acquire_read(self) -> None:
+        """
+        Blocks until no writer holds or is waiting for the lock, then registers a reader.
+
+        :param:         None.
+
+        :return:        None.
+        """
+        with self._condition:
+            while self._writer or self._writers_waiting:
+                self._condition.wait()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        """
+        Unregisters a reader, waking waiting writers if it was the last one.
+
+        :param:         None.
+
+        :return:        None.
+        """
+        with self._condition:
+            self._readers -= 1
+            if self._readers == 0:
+                self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        """
+        Blocks until no reader or writer holds the lock, then takes it exclusively.
+
+        :param:         None.
+
+        :return:        None.
+        """
+        with self._condition:
+            self._writers_waiting += 1
+            while self._writer or self._readers:
+                self._condition.wait()
+            self._writers_waiting -= 1
+            self._writer = True
+
+    def release_write(self) -> None:
+        """
+        Releases the exclusive lock and wakes all waiting readers and writers.
+
+        :param:         None.
+
+        :return:        None.
+        """
+        with self._condition:
+            self._writer = False
+            self._condition.notify_all()
+
+    @contextmanager
+    def read_locked(self):
+        """Context manager holding the lock for reading."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self):
+        """Context manager holding the lock for writing."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class ConcurrentDirectedGraph:
+    """
+    Thread-safe wrapper around DirectedGraph. Queries run under a shared read lock and mutations under an exclusive
+    write lock, so traversals never observe a graph changing underneath them. Each mutation increments the version;
+    snapshot() returns an immutable FrozenDirectedGraph of the current version, built once per version and shared, so
+    long traversals can run against a consistent view without holding any lock.
+
+    :param graph:           DirectedGraph to wrap. The wrapper takes ownership - do not mutate it directly afterwards.
+                            Optional value, if none supplied, wraps a new empty graph.
+    :param weighted:        Bool indicating if edges of a new graph are weighted. Ignored if graph supplied.
+    """
+
+    def __init__(self, graph: DirectedGraph = None, weighted: bool = False):
+        self._graph = DirectedGraph(weighted) if graph is None else graph
+        self._lock = ReadWriteLock()
+        self._version = 0
+        self._snapshot = None
+        self._snapshot_version = -1
+        self._snapshot_lock = threading.Lock()
+        # Cached is_reachable() lookups reorder and fill the cache, so readers using it take turns
+        self._reach_lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        """Integer incremented by every mutation."""
+        return self._version
+
+    def snapshot(self) -> FrozenDirectedGraph:
+        """
+        Returns an immutable snapshot of the current version of the graph. Snapshots are built lazily, at most once per
+        version, and remain valid (unchanged) after later mutations.
+
+        :param:                 None.
+
+        :return:                FrozenDirectedGraph of the current version.
+        """
+        with self._snapshot_lock:
+            with self._lock.read_locked():
+                if self._snapshot_version != self._version:
+                    self._snapshot = self._graph.freeze()
+                    self._snapshot_version = self._version
+                return self._snapshot
+
+    def _read(self, method, *args):
+        """
+        Calls the given DirectedGraph method under the read lock.
+
+        :param method:          Unbound DirectedGraph method.
+        :param args:            Arguments passed to the method.
+
+        :return:                Result of the method.
+        """
+        with self._lock.read_locked():
+            return method(self._graph, *args)
+
+    def _write(self, method, *args):
+        """
+        Calls the given DirectedGraph method under the write lock and increments the version.
+
+        :param method:          Unbound DirectedGraph method.
+        :param args:            Arguments passed to the method.
+
+        :return:                Result of the method.
+        """
+        with self._lock.write_locked():
+            try:
+                return method(self._graph, *args)
+            finally:
+                # Bump even if the method raised - add_edges may have inserted edges before raising
+                self._version += 1
+
+    def add_vertex(self, identifier: str, value: object) -> None:
+        """Thread-safe DirectedGraph.add_vertex()."""
+        self._write(DirectedGraph.add_vertex, identifier, value)
+
+    def remove_vertex(self, identifier: str) -> None:
+        """Thread-safe DirectedGraph.remove_vertex()."""
+        self._write(DirectedGraph.remove_vertex, identifier)
+
+    def add_edge(self, source_id: str, dest_id: str, weight: int = None) -> None:
+        """Thread-safe DirectedGraph.add_edge()."""
+        self._write(DirectedGraph.add_edge, source_id, dest_id, weight)
+
+    def remove_edge(self, source_id: str, dest_id: str) -> None:
+        """Thread-safe DirectedGraph.remove_edge()."""
+        self._write(DirectedGraph.remove_edge, source_id, dest_id)
+
+    def update_edge_weight(self, source_id: str, dest_id: str, weight: int) -> None:
+        """Thread-safe DirectedGraph.update_edge_weight()."""
+        self._write(DirectedGraph.update_edge_weight, source_id, dest_id, weight)
+
+    def add_vertices(self, vertices) -> int:
+        """Thread-safe DirectedGraph.add_vertices(). The iterable is consumed while the write lock is held."""
+        return self._write(DirectedGraph.add_vertices, vertices)
+
+    def add_edges(self, edges, on_missing: str = "raise") -> dict:
+        """Thread-safe DirectedGraph.add_edges(). The iterable is consumed while the write lock is held."""
+        return self._write(DirectedGraph.add_edges, edges, on_missing)
+
+    def is_reachable(self, source_id: str, target_id: str) -> bool:
+        """
+        Thread-safe DirectedGraph.is_reachable(). Runs under the read lock. With the reachability cache enabled,
+        lookups also hold a mutex guarding the cache, so they run one at a time but alongside other readers.
+        """
+        with self._lock.read_locked():
+            # The cache is only switched on or off under the write lock, so this check holds for the whole call
+            if self._graph._reach_cache is None:
+                return self._graph.is_reachable(source_id, target_id)
+            with self._reach_lock:
+                return self._graph.is_reachable(source_id, target_id)
+
+    def enable_reachability_cache(self, maxsize: int = 128) -> None:
+        """Thread-safe DirectedGraph.enable_reachability_cache(). Takes the write lock."""
+        with self._lock.write_locked():
+            self._graph.enable_reachability_cache(maxsize)
+
+    def disable_reachability_cache(self) -> None:
+        """Thread-safe DirectedGraph.disable_reachability_cache(). Takes the write lock."""
+        with self._lock.write_locked():
+            self._graph.disable_reachability_cache()
+
+    def reachability_cache_stats(self) -> dict:
+        """Thread-safe DirectedGraph.reachability_cache_stats()."""
+        with self._lock.read_locked(), self._reach_lock:
+            return self._graph.reachability_cache_stats()
+
+    def set_observer(self, observer) -> None:
+        """DirectedGraph.set_observer(). The observer is called from reader threads, so it must be thread-safe."""
+        with self._lock.write_locked():
+            self._graph.set_observer(observer)
+
+    def edge_exists(self, source_id: str, dest_id: str) -> bool:
+        """Thread-safe DirectedGraph.edge_exists()."""
+        return self._read(DirectedGraph.edge_exists, source_id, dest_id)
+
+    def vertex_exists(self, identifier: str) -> bool:
+        """Thread-safe DirectedGraph.vertex_exists()."""
+        return self._read(DirectedGraph.vertex_exists, identifier)
+
+    def get_adjacent_vertices(self, identifier: str) -> list | None:
+        """Thread-safe DirectedGraph.get_adjacent_vertices()."""
+        return self._read(DirectedGraph.get_adjacent_vertices, identifier)
+
+    def get_inbound_vertices(self, identifier: str) -> list | None:
+        """Thread-safe DirectedGraph.get_inbound_vertices()."""
+        return self._read(DirectedGraph.get_inbound_vertices, identifier)
+
+    def in_degree(self, identifier: str) -> int:
+        """Thread-safe DirectedGraph.in_degree()."""
+        return self._read(DirectedGraph.in_degree, identifier)
+
+    def out_degree(self, identifier: str) -> int:
+        """Thread-safe DirectedGraph.out_degree()."""
+        return self._read(DirectedGraph.out_degree, identifier)
+
+    def depth_first_search(self, source_id: str, target_id: str) -> bool:
+        """Thread-safe DirectedGraph.depth_first_search()."""
+        return self._read(DirectedGraph.depth_first_search, source_id, target_id)
+
+    def breadth_first_search(self, source_id: str, target_id: str = None) -> tuple | list:
+        """Thread-safe DirectedGraph.breadth_first_search()."""
+        return self._read(DirectedGraph.breadth_first_search, source_id, target_id)
+
+    def min_path(self, source_id: str, indexed: bool = False) -> tuple:
+        """Thread-safe DirectedGraph.min_path()."""
+        return self._read(DirectedGraph.min_path, source_id, indexed)
+
+    def multi_source_min_path(self, sources, max_distance: int = None, k: int = None) -> tuple:
+        """Thread-safe DirectedGraph.multi_source_min_path()."""
+        return self._read(DirectedGraph.multi_source_min_path, sources, max_distance, k)
+
+    def shortest_path(self, source_id: str, target_id: str, bidirectional: bool = False) -> tuple:
+        """Thread-safe DirectedGraph.shortest_path()."""
+        return self._read(DirectedGraph.shortest_path, source_id, target_id, bidirectional)
+
+    def astar(self, source_id: str, target_id: str, heuristic) -> tuple:
+        """Thread-safe DirectedGraph.astar()."""
+        return self._read(DirectedGraph.astar, source_id, target_id, heuristic)
+
+    def strongly_connected_components(self) -> list:
+        """Thread-safe DirectedGraph.strongly_connected_components()."""
+        return self._read(DirectedGraph.strongly_connected_components)
+
+    def topological_sort(self) -> list:
+        """Thread-safe DirectedGraph.topological_sort()."""
+        return self._read(DirectedGraph.topological_sort)
+
+    def has_cycle(self) -> bool:
+        """Thread-safe DirectedGraph.has_cycle()."""
+        return self._read(DirectedGraph.has_cycle)
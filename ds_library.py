@@ -1,5 +1,10 @@
 # Contains supporting data structures for directed graph project
 
+from collections import deque
+import heapq
+from itertools import count
+
+
 class Node:
     """Node used in Queue and Stack implementations."""
 
@@ -133,14 +138,142 @@ class Stack:
         return top_value
 
 
+class ArrayQueue:
+    """
+    Queue implemented with a deque (a ring of fixed-size blocks), so no Node is allocated per element. Same API and
+    exceptions as Queue.
+    """
+    __slots__ = ("_data",)
+
+    def __init__(self, values=()):
+        self._data = deque(values)
+
+    def is_empty(self) -> bool:
+        """
+        Returns True if Queue is empty, False otherwise.
+
+        :param:         None.
+        :return:        Boolean indicating if list is empty (True) or not (False).
+        """
+        return not self._data
+
+    def enqueue(self, value: object) -> None:
+        """
+        Adds the specified value to the end of the queue.
+
+        :param value:   Value to be added to the end of the queue.
+
+        :return:        None.
+        """
+        self._data.append(value)
+
+    def extend(self, values) -> None:
+        """
+        Adds each value in the given iterable to the end of the queue, in order.
+
+        :param values:  Iterable of values to be added to the end of the queue.
+
+        :return:        None.
+        """
+        self._data.extend(values)
+
+    def dequeue(self) -> object:
+        """
+        Removes the first item in the queue and returns its value.
+
+        :param:         None.
+
+        :return:        Value of the first item in the queue before dequeue call.
+        """
+        if not self._data:
+            raise QueueEmptyException
+
+        return self._data.popleft()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of items in the queue.
+
+        :return:        Integer. Number of items in the queue.
+        """
+        return len(self._data)
+
+
+class ArrayStack:
+    """
+    Stack implemented with a Python list, so no Node is allocated per element. Same API and exceptions as Stack.
+    """
+    __slots__ = ("_data",)
+
+    def __init__(self, values=()):
+        self._data = list(values)
+
+    def is_empty(self) -> bool:
+        """
+        Returns True if Stack is empty, False otherwise.
+
+        :param:         None.
+
+        :return:        Boolean indicating if Stack is empty (True) or not (False).
+        """
+        return not self._data
+
+    def push(self, value: object) -> None:
+        """
+        Adds a new element with specified value to the top of the stack.
+
+        :param value:   Value to be added to the top of the stack.
+
+        :return:        None.
+        """
+        self._data.append(value)
+
+    def push_many(self, values) -> None:
+        """
+        Pushes each value in the given iterable onto the stack, in order. The last value ends up on top.
+
+        :param values:  Iterable of values to be added to the top of the stack.
+
+        :return:        None.
+        """
+        self._data.extend(values)
+
+    extend = push_many
+
+    def pop(self) -> object:
+        """
+        Removes the element at the top of the stack and returns its value.
+
+        :param:         None.
+
+        :return:        Value at the top of the stack before pop call.
+        """
+        if not self._data:
+            raise StackEmptyException
+
+        return self._data.pop()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of items in the stack.
+
+        :return:        Integer. Number of items in the stack.
+        """
+        return len(self._data)
+
+
 class MinHeapEmptyException(Exception):
     """Exception indicating that MinHeap is empty. Raised when an attempt is made to remove from empty heap."""
 
 
 class MinHeap:
-    """MinHeap used for min_path (Dijkstra's Algorithm) method in directed map class."""
+    """
+    MinHeap used for min_path (Dijkstra's Algorithm) method in directed map class. Each priority is stored paired with
+    an insertion count, so equal priorities are removed in insertion order and values are never compared.
+    """
     def __init__(self):
         self._heap = []
+        self._counter = count()
 
     def add(self, priority: int, value: object) -> None:
         """
@@ -152,8 +285,8 @@ class MinHeap:
 
         :return:        None
         """
-        # Add the priority and value ('node') to end of storage array as tuple
-        node = (priority, value)
+        # Add the priority (made unique by the insertion count) and value ('node') to end of storage array as tuple
+        node = ((priority, next(self._counter)), value)
         self._heap.append(node)
 
         # Initialize variables to calculate and track index of node and parent
@@ -181,6 +314,20 @@ class MinHeap:
 
         return False
 
+    def get_min(self) -> tuple:
+        """
+        Returns the heap's top item without removing it. Raises exception if heap is empty.
+
+        :param:     None.
+
+        :return:    Tuple containing the priority and value of the top item of the heap.
+        """
+        if self.is_empty():
+            raise MinHeapEmptyException
+
+        key, value = self._heap[0]
+        return key[0], value
+
     def remove_min(self) -> tuple:
         """
         Removes and returns the heap's top item. Raises exception if heap is empty.
@@ -193,17 +340,18 @@ class MinHeap:
         if self.is_empty():
             raise MinHeapEmptyException
         elif len(self._heap) == 1:
-            return self._heap.pop()
+            key, value = self._heap.pop()
+            return key[0], value
 
-        # Store min value before replacing with last element added
-        min_val = self._heap[0][1]
+        # Store min item before replacing with last element added
+        key, value = self._heap[0]
         self._heap[0] = self._heap.pop()
 
         # If there is more than one element after last element removed, percolate replacement down
         if len(self._heap) > 1:
             self._percolate_down()
 
-        return min_val
+        return key[0], value
 
     def _percolate_down(self) -> None:
         """
@@ -242,6 +390,14 @@ class MinHeap:
             else:
                 return
 
+    def __len__(self) -> int:
+        """
+        Returns the number of items in the heap.
+
+        :return:    Integer. Number of items in the heap.
+        """
+        return len(self._heap)
+
     def print_heap(self) -> None:
         """
         Prints the MinHeap's underlying storage array. Used for testing.
@@ -253,11 +409,498 @@ class MinHeap:
         print([val for val in self._heap])
 
 
-class PriorityQueue:
-    """Priority Queue ADT used for directed graph's min_path. Utilizes MinHeap as underlying data structure."""
+class HeapKeyException(Exception):
+    """Exception indicating an invalid key operation on an IndexedMinHeap, such as adding a value already present."""
+
+
+class HeapConfigException(Exception):
+    """Exception indicating an invalid heap configuration, such as an unknown PriorityQueue backend."""
+
 
+class IndexedMinHeap:
+    """
+    MinHeap that tracks the position of each value, allowing values to be looked up and have their priority decreased
+    in place. Each value may be stored at most once, so the heap never holds stale duplicates.
+    """
     def __init__(self):
-        self._data = MinHeap()
+        self._heap = []
+        self._positions = {}
+
+    def add(self, priority: int, value: object) -> None:
+        """
+        Adds specified object to IndexedMinHeap with the given priority. Raises exception if value already in heap.
+
+        :param priority:    Integer representing the priority of the value being added. Smaller priority values are at
+                            the top of the heap.
+        :param value:       Hashable object representing the value being added.
+
+        :return:        None
+        """
+        if value in self._positions:
+            raise HeapKeyException("Error: Value is already in the heap.")
+
+        self._heap.append((priority, value))
+        self._positions[value] = len(self._heap) - 1
+        self._percolate_up(len(self._heap) - 1)
+
+    def contains(self, value: object) -> bool:
+        """
+        Returns True if value is in the heap, False otherwise.
+
+        :param value:   Value being checked for.
+
+        :return:        Boolean. True if value in heap, False otherwise.
+        """
+        return value in self._positions
+
+    def get_priority(self, value: object) -> int:
+        """
+        Returns the priority of the given value. Raises exception if value not in heap.
+
+        :param value:   Value whose priority is returned.
+
+        :return:        Priority of the value.
+        """
+        if value not in self._positions:
+            raise HeapKeyException("Error: Value is not in the heap.")
+
+        return self._heap[self._positions[value]][0]
+
+    def decrease_key(self, value: object, new_priority: int) -> None:
+        """
+        Lowers the priority of a value already in the heap. Raises exception if value not in heap or new priority is
+        greater than its current priority.
+
+        :param value:           Value whose priority is decreased.
+        :param new_priority:    Integer representing the value's new priority.
+
+        :return:                None.
+        """
+        if value not in self._positions:
+            raise HeapKeyException("Error: Value is not in the heap.")
+
+        node_ind = self._positions[value]
+        if new_priority > self._heap[node_ind][0]:
+            raise HeapKeyException("Error: New priority is greater than current priority.")
+
+        self._heap[node_ind] = (new_priority, value)
+        self._percolate_up(node_ind)
+
+    def is_empty(self) -> bool:
+        """
+        Returns True if heap is empty, otherwise returns False (if not empty).
+
+        :param:     None.
+
+        :return:    Boolean. True if empty, False if not empty.
+        """
+        return len(self._heap) < 1
+
+    def get_min(self) -> tuple:
+        """
+        Returns the heap's top item without removing it. Raises exception if heap is empty.
+
+        :param:     None.
+
+        :return:    Tuple containing the priority and value of the top item of the heap.
+        """
+        if self.is_empty():
+            raise MinHeapEmptyException
+
+        return self._heap[0]
+
+    def remove_min(self) -> tuple:
+        """
+        Removes and returns the heap's top item. Raises exception if heap is empty.
+
+        :param:     None.
+
+        :return:    Tuple containing the priority and value of the top item of the heap before method call.
+        """
+        if self.is_empty():
+            raise MinHeapEmptyException
+
+        min_val = self._heap[0]
+        del self._positions[min_val[1]]
+
+        # Move last element to the top and percolate it down if any elements remain
+        last = self._heap.pop()
+        if self._heap:
+            self._heap[0] = last
+            self._positions[last[1]] = 0
+            self._percolate_down(0)
+
+        return min_val
+
+    def _percolate_up(self, node_ind: int) -> None:
+        """
+        Moves the node at the given index up until its parent's priority is not greater, updating positions.
+
+        :param node_ind:    Integer index of the node being moved.
+
+        :return:            None.
+        """
+        heap, positions = self._heap, self._positions
+        node = heap[node_ind]
+
+        # Shift larger parents down into the hole, then place node at its final position
+        while node_ind > 0:
+            parent_ind = (node_ind - 1) // 2
+            parent = heap[parent_ind]
+            if node[0] >= parent[0]:
+                break
+            heap[node_ind] = parent
+            positions[parent[1]] = node_ind
+            node_ind = parent_ind
+
+        heap[node_ind] = node
+        positions[node[1]] = node_ind
+
+    def _percolate_down(self, node_ind: int) -> None:
+        """
+        Moves the node at the given index down until no child has a smaller priority, updating positions.
+
+        :param node_ind:    Integer index of the node being moved.
+
+        :return:            None.
+        """
+        heap, positions = self._heap, self._positions
+        node = heap[node_ind]
+        end_ind = len(heap) - 1
+
+        while True:
+            target = 2 * node_ind + 1
+            if target > end_ind:
+                break
+            # Use right child if it exists and is smaller than the left
+            if target < end_ind and heap[target + 1][0] < heap[target][0]:
+                target += 1
+            if heap[target][0] >= node[0]:
+                break
+            heap[node_ind] = heap[target]
+            positions[heap[node_ind][1]] = node_ind
+            node_ind = target
+
+        heap[node_ind] = node
+        positions[node[1]] = node_ind
+
+    def __len__(self) -> int:
+        """
+        Returns the number of items in the heap.
+
+        :return:    Integer. Number of items in the heap.
+        """
+        return len(self._heap)
+
+
+class HeapqMinHeap:
+    """
+    MinHeap backed by the C-accelerated heapq module. Items are stored as (priority, insertion count, value) tuples, so
+    equal priorities are removed in insertion order and values are never compared.
+    """
+    def __init__(self):
+        self._heap = []
+        self._counter = count()
+
+    def add(self, priority: int, value: object) -> None:
+        """
+        Adds specified object to the heap with the given priority.
+
+        :param priority:    Integer representing the priority of the value being added. Smaller priority values are at
+                            the top of the heap.
+        :param value:       Object representing the value being added.
+
+        :return:        None
+        """
+        heapq.heappush(self._heap, (priority, next(self._counter), value))
+
+    def is_empty(self) -> bool:
+        """
+        Returns True if heap is empty, otherwise returns False (if not empty).
+
+        :param:     None.
+
+        :return:    Boolean. True if empty, False if not empty.
+        """
+        return not self._heap
+
+    def get_min(self) -> tuple:
+        """
+        Returns the heap's top item without removing it. Raises exception if heap is empty.
+
+        :param:     None.
+
+        :return:    Tuple containing the priority and value of the top item of the heap.
+        """
+        if not self._heap:
+            raise MinHeapEmptyException
+
+        priority, _, value = self._heap[0]
+        return priority, value
+
+    def remove_min(self) -> tuple:
+        """
+        Removes and returns the heap's top item. Raises exception if heap is empty.
+
+        :param:     None.
+
+        :return:    Tuple containing the priority and value of the top item of the heap before method call.
+        """
+        if not self._heap:
+            raise MinHeapEmptyException
+
+        priority, _, value = heapq.heappop(self._heap)
+        return priority, value
+
+    def __len__(self) -> int:
+        """
+        Returns the number of items in the heap.
+
+        :return:    Integer. Number of items in the heap.
+        """
+        return len(self._heap)
+
+
+class DaryMinHeap:
+    """
+    MinHeap in which each node has d children. Wider nodes make the tree shallower, trading cheaper adds for more
+    comparisons per level on removal. Items are stored as (priority, insertion count, value) tuples, so equal
+    priorities are removed in insertion order and values are never compared.
+
+    :param d:       Integer number of children per node. Must be at least 2. Defaults to 4.
+    """
+    def __init__(self, d: int = 4):
+        if d < 2:
+            raise HeapConfigException("Error: A d-ary heap requires d of at least 2.")
+        self._d = d
+        self._heap = []
+        self._counter = count()
+
+    def add(self, priority: int, value: object) -> None:
+        """
+        Adds specified object to the heap with the given priority. Operation maintains heap property.
+
+        :param priority:    Integer representing the priority of the value being added. Smaller priority values are at
+                            the top of the heap.
+        :param value:       Object representing the value being added.
+
+        :return:        None
+        """
+        heap, d = self._heap, self._d
+        node = (priority, next(self._counter), value)
+        heap.append(node)
+        node_ind = len(heap) - 1
+
+        # Shift larger parents down into the hole, then place node at its final position
+        while node_ind > 0:
+            parent_ind = (node_ind - 1) // d
+            if not node < heap[parent_ind]:
+                break
+            heap[node_ind] = heap[parent_ind]
+            node_ind = parent_ind
+        heap[node_ind] = node
+
+    def is_empty(self) -> bool:
+        """
+        Returns True if heap is empty, otherwise returns False (if not empty).
+
+        :param:     None.
+
+        :return:    Boolean. True if empty, False if not empty.
+        """
+        return not self._heap
+
+    def get_min(self) -> tuple:
+        """
+        Returns the heap's top item without removing it. Raises exception if heap is empty.
+
+        :param:     None.
+
+        :return:    Tuple containing the priority and value of the top item of the heap.
+        """
+        if not self._heap:
+            raise MinHeapEmptyException
+
+        priority, _, value = self._heap[0]
+        return priority, value
+
+    def remove_min(self) -> tuple:
+        """
+        Removes and returns the heap's top item. Raises exception if heap is empty.
+
+        :param:     None.
+
+        :return:    Tuple containing the priority and value of the top item of the heap before method call.
+        """
+        heap, d = self._heap, self._d
+        if not heap:
+            raise MinHeapEmptyException
+
+        priority, _, value = heap[0]
+        node = heap.pop()
+        size = len(heap)
+
+        # Move last element into the hole at the top, shifting the smallest child up while it is smaller
+        if size:
+            node_ind = 0
+            while True:
+                first_child = d * node_ind + 1
+                if first_child >= size:
+                    break
+                # Find the smallest of the node's children
+                target = first_child
+                smallest = heap[first_child]
+                for child_ind in range(first_child + 1, min(first_child + d, size)):
+                    if heap[child_ind] < smallest:
+                        target = child_ind
+                        smallest = heap[child_ind]
+                if not smallest < node:
+                    break
+                heap[node_ind] = heap[target]
+                node_ind = target
+            heap[node_ind] = node
+
+        return priority, value
+
+    def __len__(self) -> int:
+        """
+        Returns the number of items in the heap.
+
+        :return:    Integer. Number of items in the heap.
+        """
+        return len(self._heap)
+
+
+class PairingHeap:
+    """
+    Pairing heap - a multiway tree with O(1) add and amortized O(log n) removal. Nodes are [item, children] lists.
+    Items are stored as (priority, insertion count, value) tuples, so equal priorities are removed in insertion order
+    and values are never compared.
+    """
+    def __init__(self):
+        self._root = None
+        self._size = 0
+        self._counter = count()
+
+    def add(self, priority: int, value: object) -> None:
+        """
+        Adds specified object to the heap with the given priority by merging a single-node tree into the root.
+
+        :param priority:    Integer representing the priority of the value being added. Smaller priority values are at
+                            the top of the heap.
+        :param value:       Object representing the value being added.
+
+        :return:        None
+        """
+        node = [(priority, next(self._counter), value), []]
+        self._root = node if self._root is None else self._merge(self._root, node)
+        self._size += 1
+
+    @staticmethod
+    def _merge(first: list, second: list) -> list:
+        """
+        Merges two trees by making the root with the larger item a child of the other root.
+
+        :param first:   Root node of the first tree.
+        :param second:  Root node of the second tree.
+
+        :return:        Root node of the merged tree.
+        """
+        if second[0] < first[0]:
+            first, second = second, first
+        first[1].append(second)
+
+        return first
+
+    def is_empty(self) -> bool:
+        """
+        Returns True if heap is empty, otherwise returns False (if not empty).
+
+        :param:     None.
+
+        :return:    Boolean. True if empty, False if not empty.
+        """
+        return self._root is None
+
+    def get_min(self) -> tuple:
+        """
+        Returns the heap's top item without removing it. Raises exception if heap is empty.
+
+        :param:     None.
+
+        :return:    Tuple containing the priority and value of the top item of the heap.
+        """
+        if self._root is None:
+            raise MinHeapEmptyException
+
+        priority, _, value = self._root[0]
+        return priority, value
+
+    def remove_min(self) -> tuple:
+        """
+        Removes and returns the heap's top item. Raises exception if heap is empty. The root's children are merged in
+        pairs left to right, then the pairs are merged right to left into the new root.
+
+        :param:     None.
+
+        :return:    Tuple containing the priority and value of the top item of the heap before method call.
+        """
+        if self._root is None:
+            raise MinHeapEmptyException
+
+        priority, _, value = self._root[0]
+        children = self._root[1]
+        merge = self._merge
+
+        pairs = [merge(children[ind], children[ind + 1]) for ind in range(0, len(children) - 1, 2)]
+        if len(children) % 2:
+            pairs.append(children[-1])
+
+        root = None
+        for node in reversed(pairs):
+            root = node if root is None else merge(node, root)
+
+        self._root = root
+        self._size -= 1
+        return priority, value
+
+    def __len__(self) -> int:
+        """
+        Returns the number of items in the heap.
+
+        :return:    Integer. Number of items in the heap.
+        """
+        return self._size
+
+
+class PriorityQueue:
+    """
+    Priority Queue ADT used for directed graph's min_path. The underlying heap is selected with backend:
+
+    "heapq"     HeapqMinHeap, the C-accelerated heapq module (default).
+    "dary"      DaryMinHeap with d children per node.
+    "pairing"   PairingHeap.
+    "binary"    The hand-written MinHeap. This was the only heap before backends were selectable - pass
+                backend="binary" to keep the previous behaviour.
+
+    Items with equal priority are dequeued in insertion order and values are never compared with each other.
+
+    :param backend:     String naming the heap backend. Defaults to "heapq", which replaced MinHeap as the default
+                        because it has the best combined push and pop throughput in benchmarks/heap_backends.py.
+    :param d:           Integer number of children per node for the "dary" backend. Defaults to 4.
+    """
+
+    def __init__(self, backend: str = "heapq", d: int = 4):
+        if backend == "heapq":
+            self._data = HeapqMinHeap()
+        elif backend == "dary":
+            self._data = DaryMinHeap(d)
+        elif backend == "pairing":
+            self._data = PairingHeap()
+        elif backend == "binary":
+            self._data = MinHeap()
+        else:
+            raise HeapConfigException("Error: backend must be one of 'heapq', 'dary', 'pairing' or 'binary'.")
 
     def enqueue(self, priority: int, value: object) -> None:
         """
@@ -281,6 +924,16 @@ class PriorityQueue:
         """
         return self._data.remove_min()
 
+    def peek(self) -> tuple:
+        """
+        Returns the priority and value of the first item in the PriorityQueue as a tuple without removing it.
+
+        :param:             None.
+
+        :return:            Tuple containing the priority and value of the first item in the PriorityQueue.
+        """
+        return self._data.get_min()
+
     def is_empty(self) -> bool:
         """
         Returns True if PriorityQueue is empty, otherwise returns False (if not empty).
@@ -290,3 +943,208 @@ class PriorityQueue:
         :return:    Boolean. True if empty, False if not empty.
         """
         return self._data.is_empty()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of items in the PriorityQueue.
+
+        :return:    Integer. Number of items in the PriorityQueue.
+        """
+        return len(self._data)
+
+
+class IndexedPriorityQueue:
+    """
+    Priority Queue ADT supporting decrease-key. Utilizes IndexedMinHeap as underlying data structure, so each value is
+    queued at most once and the queue never grows beyond the number of distinct values.
+    """
+
+    def __init__(self):
+        self._data = IndexedMinHeap()
+
+    def enqueue(self, priority: int, value: object) -> None:
+        """
+        Adds the specified value to the IndexedPriorityQueue with the given priority. Raises exception if value is
+        already queued.
+
+        :param priority:    Integer representing the priority of the added item. Smaller value = higher priority.
+        :param value:       The hashable value being stored in the IndexedPriorityQueue.
+
+        :return:            None.
+        """
+        self._data.add(priority, value)
+
+    def dequeue(self) -> tuple:
+        """
+        Removes the first item in the IndexedPriorityQueue and returns its value and priority as a tuple.
+
+        :param:             None.
+
+        :return:            Tuple containing the priority and value of the first item in the IndexedPriorityQueue.
+        """
+        return self._data.remove_min()
+
+    def peek(self) -> tuple:
+        """
+        Returns the priority and value of the first item in the IndexedPriorityQueue as a tuple without removing it.
+
+        :param:             None.
+
+        :return:            Tuple containing the priority and value of the first item in the IndexedPriorityQueue.
+        """
+        return self._data.get_min()
+
+    def contains(self, value: object) -> bool:
+        """
+        Returns True if value is queued, False otherwise.
+
+        :param value:       Value being checked for.
+
+        :return:            Boolean. True if value queued, False otherwise.
+        """
+        return self._data.contains(value)
+
+    def get_priority(self, value: object) -> int:
+        """
+        Returns the priority of a queued value. Raises exception if value is not queued.
+
+        :param value:       Value whose priority is returned.
+
+        :return:            Priority of the value.
+        """
+        return self._data.get_priority(value)
+
+    def decrease_key(self, value: object, new_priority: int) -> None:
+        """
+        Lowers the priority of a queued value. Raises exception if value is not queued or new priority is greater.
+
+        :param value:           Value whose priority is decreased.
+        :param new_priority:    Integer representing the value's new priority.
+
+        :return:                None.
+        """
+        self._data.decrease_key(value, new_priority)
+
+    def is_empty(self) -> bool:
+        """
+        Returns True if IndexedPriorityQueue is empty, otherwise returns False (if not empty).
+
+        :param:     None.
+
+        :return:    Boolean. True if empty, False if not empty.
+        """
+        return self._data.is_empty()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of items in the IndexedPriorityQueue.
+
+        :return:    Integer. Number of items queued.
+        """
+        return len(self._data)
+
+
+class CountingQueue:
+    """
+    Wraps a queue or stack from this module and counts the items added and removed and the largest length reached.
+    Used to instrument searches. Any other method of the wrapped container is forwarded to it unchanged.
+
+    :param container:   ArrayQueue, ArrayStack, PriorityQueue or IndexedPriorityQueue to wrap.
+    """
+    __slots__ = ("_container", "pushes", "pops", "peak_size")
+
+    def __init__(self, container):
+        self._container = container
+        self.pushes = 0
+        self.pops = 0
+        self.peak_size = 0
+
+    def __getattr__(self, name: str):
+        """
+        Forwards any attribute not defined by CountingQueue to the wrapped container.
+
+        :param name:        String naming the attribute.
+
+        :return:            The wrapped container's attribute.
+        """
+        return getattr(self._container, name)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of items in the wrapped container.
+
+        :return:            Integer. Number of items in the wrapped container.
+        """
+        return len(self._container)
+
+    def _added(self, amount: int) -> None:
+        """
+        Records items added to the wrapped container and updates the largest length reached.
+
+        :param amount:      Integer number of items added.
+
+        :return:            None.
+        """
+        self.pushes += amount
+        size = len(self._container)
+        if size > self.peak_size:
+            self.peak_size = size
+
+    def enqueue(self, *args) -> None:
+        """
+        Adds an item to the wrapped queue and counts it.
+
+        :param args:        Arguments of the wrapped container's enqueue(), e.g. a value, or a priority and a value.
+
+        :return:            None.
+        """
+        self._container.enqueue(*args)
+        self._added(1)
+
+    def push(self, value: object) -> None:
+        """
+        Pushes a value onto the wrapped stack and counts it.
+
+        :param value:       Object being pushed onto the stack.
+
+        :return:            None.
+        """
+        self._container.push(value)
+        self._added(1)
+
+    def push_many(self, values) -> None:
+        """
+        Pushes every value of an iterable onto the wrapped stack and counts them.
+
+        :param values:      Iterable of objects being pushed onto the stack.
+
+        :return:            None.
+        """
+        before = len(self._container)
+        self._container.push_many(values)
+        self._added(len(self._container) - before)
+
+    def dequeue(self):
+        """
+        Removes and returns the first item of the wrapped queue and counts it.
+
+        :param:             None.
+
+        :return:            The wrapped container's dequeue() result - the value, or a (priority, value) tuple for
+                            priority queues.
+        """
+        item = self._container.dequeue()
+        self.pops += 1
+        return item
+
+    def pop(self):
+        """
+        Removes and returns the top value of the wrapped stack and counts it.
+
+        :param:             None.
+
+        :return:            Object. Value at the top of the stack.
+        """
+        value = self._container.pop()
+        self.pops += 1
+        return value
@@ -2,7 +2,28 @@
 # Jacob Mosiman
 # Personal Project June 2024
 
-from ds_library import Stack, Queue, PriorityQueue
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import heapq
+from mmap import mmap as MemoryMap, ACCESS_READ
+import math
+from multiprocessing.shared_memory import SharedMemory
+import os
+import pickle
+import struct
+import sys
+import threading
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from ds_library import ArrayStack, ArrayQueue, CountingQueue, PriorityQueue, IndexedPriorityQueue
 
 
 class Vertex:
@@ -12,12 +33,17 @@ class Vertex:
     :param identifier:      Unique identifier for the vertex. Used to store in Graph vertices dictionary.
     :param value:           Value that the vertex will hold.
     :param adj_vert:        List containing identifiers of adjacent vertices. Default to None / empty list.
+    :param in_vert:         Dictionary containing identifiers of vertices with an edge into this vertex, mapped to the
+                            weight of that edge. Default to None / empty dictionary.
     """
+    # No per-instance __dict__ - saves about 40 bytes per vertex
+    __slots__ = ("id", "value", "adj_dict", "in_dict")
 
-    def __init__(self, identifier: str, value: object, adj_vert: dict = None):
+    def __init__(self, identifier: str, value: object, adj_vert: dict = None, in_vert: dict = None):
         self.id = identifier
         self.value = value
         self.adj_dict = {} if adj_vert is None else adj_vert
+        self.in_dict = {} if in_vert is None else in_vert
 
 
 class GraphException(Exception):
@@ -25,6 +51,21 @@ class GraphException(Exception):
         super().__init__(message)
 
 
+# Binary graph file layout: header followed by 8-byte aligned sections, each located by an (offset, length) pair
+_FILE_MAGIC = b"DGRF"
+_FILE_VERSION = 1
+_FILE_HEADER = struct.Struct("<4sHHqq12q")
+_FLAG_WEIGHTED = 1
+_FLAG_FLOAT_WEIGHTS = 2
+_FLAG_VALUES = 4
+
+# all_pairs_min_path tuning: largest graph given to Floyd-Warshall, smallest graph given to the process pool
+_FLOYD_WARSHALL_MAX_SIZE = 4096
+_PARALLEL_MIN_SIZE = 512
+# bfs_hop_distances tuning: smallest BFS frontier split across the process pool
+_PARALLEL_MIN_FRONTIER = 4096
+
+
 class DirectedGraph:
     """
     Directed Graph data structure. Can support weighted or unweighted edges.
@@ -36,6 +77,14 @@ class DirectedGraph:
         self._vertices = {}
         self._size = 0
         self._weighted = weighted
+        self._reach_cache = None
+        self._reach_maxsize = 0
+        self._reach_stats = {"hits": 0, "misses": 0, "patches": 0, "invalidations": 0}
+        self._observer = None
+        self._journal = None
+        self._subscribers = ()
+        self._recording = False
+        self._change_seq = 0
 
     def add_vertex(self, identifier: str, value: object) -> None:
         """
@@ -50,7 +99,7 @@ class DirectedGraph:
         # If identifier already exists in graph, replace value.
         if identifier in self._vertices:
             old_vert = self._vertices[identifier]
-            self._vertices[identifier] = Vertex(identifier, value, old_vert.adj_dict)
+            self._vertices[identifier] = Vertex(identifier, value, old_vert.adj_dict, old_vert.in_dict)
             return
 
         # Otherwise, add new vertex and increment size
@@ -59,7 +108,8 @@ class DirectedGraph:
 
     def remove_vertex(self, identifier: str) -> None:
         """
-        Removes the vertex with the given identifier and any inbound edges.
+        Removes the vertex with the given identifier and any inbound edges. Runs in O(in-degree + out-degree) using the
+        vertex's inbound edge index.
 
         :param identifier:      String representing the identifier of the vertex to be removed.
 
@@ -69,16 +119,25 @@ class DirectedGraph:
         if identifier not in self._vertices:
             raise GraphException("Error: There is no vertex in the graph with the provided identifier.")
 
-        # Remove any inbound edges
-        for vertex_id in self._vertices:
-            vertex = self._vertices[vertex_id]
-            if identifier in vertex.adj_dict:
-                del vertex.adj_dict[identifier]
+        vertex = self._vertices[identifier]
+
+        # Remove any inbound edges from the adjacency dictionaries of their source vertices
+        for source_id in vertex.in_dict:
+            del self._vertices[source_id].adj_dict[identifier]
+
+        # Remove outbound edges from the inbound indexes of their destination vertices
+        for dest_id in vertex.adj_dict:
+            del self._vertices[dest_id].in_dict[identifier]
 
         # Delete the vertex and decrement graph size
         del self._vertices[identifier]
         self._size -= 1
 
+        if self._reach_cache:
+            self._reach_invalidate(identifier)
+        if self._recording:
+            self._record("remove_vertex", identifier)
+
     def add_edge(self, source_id: str, dest_id: str, weight: int = None) -> None:
         """
         Creates a new edge between two vertices in the graph. If graph is weighted, weight must be supplied. If graph
@@ -104,8 +163,15 @@ class DirectedGraph:
             # If graph is weighted and no weight was supplied, raise exception
             if self._weighted and not weight:
                 raise GraphException("Error: Graph is weighted - all edges must be supplied with a weight.")
-            # Otherwise, add edge - ignore weight if graph not weighted
-            source_vert.adj_dict[dest_id] = weight if self._weighted else None
+            # Otherwise, add edge - ignore weight if graph not weighted. Record edge in destination's inbound index.
+            edge_weight = weight if self._weighted else None
+            source_vert.adj_dict[dest_id] = edge_weight
+            self._vertices[dest_id].in_dict[source_id] = edge_weight
+
+            if self._reach_cache:
+                self._reach_edge_added(source_id, dest_id)
+            if self._recording:
+                self._record("add_edge", source_id, dest_id, None, edge_weight)
 
     def remove_edge(self, source_id: str, dest_id: str) -> None:
         """
@@ -120,11 +186,144 @@ class DirectedGraph:
         if source_id in self._vertices:
             source_list = self._vertices[source_id].adj_dict
             if dest_id in source_list:
-                del source_list[dest_id]
+                weight = source_list.pop(dest_id)
+                del self._vertices[dest_id].in_dict[source_id]
+                if self._reach_cache:
+                    self._reach_invalidate(source_id)
+                if self._recording:
+                    self._record("remove_edge", source_id, dest_id, weight)
                 return
         # Otherwise, raise exception
         raise GraphException("Error: No edge exists between the source vertex and destination vertex.")
 
+    def update_edge_weight(self, source_id: str, dest_id: str, weight: int) -> None:
+        """
+        Changes the weight of an existing edge in place, without removing and re-adding it. Reachability is unchanged,
+        so the reachability cache is kept. If graph is unweighted or edge does not exist, raises exception.
+
+        :param source_id:       String representing the identifier of the vertex where the edge begins.
+        :param dest_id:         String representing the identifier of the vertex where the edge ends.
+        :param weight:          Integer representing the new weight of the edge.
+
+        :return:                None.
+        """
+        if not self._weighted:
+            raise GraphException("Error: update_edge_weight() requires a weighted graph. Current graph unweighted.")
+        elif source_id not in self._vertices or dest_id not in self._vertices[source_id].adj_dict:
+            raise GraphException("Error: No edge exists between the source vertex and destination vertex.")
+        elif not weight:
+            raise GraphException("Error: Graph is weighted - all edges must be supplied with a weight.")
+
+        adj_vert = self._vertices[source_id].adj_dict
+        old_weight = adj_vert[dest_id]
+        adj_vert[dest_id] = weight
+        self._vertices[dest_id].in_dict[source_id] = weight
+
+        if self._recording:
+            self._record("update_edge_weight", source_id, dest_id, old_weight, weight)
+
+    def add_vertices(self, vertices) -> int:
+        """
+        Adds each (identifier, value) pair in the given iterable to the graph in a single pass. Follows the rules of
+        add_vertex - existing vertices have their value replaced. Accepts generators.
+
+        :param vertices:        Iterable of (identifier, value) tuples.
+
+        :return:                Integer. Number of new vertices added to the graph.
+        """
+        vertices_dict = self._vertices
+        added = 0
+
+        for identifier, value in vertices:
+            if identifier in vertices_dict:
+                old_vert = vertices_dict[identifier]
+                vertices_dict[identifier] = Vertex(identifier, value, old_vert.adj_dict, old_vert.in_dict)
+            else:
+                vertices_dict[identifier] = Vertex(identifier, value)
+                added += 1
+
+        self._size += added
+        return added
+
+    def add_edges(self, edges, on_missing: str = "raise") -> dict:
+        """
+        Adds each edge in the given iterable to the graph in a single pass. Edges are (source_id, dest_id) tuples, or
+        (source_id, dest_id, weight) tuples for weighted graphs. Existing edges are counted as duplicates and left
+        unchanged. Accepts generators, so edges can be streamed without materializing a list. Raises exception on an
+        edge tuple with fewer than two items.
+
+        :param edges:           Iterable of edge tuples.
+        :param on_missing:      String determining how edges with a missing endpoint or weight are handled. "create"
+                                adds missing vertices with a value of None, "skip" rejects the edge, "raise" raises
+                                exception. A missing weight cannot be created, so it raises exception under "create"
+                                too. Edges inserted before the exception is raised are kept. Defaults to "raise".
+
+        :return:                Dictionary with counts of "inserted", "duplicate" and "rejected" edges.
+        """
+        if on_missing not in ("create", "skip", "raise"):
+            raise GraphException("Error: on_missing must be one of 'create', 'skip' or 'raise'.")
+
+        vertices = self._vertices
+        weighted = self._weighted
+        inserted = duplicate = rejected = 0
+
+        for edge in edges:
+            if len(edge) < 2:
+                raise GraphException("Error: Each edge must be a (source_id, dest_id[, weight]) tuple.")
+            source_id, dest_id = edge[0], edge[1]
+            weight = edge[2] if weighted and len(edge) > 2 else None
+
+            # Weighted graphs require a weight on every edge - only "skip" drops an edge without one
+            if weighted and not weight:
+                if on_missing != "skip":
+                    raise GraphException("Error: Graph is weighted - all edges must be supplied with a weight.")
+                rejected += 1
+                continue
+
+            # Handle missing endpoints according to on_missing
+            if source_id not in vertices or dest_id not in vertices:
+                if on_missing == "raise":
+                    end = "source" if source_id not in vertices else "destination"
+                    raise GraphException(f"Error: There is no vertex in the graph with the provided {end} identifier.")
+                elif on_missing == "skip":
+                    rejected += 1
+                    continue
+                for vertex_id in (source_id, dest_id):
+                    if vertex_id not in vertices:
+                        vertices[vertex_id] = Vertex(vertex_id, None)
+                        self._size += 1
+
+            adj_vert = vertices[source_id].adj_dict
+            if dest_id in adj_vert:
+                duplicate += 1
+                continue
+
+            adj_vert[dest_id] = weight
+            vertices[dest_id].in_dict[source_id] = weight
+            inserted += 1
+            if self._reach_cache:
+                self._reach_edge_added(source_id, dest_id)
+            if self._recording:
+                self._record("add_edge", source_id, dest_id, None, weight)
+
+        return {"inserted": inserted, "duplicate": duplicate, "rejected": rejected}
+
+    @classmethod
+    def from_edge_list(cls, edges, weighted: bool = False) -> "DirectedGraph":
+        """
+        Creates a new graph from an iterable of edge tuples, creating vertices (with a value of None) as they are
+        encountered. If graph is weighted, raises exception on an edge without a weight. See add_edges().
+
+        :param edges:           Iterable of (source_id, dest_id) or (source_id, dest_id, weight) tuples.
+        :param weighted:        Bool indicating if edges of graph are weighted. Defaults to False.
+
+        :return:                DirectedGraph containing the given edges.
+        """
+        graph = cls(weighted)
+        graph.add_edges(edges, on_missing="create")
+
+        return graph
+
     def edge_exists(self, source_id: str, dest_id: str) -> bool:
         """
         Returns True if the edge exists in the graph, False otherwise.
@@ -172,6 +371,210 @@ class DirectedGraph:
 
         return [key for key in adj_vertex]
 
+    def get_inbound_vertices(self, identifier: str) -> list | None:
+        """
+        Returns a list of identifiers of the vertices with an edge into the vertex assigned to the given identifier or
+        None if no inbound edges exist. If the vertex does not exist, raises exception.
+
+        :param identifier:      String representing the identifier of the vertex we are getting inbound vertices of.
+
+        :return:                List of inbound vertices, or None if no inbound vertices.
+        """
+        if identifier not in self._vertices:
+            raise GraphException("Error: There is no vertex in the graph with the provided identifier.")
+
+        in_vertex = self._vertices[identifier].in_dict
+        if len(in_vertex) == 0:
+            return
+
+        return [key for key in in_vertex]
+
+    def in_degree(self, identifier: str) -> int:
+        """
+        Returns the number of edges ending at the vertex assigned to the given identifier. If the vertex does not
+        exist, raises exception.
+
+        :param identifier:      String representing the identifier of the vertex.
+
+        :return:                Integer. Number of inbound edges.
+        """
+        if identifier not in self._vertices:
+            raise GraphException("Error: There is no vertex in the graph with the provided identifier.")
+
+        return len(self._vertices[identifier].in_dict)
+
+    def out_degree(self, identifier: str) -> int:
+        """
+        Returns the number of edges beginning at the vertex assigned to the given identifier. If the vertex does not
+        exist, raises exception.
+
+        :param identifier:      String representing the identifier of the vertex.
+
+        :return:                Integer. Number of outbound edges.
+        """
+        if identifier not in self._vertices:
+            raise GraphException("Error: There is no vertex in the graph with the provided identifier.")
+
+        return len(self._vertices[identifier].adj_dict)
+
+    def freeze(self) -> "FrozenDirectedGraph":
+        """
+        Returns an immutable, array-backed snapshot of the graph in compressed sparse row (CSR) form. The snapshot
+        supports the read-only traversal API and can be converted back to a mutable graph with thaw().
+
+        :param:                 None.
+
+        :return:                FrozenDirectedGraph holding the current vertices and edges.
+        """
+        # Intern identifiers to dense integer ids in insertion order
+        names = [vertex_id for vertex_id in self._vertices]
+        index = {name: ind for ind, name in enumerate(names)}
+        values = [self._vertices[name].value for name in names]
+
+        offsets = array("q", [0])
+        targets = array("q")
+        weight_list = []
+
+        # Build each row with its targets sorted so edge lookups can use binary search
+        for name in names:
+            adj_vert = self._vertices[name].adj_dict
+            row = sorted((index[dest_id], adj_vert[dest_id]) for dest_id in adj_vert)
+            for dest_ind, weight in row:
+                targets.append(dest_ind)
+                weight_list.append(weight)
+            offsets.append(len(targets))
+
+        # Store integer weights as int64, otherwise fall back to float64
+        weights, typecode = None, None
+        if self._weighted:
+            typecode = "q" if all(isinstance(weight, int) for weight in weight_list) else "d"
+            weights = array(typecode, weight_list)
+
+        return FrozenDirectedGraph(self._weighted, names, values, offsets, targets, weights, typecode)
+
+    def save(self, path: str, include_values: bool = True) -> None:
+        """
+        Writes the graph to the given path in the binary graph format. See FrozenDirectedGraph.save().
+
+        :param path:            String representing the path of the file to write.
+        :param include_values:  Bool indicating if vertex values are pickled into the file. Defaults to True.
+
+        :return:                None.
+        """
+        self.freeze().save(path, include_values)
+
+    @staticmethod
+    def load(path: str, mmap: bool = True) -> "FrozenDirectedGraph":
+        """
+        Reads a graph written by save(). Returns a FrozenDirectedGraph - call thaw() on it for a mutable graph. See
+        FrozenDirectedGraph.load().
+
+        :param path:            String representing the path of the file to read.
+        :param mmap:            Bool indicating if the edge arrays are memory-mapped rather than copied. Defaults to
+                                True.
+
+        :return:                FrozenDirectedGraph read from the file.
+        """
+        return FrozenDirectedGraph.load(path, mmap)
+
+    def enable_journal(self, maxlen: int = None) -> None:
+        """
+        Turns on the change journal, a log of every edge insertion, edge removal, edge weight change and vertex
+        removal as GraphChange records. Clears any existing journal.
+
+        :param maxlen:          Integer maximum number of changes kept; older changes are discarded first. Optional
+                                value, if none supplied, every change is kept.
+
+        :return:                None.
+        """
+        self._journal = deque(maxlen=maxlen)
+        self._recording = True
+
+    def disable_journal(self) -> None:
+        """
+        Turns off the change journal and discards its contents. Subscribers are still notified.
+
+        :param:                 None.
+
+        :return:                None.
+        """
+        self._journal = None
+        self._recording = bool(self._subscribers)
+
+    def journal(self, since: int = 0) -> list:
+        """
+        Returns the journaled changes with a sequence number greater than since, oldest first. Pass the sequence
+        number of the last change already processed to fetch only newer ones.
+
+        :param since:           Integer sequence number. Defaults to 0 (every kept change).
+
+        :return:                List of GraphChange records. Empty if the journal is off.
+        """
+        if self._journal is None:
+            return []
+
+        return [change for change in self._journal if change.sequence > since]
+
+    def subscribe(self, callback) -> None:
+        """
+        Registers a callable that is passed a GraphChange after each change the journal would record, whether or not
+        the journal is on. Callbacks run synchronously, after the change is applied, in subscription order.
+
+        :param callback:        Callable taking a GraphChange.
+
+        :return:                None.
+        """
+        self._subscribers = (*self._subscribers, callback)
+        self._recording = True
+
+    def unsubscribe(self, callback) -> None:
+        """
+        Removes a callable registered with subscribe(). If callback is not subscribed, raises exception.
+
+        :param callback:        Callable previously passed to subscribe().
+
+        :return:                None.
+        """
+        if callback not in self._subscribers:
+            raise GraphException("Error: Callback is not subscribed to the graph.")
+
+        subscribers = list(self._subscribers)
+        subscribers.remove(callback)
+        self._subscribers = tuple(subscribers)
+        self._recording = self._journal is not None or bool(self._subscribers)
+
+    def _record(self, kind: str, source_id: str, dest_id: str = None, old_weight=None, new_weight=None) -> None:
+        """
+        Appends a change to the journal and passes it to every subscriber.
+
+        :param kind:            String naming the change: "add_edge", "remove_edge", "update_edge_weight" or
+                                "remove_vertex".
+        :param source_id:       String identifier of the edge's source vertex, or of the removed vertex.
+        :param dest_id:         String identifier of the edge's destination vertex. None for a vertex removal.
+        :param old_weight:      Weight of the edge before the change, or None.
+        :param new_weight:      Weight of the edge after the change, or None.
+
+        :return:                None.
+        """
+        self._change_seq += 1
+        change = GraphChange(self._change_seq, kind, source_id, dest_id, old_weight, new_weight)
+        if self._journal is not None:
+            self._journal.append(change)
+        for callback in self._subscribers:
+            callback(change)
+
+    def set_observer(self, observer) -> None:
+        """
+        Installs a callable that is passed a CallStats after every depth_first_search(), breadth_first_search() and
+        min_path() call, e.g. a StatsCollector. Pass None to remove it. Without an observer the searches run
+        uninstrumented, so leaving it unset costs a single attribute check per call.
+
+        :param observer:        Callable taking a CallStats, or None.
+
+        :return:                None.
+        """
+        self._observer = observer
+
     def depth_first_search(self, source_id: str, target_id: str) -> bool:
         """
         Uses DFS to return True if target_id node is reachable from source_id node. False if unreachable.
@@ -186,9 +589,42 @@ class DirectedGraph:
         elif target_id not in self._vertices:
             raise GraphException("Error: There is no vertex in the graph with the provided target identifier.")
 
-        # Init empty set (visited vertices) and stack, then push source vertex to stack
-        visited_vert = set()
-        stack = Stack()
+        if self._observer is not None:
+            visited_vert = set()
+            stack = CountingQueue(ArrayStack())
+            start = time.perf_counter()
+            found = self._depth_first_search(source_id, target_id, visited_vert, stack, self._adjacency)
+            self._observer(CallStats("depth_first_search", source_id, len(visited_vert), stack.pushes - 1,
+                                     stack.pushes, stack.pops, stack.peak_size, time.perf_counter() - start))
+            return found
+
+        return self._depth_first_search(source_id, target_id, set(), ArrayStack(), self._adjacency)
+
+    def _adjacency(self, identifier: str) -> dict:
+        """
+        Adjacency accessor passed to the search loops, which GraphView replaces with its filtered version.
+
+        :param identifier:      String representing the identifier of the vertex.
+
+        :return:                Dictionary mapping each adjacent vertex identifier to the weight of the edge.
+        """
+        return self._vertices[identifier].adj_dict
+
+    @staticmethod
+    def _depth_first_search(source_id: str, target_id: str, visited_vert: set, stack, adjacent) -> bool:
+        """
+        Search loop of depth_first_search(). Takes the visited set and stack so an observed call can inspect them, and
+        the adjacency accessor so GraphView can run the same loop over its filtered edges.
+
+        :param source_id:       String representing the identifier of the vertex we are searching FROM.
+        :param target_id:       String representing the identifier of the vertex we are searching FOR.
+        :param visited_vert:    Empty set, filled with the visited vertices.
+        :param stack:           Empty ArrayStack, or a CountingQueue wrapping one.
+        :param adjacent:        Callable taking a vertex identifier and returning a dictionary of its adjacent vertex
+                                identifiers mapped to edge weights.
+
+        :return:                Boolean. True if target reachable from source, False otherwise.
+        """
         stack.push(source_id)
 
         # While stack is not empty, pop top vertex id
@@ -200,8 +636,7 @@ class DirectedGraph:
                 if vert_id == target_id:
                     return True
                 # Push each adjacent vertex to the stack
-                for vertex in self._vertices[vert_id].adj_dict:
-                    stack.push(vertex)
+                stack.push_many(adjacent(vert_id))
 
         # If target vertex not found, no path exists
         return False
@@ -224,61 +659,2205 @@ class DirectedGraph:
         elif target_id and target_id not in self._vertices:
             raise GraphException("Error: There is no vertex in the graph with the provided target identifier.")
 
-        # Init empty set (visited vertices) and queue, then enqueue source vertex
-        visited_vert = set()
-        q = Queue()
-        q.enqueue(source_id)
-        target_found = False        # Used if target_id supplied
+        observer = self._observer
+        if observer is not None:
+            q = CountingQueue(ArrayQueue())
+            start = time.perf_counter()
+        else:
+            q = ArrayQueue()
 
-        while not q.is_empty():
-            vert_id = q.dequeue()
-            # If target_id supplied and current vertex matches, flag target found as True
-            if target_id and vert_id == target_id:
+        # Vertices are yielded once each, in the order they are reached
+        reachable_vert = []
+        target_found = False        # Used if target_id supplied
+        for vert_id, _, _ in self._iter_bfs(source_id, None, q, self._adjacency):
+            reachable_vert.append(vert_id)
+            if vert_id == target_id:
                 target_found = True
-            # Add current vertex to set of visited vertices
-            visited_vert.add(vert_id)
-            # For each vertex adjacent to current vertex, add to queue if not yet visited
-            for vertex in self._vertices[vert_id].adj_dict:
-                if vertex not in visited_vert:
-                    q.enqueue(vertex)
 
-        # Create a list of the visited vertices
-        reachable_vert = [vert for vert in visited_vert]
+        if observer is not None:
+            vertices = self._vertices
+            observer(CallStats("breadth_first_search", source_id, len(reachable_vert),
+                               sum(len(vertices[vert_id].adj_dict) for vert_id in reachable_vert),
+                               q.pushes, q.pops, q.peak_size, time.perf_counter() - start))
+
         # If searching for a target, return tuple. Otherwise, return list.
         if target_id:
             return target_found, reachable_vert
         return reachable_vert
 
-    def min_path(self, source_id: str) -> tuple:
+    def iter_bfs(self, source_id: str, max_depth: int = None):
         """
-        Calculates the minimum distance from vertex of supplied source_id to all other reachable vertices in the graph.
-        Returns a dictionary containing a list of vertices from nearest to farthest, and a dictionary containing each
-        vertex and its associated distance.
+        Generator performing a BFS from the source vertex, lazily yielding (vertex_id, depth, parent) for each
+        reachable vertex as it is dequeued. Vertices are marked visited when enqueued, so each enters the queue once.
+        The source is yielded with a depth of 0 and a parent of None.
 
-        :param source_id:   String representing the identifier of the vertex we are searching from.
+        :param source_id:       String representing the identifier of the vertex we are searching FROM.
+        :param max_depth:       Integer. Vertices further than this many edges from the source are not visited.
+                                Optional value, if none supplied, all reachable vertices are visited.
 
-        :return:            Tuple containing a list of vertices ordered from the smallest distance to the largest, and a
-                            dictionary containing each vertex and its associated distance as key-value pairs.
+        :return:                Generator of (vertex_id, depth, parent) tuples.
         """
-        # If graph not weighted, raise exception
-        if not self._weighted:
-            raise GraphException("Error: min_path() requires a weighted graph. Current graph unweighted.")
-        elif source_id not in self._vertices:
-            raise GraphException("Error: There is no vertex in the graph with the provided identifier.")
+        if source_id not in self._vertices:
+            raise GraphException("Error: There is no vertex in the graph with the provided source identifier.")
 
-        # Init dictionary of visited vertices and priority queue of vertices to check. Add source vertex to priority q.
-        visited_vert = {}
-        p_queue = PriorityQueue()
-        p_queue.enqueue(0, source_id)
+        return self._iter_bfs(source_id, max_depth, ArrayQueue(), self._adjacency)
 
-        # While the priority queue is not empty, dequeue and assign vertex's distance and ID to variables
-        while not p_queue.is_empty():
-            distance, vertex = p_queue.dequeue()
-            # If vertex hasn't been visited, add to visited_vert and enqueue adjacent vertices
-            if vertex not in visited_vert:
-                visited_vert[vertex] = distance
-                adj_vert = self._vertices[vertex].adj_dict
-                for vert in adj_vert:
-                    # Set adjacent vertex's priority (distance) to dequeued vertex's distance + distance of adj edge
-                    vert_priority = distance + adj_vert[vert]
-                    p_queue.enqueue(vert_priority, vert)
+    @staticmethod
+    def _iter_bfs(source_id: str, max_depth: int, q, adjacent):
+        """
+        Generator body of iter_bfs(), also used by breadth_first_search() and GraphView. Kept separate so iter_bfs()
+        validates the source when called, not when first iterated.
+
+        :param source_id:       String representing the identifier of the vertex we are searching FROM.
+        :param max_depth:       Integer maximum depth, or None for no limit.
+        :param q:               Empty ArrayQueue, or a CountingQueue wrapping one.
+        :param adjacent:        Callable taking a vertex identifier and returning a dictionary of its adjacent vertex
+                                identifiers mapped to edge weights.
+
+        :return:                Generator of (vertex_id, depth, parent) tuples.
+        """
+        visited_vert = {source_id}
+        q.enqueue((source_id, 0, None))
+
+        while not q.is_empty():
+            vert_id, depth, parent = q.dequeue()
+            yield vert_id, depth, parent
+            # Do not expand vertices at the depth limit
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for vertex in adjacent(vert_id):
+                if vertex not in visited_vert:
+                    visited_vert.add(vertex)
+                    q.enqueue((vertex, depth + 1, vert_id))
+
+    def iter_dfs(self, source_id: str, order: str = "pre", max_depth: int = None):
+        """
+        Generator performing a DFS from the source vertex, lazily yielding (vertex_id, depth, parent) for each
+        reachable vertex. Adjacent vertices are explored in insertion order. With order "pre" a vertex is yielded when
+        first visited, with order "post" after all vertices reachable through it have been yielded. Iterative, so deep
+        graphs do not hit the recursion limit.
+
+        :param source_id:       String representing the identifier of the vertex we are searching FROM.
+        :param order:           String. "pre" or "post". Defaults to "pre".
+        :param max_depth:       Integer. Vertices further than this many edges along the DFS tree are not visited.
+                                Optional value, if none supplied, all reachable vertices are visited.
+
+        :return:                Generator of (vertex_id, depth, parent) tuples.
+        """
+        if source_id not in self._vertices:
+            raise GraphException("Error: There is no vertex in the graph with the provided source identifier.")
+        elif order not in ("pre", "post"):
+            raise GraphException("Error: order must be one of 'pre' or 'post'.")
+
+        if order == "pre":
+            return self._iter_dfs_pre(source_id, max_depth)
+        return self._iter_dfs_post(source_id, max_depth)
+
+    def _iter_dfs_pre(self, source_id: str, max_depth: int = None):
+        """
+        Generator body of iter_dfs() for pre-order.
+
+        :param source_id:       String representing the identifier of the vertex we are searching FROM.
+        :param max_depth:       Integer maximum depth, or None for no limit.
+
+        :return:                Generator of (vertex_id, depth, parent) tuples.
+        """
+        vertices = self._vertices
+        visited_vert = set()
+        stack = ArrayStack()
+        stack.push((source_id, 0, None))
+
+        while not stack.is_empty():
+            vert_id, depth, parent = stack.pop()
+            if vert_id in visited_vert:
+                continue
+            visited_vert.add(vert_id)
+            yield vert_id, depth, parent
+            if max_depth is not None and depth >= max_depth:
+                continue
+            # Push in reverse so the first adjacent vertex is popped first
+            stack.push_many((vertex, depth + 1, vert_id) for vertex in reversed(vertices[vert_id].adj_dict)
+                            if vertex not in visited_vert)
+
+    def _iter_dfs_post(self, source_id: str, max_depth: int = None):
+        """
+        Generator body of iter_dfs() for post-order. Each stack entry holds an iterator over the vertex's remaining
+        adjacent vertices, and the vertex is yielded once the iterator is exhausted.
+
+        :param source_id:       String representing the identifier of the vertex we are searching FROM.
+        :param max_depth:       Integer maximum depth, or None for no limit.
+
+        :return:                Generator of (vertex_id, depth, parent) tuples.
+        """
+        vertices = self._vertices
+        visited_vert = {source_id}
+        stack = ArrayStack()
+        stack.push((source_id, 0, None, iter(vertices[source_id].adj_dict)))
+
+        while not stack.is_empty():
+            vert_id, depth, parent, adj_iter = stack.pop()
+            # Descend into the next unvisited adjacent vertex, if any remain within the depth limit
+            if max_depth is None or depth < max_depth:
+                for vertex in adj_iter:
+                    if vertex not in visited_vert:
+                        visited_vert.add(vertex)
+                        stack.push((vert_id, depth, parent, adj_iter))
+                        stack.push((vertex, depth + 1, vert_id, iter(vertices[vertex].adj_dict)))
+                        break
+                else:
+                    yield vert_id, depth, parent
+            else:
+                yield vert_id, depth, parent
+
+    def strongly_connected_components(self) -> list:
+        """
+        Uses an iterative version of Tarjan's algorithm to find the strongly connected components of the graph in
+        O(V + E). Components are returned in reverse topological order - no component has an edge into a component
+        listed after it.
+
+        :param:                 None.
+
+        :return:                List of components, each a list of vertex identifiers.
+        """
+        vertices = self._vertices
+        index = {}
+        low_link = {}
+        on_stack = set()
+        stack = []
+        components = []
+        counter = 0
+
+        for root in vertices:
+            if root in index:
+                continue
+            index[root] = low_link[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            # Each work entry holds a vertex and an iterator over its unexplored adjacent vertices
+            work = [(root, iter(vertices[root].adj_dict))]
+
+            while work:
+                vert_id, adj_iter = work[-1]
+                for vertex in adj_iter:
+                    if vertex not in index:
+                        index[vertex] = low_link[vertex] = counter
+                        counter += 1
+                        stack.append(vertex)
+                        on_stack.add(vertex)
+                        work.append((vertex, iter(vertices[vertex].adj_dict)))
+                        break
+                    elif vertex in on_stack and index[vertex] < low_link[vert_id]:
+                        low_link[vert_id] = index[vertex]
+                else:
+                    # All adjacent vertices explored - pass low link to parent and emit component if vertex is a root
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        if low_link[vert_id] < low_link[parent]:
+                            low_link[parent] = low_link[vert_id]
+                    if low_link[vert_id] == index[vert_id]:
+                        component = []
+                        while True:
+                            vertex = stack.pop()
+                            on_stack.discard(vertex)
+                            component.append(vertex)
+                            if vertex == vert_id:
+                                break
+                        components.append(component)
+
+        return components
+
+    def topological_sort(self) -> list:
+        """
+        Uses Kahn's algorithm to return the vertex identifiers ordered so that every edge points from an earlier
+        vertex to a later one, in O(V + E). Raises exception if the graph contains a cycle.
+
+        :param:                 None.
+
+        :return:                List of vertex identifiers in topological order.
+        """
+        order = self._kahn_order()
+        if len(order) < self._size:
+            raise GraphException("Error: Graph contains a cycle - no topological order exists.")
+
+        return order
+
+    def has_cycle(self) -> bool:
+        """
+        Returns True if the graph contains a directed cycle (including a self-loop), False otherwise. O(V + E).
+
+        :param:                 None.
+
+        :return:                Boolean. True if graph has a cycle, False otherwise.
+        """
+        return len(self._kahn_order()) < self._size
+
+    def _kahn_order(self) -> list:
+        """
+        Kahn's algorithm used by topological_sort() and has_cycle(). Starts from the in-degree of each vertex and
+        repeatedly removes vertices with no remaining inbound edges. Vertices on or behind a cycle are never removed.
+
+        :param:                 None.
+
+        :return:                List of the vertex identifiers removed, in removal order.
+        """
+        vertices = self._vertices
+        remaining = {vert_id: len(vertices[vert_id].in_dict) for vert_id in vertices}
+        order = [vert_id for vert_id in remaining if remaining[vert_id] == 0]
+
+        # The order list doubles as the queue of vertices with no remaining inbound edges
+        for vert_id in order:
+            for vertex in vertices[vert_id].adj_dict:
+                remaining[vertex] -= 1
+                if remaining[vertex] == 0:
+                    order.append(vertex)
+
+        return order
+
+    def condensation(self) -> "DirectedGraph":
+        """
+        Returns a new DirectedGraph (a DAG) with one vertex per strongly connected component and an edge wherever an
+        edge joins two components. Component vertices are identified "0", "1", ... in topological order and hold the
+        list of member vertex identifiers as their value. In a weighted graph, each edge takes the smallest weight of
+        the edges it replaces.
+
+        :param:                 None.
+
+        :return:                DirectedGraph of the condensed components.
+        """
+        components = self.strongly_connected_components()
+        components.reverse()
+        component_of = {}
+        for comp_ind, component in enumerate(components):
+            for vert_id in component:
+                component_of[vert_id] = str(comp_ind)
+
+        # Keep the lightest edge between each pair of components
+        edges = {}
+        vertices = self._vertices
+        for vert_id in vertices:
+            source_comp = component_of[vert_id]
+            adj_vert = vertices[vert_id].adj_dict
+            for vertex in adj_vert:
+                dest_comp = component_of[vertex]
+                if source_comp == dest_comp:
+                    continue
+                key = (source_comp, dest_comp)
+                if key not in edges or (self._weighted and adj_vert[vertex] < edges[key]):
+                    edges[key] = adj_vert[vertex]
+
+        graph = DirectedGraph(self._weighted)
+        graph.add_vertices((str(comp_ind), component) for comp_ind, component in enumerate(components))
+        graph.add_edges((source_comp, dest_comp, edges[(source_comp, dest_comp)])
+                        for source_comp, dest_comp in edges)
+
+        return graph
+
+    def view(self, vertex_filter=None, edge_filter=None) -> "GraphView":
+        """
+        Returns a read-only GraphView restricted to the vertices and edges passing the given filters. Nothing is
+        copied - the filters are applied as the view is traversed, so the view follows later changes to this graph.
+
+        :param vertex_filter:   Callable taking a vertex identifier and returning True to keep the vertex, e.g. the
+                                __contains__ method of a set of identifiers. Optional value, if none supplied, every
+                                vertex is kept.
+        :param edge_filter:     Callable taking (source_id, dest_id, weight) and returning True to keep the edge.
+                                Optional value, if none supplied, every edge between kept vertices is kept.
+
+        :return:                GraphView of this graph.
+        """
+        return GraphView(self, vertex_filter, edge_filter)
+
+    def induced_subgraph(self, ids) -> "DirectedGraph":
+        """
+        Returns a new DirectedGraph holding the given vertices and every edge between them. Vertex values are shared
+        with this graph, not copied. If any identifier is not in the graph, raises exception.
+
+        :param ids:             Iterable of string identifiers of the vertices to keep.
+
+        :return:                DirectedGraph induced by the given vertices.
+        """
+        vertices = self._vertices
+        keep = dict.fromkeys(ids)
+        for vert_id in keep:
+            if vert_id not in vertices:
+                raise GraphException("Error: There is no vertex in the graph with the provided identifier.")
+
+        # Build each Vertex with its filtered outbound edges directly, rather than re-adding every edge
+        graph = DirectedGraph(self._weighted)
+        new_vertices = graph._vertices
+        for vert_id in keep:
+            vertex = vertices[vert_id]
+            adj_vert = vertex.adj_dict
+            new_vertices[vert_id] = Vertex(vert_id, vertex.value,
+                                           {dest_id: adj_vert[dest_id] for dest_id in adj_vert if dest_id in keep})
+
+        # Fill the inbound indexes from the copied outbound edges
+        for vert_id, vertex in new_vertices.items():
+            adj_vert = vertex.adj_dict
+            for dest_id in adj_vert:
+                new_vertices[dest_id].in_dict[vert_id] = adj_vert[dest_id]
+        graph._size = len(new_vertices)
+
+        return graph
+
+    def enable_reachability_cache(self, maxsize: int = 128) -> None:
+        """
+        Turns on an LRU cache of the set of vertices reachable from each recently queried source, used by
+        is_reachable(). Cached sets are patched when edges are added and dropped when a removed edge or vertex could
+        have shortened them. Clears any existing cache and counters.
+
+        :param maxsize:         Integer maximum number of sources with a cached reachable set. Defaults to 128.
+
+        :return:                None.
+        """
+        if maxsize < 1:
+            raise GraphException("Error: Reachability cache maxsize must be at least 1.")
+
+        self._reach_cache = OrderedDict()
+        self._reach_maxsize = maxsize
+        self._reach_stats = {"hits": 0, "misses": 0, "patches": 0, "invalidations": 0}
+
+    def disable_reachability_cache(self) -> None:
+        """
+        Turns off the reachability cache and discards its contents.
+
+        :param:                 None.
+
+        :return:                None.
+        """
+        self._reach_cache = None
+        self._reach_maxsize = 0
+
+    def reachability_cache_stats(self) -> dict:
+        """
+        Returns the reachability cache counters: "hits" and "misses" of is_reachable() lookups, "patches" of cached
+        sets extended after an edge was added, "invalidations" of cached sets dropped after a removal, and "size", the
+        number of cached sources.
+
+        :param:                 None.
+
+        :return:                Dictionary of counter names and values.
+        """
+        stats = dict(self._reach_stats)
+        stats["size"] = len(self._reach_cache) if self._reach_cache is not None else 0
+
+        return stats
+
+    def is_reachable(self, source_id: str, target_id: str) -> bool:
+        """
+        Returns True if target_id node is reachable from source_id node, False otherwise. If the reachability cache is
+        enabled, answers from the source's cached reachable set, computing it on a miss.
+
+        :param source_id:       String representing the identifier of the vertex we are searching FROM.
+        :param target_id:       String representing the identifier of the vertex we are searching FOR.
+
+        :return:                Boolean. True if target reachable from source, False otherwise.
+        """
+        cache = self._reach_cache
+        if cache is None:
+            return self.depth_first_search(source_id, target_id)
+
+        if target_id not in self._vertices:
+            raise GraphException("Error: There is no vertex in the graph with the provided target identifier.")
+
+        reachable = cache.get(source_id)
+        if reachable is not None:
+            self._reach_stats["hits"] += 1
+            cache.move_to_end(source_id)
+            return target_id in reachable
+
+        # Miss - compute the full reachable set, evicting the least recently used source if full
+        self._reach_stats["misses"] += 1
+        reachable = {vert_id for vert_id, _, _ in self.iter_bfs(source_id)}
+        cache[source_id] = reachable
+        if len(cache) > self._reach_maxsize:
+            cache.popitem(last=False)
+
+        return target_id in reachable
+
+    def _reach_edge_added(self, source_id: str, dest_id: str) -> None:
+        """
+        Extends each cached reachable set containing the new edge's source with everything newly reachable through
+        its destination. Sets that already contain the destination are unchanged.
+
+        :param source_id:       String representing the identifier of the vertex where the new edge begins.
+        :param dest_id:         String representing the identifier of the vertex where the new edge ends.
+
+        :return:                None.
+        """
+        vertices = self._vertices
+        for reachable in self._reach_cache.values():
+            if source_id not in reachable or dest_id in reachable:
+                continue
+            self._reach_stats["patches"] += 1
+            # Walk out from the destination, stopping at vertices the set already holds
+            reachable.add(dest_id)
+            stack = ArrayStack()
+            stack.push(dest_id)
+            while not stack.is_empty():
+                for vertex in vertices[stack.pop()].adj_dict:
+                    if vertex not in reachable:
+                        reachable.add(vertex)
+                        stack.push(vertex)
+
+    def _reach_invalidate(self, vertex_id: str) -> None:
+        """
+        Drops every cached reachable set containing the given vertex. Called when the vertex or one of its outbound
+        edges is removed, which can only shrink sets that reach it.
+
+        :param vertex_id:       String representing the identifier of the vertex removed or losing an outbound edge.
+
+        :return:                None.
+        """
+        cache = self._reach_cache
+        stale = [source_id for source_id in cache if vertex_id in cache[source_id]]
+        for source_id in stale:
+            del cache[source_id]
+        self._reach_stats["invalidations"] += len(stale)
+
+    def min_path(self, source_id: str, indexed: bool = False) -> tuple:
+        """
+        Calculates the minimum distance from vertex of supplied source_id to all other reachable vertices in the graph.
+        Returns a dictionary containing a list of vertices from nearest to farthest, and a dictionary containing each
+        vertex and its associated distance. If indexed is True, uses an IndexedPriorityQueue with decrease-key so the
+        queue holds at most one entry per vertex instead of one per relaxed edge.
+
+        :param source_id:   String representing the identifier of the vertex we are searching from.
+        :param indexed:     Bool indicating if the decrease-key priority queue is used. Defaults to False.
+
+        :return:            Tuple containing a list of vertices ordered from the smallest distance to the largest, and a
+                            dictionary containing each vertex and its associated distance as key-value pairs.
+        """
+        # If graph not weighted, raise exception
+        if not self._weighted:
+            raise GraphException("Error: min_path() requires a weighted graph. Current graph unweighted.")
+        elif source_id not in self._vertices:
+            raise GraphException("Error: There is no vertex in the graph with the provided identifier.")
+
+        observer = self._observer
+        if observer is not None:
+            p_queue = CountingQueue(IndexedPriorityQueue() if indexed else PriorityQueue())
+            start = time.perf_counter()
+            result = (self._indexed_min_path(source_id, p_queue) if indexed
+                      else self._min_path(source_id, p_queue, self._adjacency))
+            vertices = self._vertices
+            observer(CallStats("min_path", source_id, len(result[1]),
+                               sum(len(vertices[vert_id].adj_dict) for vert_id in result[1]),
+                               p_queue.pushes, p_queue.pops, p_queue.peak_size, time.perf_counter() - start))
+            return result
+
+        if indexed:
+            return self._indexed_min_path(source_id, IndexedPriorityQueue())
+        return self._min_path(source_id, PriorityQueue(), self._adjacency)
+
+    @staticmethod
+    def _min_path(source_id: str, p_queue, adjacent) -> tuple:
+        """
+        Dijkstra's Algorithm with lazy deletion used by min_path() and GraphView. A vertex is queued once per edge
+        relaxed into it.
+
+        :param source_id:   String representing the identifier of the vertex we are searching from.
+        :param p_queue:     Empty PriorityQueue, or a CountingQueue wrapping one.
+        :param adjacent:    Callable taking a vertex identifier and returning a dictionary of its adjacent vertex
+                            identifiers mapped to edge weights.
+
+        :return:            Tuple containing a list of vertices ordered from the smallest distance to the largest, and a
+                            dictionary containing each vertex and its associated distance as key-value pairs.
+        """
+        # Init dictionary of visited vertices and add source vertex to priority queue
+        visited_vert = {}
+        p_queue.enqueue(0, source_id)
+
+        # While the priority queue is not empty, dequeue and assign vertex's distance and ID to variables
+        while not p_queue.is_empty():
+            distance, vertex = p_queue.dequeue()
+            # If vertex hasn't been visited, add to visited_vert and enqueue adjacent vertices
+            if vertex not in visited_vert:
+                visited_vert[vertex] = distance
+                adj_vert = adjacent(vertex)
+                for vert in adj_vert:
+                    # Set adjacent vertex's priority (distance) to dequeued vertex's distance + distance of adj edge
+                    vert_priority = distance + adj_vert[vert]
+                    p_queue.enqueue(vert_priority, vert)
+
+        # Visited vertices are settled in order of increasing distance
+        return [vert for vert in visited_vert], visited_vert
+
+    def iter_min_path(self, source_id: str):
+        """
+        Generator running Dijkstra's Algorithm from the source vertex, lazily yielding (vertex_id, distance) for each
+        reachable vertex as it is settled, nearest first. Consuming it fully yields the same distances as min_path().
+
+        :param source_id:   String representing the identifier of the vertex we are searching from.
+
+        :return:            Generator of (vertex_id, distance) tuples.
+        """
+        if not self._weighted:
+            raise GraphException("Error: iter_min_path() requires a weighted graph. Current graph unweighted.")
+        elif source_id not in self._vertices:
+            raise GraphException("Error: There is no vertex in the graph with the provided identifier.")
+
+        return self._iter_min_path(source_id)
+
+    def _iter_min_path(self, source_id: str):
+        """
+        Generator body of iter_min_path().
+
+        :param source_id:   String representing the identifier of the vertex we are searching from.
+
+        :return:            Generator of (vertex_id, distance) tuples.
+        """
+        visited_vert = set()
+        p_queue = PriorityQueue()
+        p_queue.enqueue(0, source_id)
+
+        while not p_queue.is_empty():
+            distance, vertex = p_queue.dequeue()
+            if vertex in visited_vert:
+                continue
+            visited_vert.add(vertex)
+            yield vertex, distance
+            adj_vert = self._vertices[vertex].adj_dict
+            for vert in adj_vert:
+                if vert not in visited_vert:
+                    p_queue.enqueue(distance + adj_vert[vert], vert)
+
+    def _indexed_min_path(self, source_id: str, p_queue) -> tuple:
+        """
+        Dijkstra's Algorithm with decrease-key used by min_path(). Each vertex is queued at most once.
+
+        :param source_id:   String representing the identifier of the vertex we are searching from.
+        :param p_queue:     Empty IndexedPriorityQueue, or a CountingQueue wrapping one.
+
+        :return:            Tuple containing a list of vertices ordered from the smallest distance to the largest, and a
+                            dictionary containing each vertex and its associated distance as key-value pairs.
+        """
+        visited_vert = {}
+        p_queue.enqueue(0, source_id)
+
+        while not p_queue.is_empty():
+            distance, vertex = p_queue.dequeue()
+            visited_vert[vertex] = distance
+            adj_vert = self._vertices[vertex].adj_dict
+            for vert in adj_vert:
+                if vert in visited_vert:
+                    continue
+                vert_priority = distance + adj_vert[vert]
+                # Lower the queued vertex's priority if this edge is shorter, otherwise queue it for the first time
+                if p_queue.contains(vert):
+                    if vert_priority < p_queue.get_priority(vert):
+                        p_queue.decrease_key(vert, vert_priority)
+                else:
+                    p_queue.enqueue(vert_priority, vert)
+
+        return [vert for vert in visited_vert], visited_vert
+
+    def multi_source_min_path(self, sources, max_distance: int = None, k: int = None) -> tuple:
+        """
+        Runs one Dijkstra search seeded with every source at distance 0, giving each reachable vertex its distance to
+        the nearest source and which source that is. Replaces one min_path() call per source for nearest-facility
+        queries. A vertex equally near several sources is assigned the one listed first. The search stops early once
+        vertices farther than max_distance would be settled, or after k vertices (sources included) have been settled.
+
+        :param sources:         Iterable of string identifiers of the source vertices.
+        :param max_distance:    Integer. Vertices farther than this from every source are not settled. Optional value,
+                                if none supplied, there is no distance limit.
+        :param k:               Integer maximum number of vertices to settle. Optional value, if none supplied, there
+                                is no limit.
+
+        :return:                Tuple containing a list of the settled vertices ordered from the smallest distance to
+                                the largest, a dictionary mapping each settled vertex to its distance, and a dictionary
+                                mapping each settled vertex to the identifier of its nearest source.
+        """
+        if not self._weighted:
+            raise GraphException("Error: multi_source_min_path() requires a weighted graph. Current graph unweighted.")
+        elif max_distance is not None and max_distance < 0:
+            raise GraphException("Error: max_distance must not be negative.")
+        elif k is not None and k < 0:
+            raise GraphException("Error: k must not be negative.")
+
+        # Seed the queue with every source. A source listed twice keeps its first entry. Priorities are (distance,
+        # source rank) pairs, so equal distances are settled for the source listed first.
+        source_ids = []
+        labels = {}
+        p_queue = PriorityQueue()
+        for source_id in sources:
+            if source_id not in self._vertices:
+                raise GraphException("Error: There is no vertex in the graph with the provided source identifier.")
+            if source_id not in labels:
+                labels[source_id] = (0, len(source_ids))
+                p_queue.enqueue(labels[source_id], source_id)
+                source_ids.append(source_id)
+
+        settled_vert = {}
+        nearest = {}
+        limit = len(self._vertices) if k is None else k
+        while len(settled_vert) < limit and not p_queue.is_empty():
+            label, vertex = p_queue.dequeue()
+            if vertex in settled_vert:
+                continue
+            distance, source_rank = label
+            settled_vert[vertex] = distance
+            nearest[vertex] = source_ids[source_rank]
+            adj_vert = self._vertices[vertex].adj_dict
+            for vert in adj_vert:
+                vert_priority = distance + adj_vert[vert]
+                # Vertices beyond the cutoff are never queued, so the search ends when the queue runs dry
+                if max_distance is not None and vert_priority > max_distance:
+                    continue
+                vert_label = (vert_priority, source_rank)
+                if vert not in labels or vert_label < labels[vert]:
+                    labels[vert] = vert_label
+                    p_queue.enqueue(vert_label, vert)
+
+        return [vert for vert in settled_vert], settled_vert, nearest
+
+    def shortest_path(self, source_id: str, target_id: str, bidirectional: bool = False) -> tuple:
+        """
+        Calculates the minimum distance from the source vertex to the target vertex and the path that achieves it.
+        Stops as soon as the target is settled. If bidirectional is True, searches forward from the source and
+        backward from the target (along inbound edges) at the same time, which usually settles far fewer vertices on
+        large sparse graphs.
+
+        :param source_id:       String representing the identifier of the vertex we are searching FROM.
+        :param target_id:       String representing the identifier of the vertex we are searching FOR.
+        :param bidirectional:   Bool indicating if the bidirectional search is used. Defaults to False.
+
+        :return:                Tuple containing the distance and a list of the vertex identifiers along the path from
+                                source to target, or (None, None) if the target is unreachable.
+        """
+        if not self._weighted:
+            raise GraphException("Error: shortest_path() requires a weighted graph. Current graph unweighted.")
+        elif source_id not in self._vertices:
+            raise GraphException("Error: There is no vertex in the graph with the provided source identifier.")
+        elif target_id not in self._vertices:
+            raise GraphException("Error: There is no vertex in the graph with the provided target identifier.")
+
+        if bidirectional:
+            return self._bidirectional_shortest_path(source_id, target_id)
+        return self._shortest_path(source_id, target_id, self._adjacency)
+
+    @staticmethod
+    def _shortest_path(source_id: str, target_id: str, adjacent) -> tuple:
+        """
+        Early-exit Dijkstra used by shortest_path() and GraphView.
+
+        :param source_id:       String representing the identifier of the vertex we are searching FROM.
+        :param target_id:       String representing the identifier of the vertex we are searching FOR.
+        :param adjacent:        Callable taking a vertex identifier and returning a dictionary of its adjacent vertex
+                                identifiers mapped to edge weights.
+
+        :return:                Tuple containing the distance and a list of the vertex identifiers along the path from
+                                source to target, or (None, None) if the target is unreachable.
+        """
+        # Init best known distances, predecessors and settled set. Add source vertex to priority q.
+        distances = {source_id: 0}
+        predecessors = {source_id: None}
+        settled = set()
+        p_queue = PriorityQueue()
+        p_queue.enqueue(0, source_id)
+
+        while not p_queue.is_empty():
+            distance, vertex = p_queue.dequeue()
+            if vertex in settled:
+                continue
+            settled.add(vertex)
+            # Target settled - its distance is final
+            if vertex == target_id:
+                return distance, _trace_path(predecessors, target_id)
+            adj_vert = adjacent(vertex)
+            for vert in adj_vert:
+                vert_priority = distance + adj_vert[vert]
+                # Only enqueue vertices whose best known distance improved
+                if vert not in distances or vert_priority < distances[vert]:
+                    distances[vert] = vert_priority
+                    predecessors[vert] = vertex
+                    p_queue.enqueue(vert_priority, vert)
+
+        return None, None
+
+    def _bidirectional_shortest_path(self, source_id: str, target_id: str) -> tuple:
+        """
+        Bidirectional Dijkstra used by shortest_path(). Expands the search whose queue front is nearer, and stops once
+        the two queue fronts together are no shorter than the best path found through a vertex seen by both searches.
+
+        :param source_id:       String representing the identifier of the vertex we are searching FROM.
+        :param target_id:       String representing the identifier of the vertex we are searching FOR.
+
+        :return:                Tuple containing the distance and list of vertex identifiers along the path, or
+                                (None, None) if the target is unreachable.
+        """
+        if source_id == target_id:
+            return 0, [source_id]
+
+        # Index 0 holds the forward search state, index 1 the backward search state
+        distances = ({source_id: 0}, {target_id: 0})
+        predecessors = ({source_id: None}, {target_id: None})
+        settled = (set(), set())
+        queues = (PriorityQueue(), PriorityQueue())
+        queues[0].enqueue(0, source_id)
+        queues[1].enqueue(0, target_id)
+        best_distance = None
+        meeting_vert = None
+
+        while not queues[0].is_empty() and not queues[1].is_empty():
+            forward_min = queues[0].peek()[0]
+            backward_min = queues[1].peek()[0]
+            if best_distance is not None and forward_min + backward_min >= best_distance:
+                break
+
+            # Expand the side with the nearer queue front
+            side = 0 if forward_min <= backward_min else 1
+            distance, vertex = queues[side].dequeue()
+            if vertex in settled[side]:
+                continue
+            settled[side].add(vertex)
+
+            edges = self._vertices[vertex].adj_dict if side == 0 else self._vertices[vertex].in_dict
+            side_dist, other_dist = distances[side], distances[1 - side]
+            for vert in edges:
+                vert_priority = distance + edges[vert]
+                if vert not in side_dist or vert_priority < side_dist[vert]:
+                    side_dist[vert] = vert_priority
+                    predecessors[side][vert] = vertex
+                    queues[side].enqueue(vert_priority, vert)
+                # Vertex reached by both searches - record path through it if it is the best seen
+                if vert in other_dist:
+                    path_distance = side_dist[vert] + other_dist[vert]
+                    if best_distance is None or path_distance < best_distance:
+                        best_distance = path_distance
+                        meeting_vert = vert
+
+        if best_distance is None:
+            return None, None
+
+        # Forward half is traced back to the source, backward half is traced on to the target
+        path = _trace_path(predecessors[0], meeting_vert)
+        vertex = predecessors[1][meeting_vert]
+        while vertex is not None:
+            path.append(vertex)
+            vertex = predecessors[1][vertex]
+
+        return best_distance, path
+
+    def all_pairs_min_path(self, method: str = "auto", workers: int = None) -> tuple:
+        """
+        Calculates the minimum distance between every pair of vertices. See FrozenDirectedGraph.all_pairs_min_path().
+
+        :param method:          String selecting "floyd_warshall", "dijkstra" or "auto". Defaults to "auto".
+        :param workers:         Integer number of worker processes for "dijkstra". Defaults to the CPU count.
+
+        :return:                Tuple containing the list of vertex identifiers and the distance matrix.
+        """
+        return self.freeze().all_pairs_min_path(method, workers)
+
+    def astar(self, source_id: str, target_id: str, heuristic) -> tuple:
+        """
+        Uses A* search to calculate the minimum distance from the source vertex to the target vertex and the path that
+        achieves it. The heuristic is called with the value of a vertex and the value of the target vertex and must
+        never overestimate the remaining distance (be admissible), e.g. euclidean_heuristic for vertices holding (x, y)
+        coordinates. A heuristic that is admissible but not consistent still yields the shortest path: an expanded
+        vertex is expanded again if a shorter path to it is found later, at the cost of extra work.
+
+        :param source_id:       String representing the identifier of the vertex we are searching FROM.
+        :param target_id:       String representing the identifier of the vertex we are searching FOR.
+        :param heuristic:       Callable taking (vertex value, target value) and returning the estimated distance.
+
+        :return:                Tuple containing the distance and a list of the vertex identifiers along the path from
+                                source to target, or (None, None) if the target is unreachable.
+        """
+        distance, path, _ = self._astar_search(source_id, target_id, heuristic)
+
+        return distance, path
+
+    def _astar_search(self, source_id: str, target_id: str, heuristic) -> tuple:
+        """
+        A* search used by astar(). Also returns the number of distinct vertices expanded, used for benchmarking.
+
+        :param source_id:       String representing the identifier of the vertex we are searching FROM.
+        :param target_id:       String representing the identifier of the vertex we are searching FOR.
+        :param heuristic:       Callable taking (vertex value, target value) and returning the estimated distance.
+
+        :return:                Tuple containing the distance, path and number of expanded vertices.
+        """
+        if not self._weighted:
+            raise GraphException("Error: astar() requires a weighted graph. Current graph unweighted.")
+        elif source_id not in self._vertices:
+            raise GraphException("Error: There is no vertex in the graph with the provided source identifier.")
+        elif target_id not in self._vertices:
+            raise GraphException("Error: There is no vertex in the graph with the provided target identifier.")
+
+        vertices = self._vertices
+        target_value = vertices[target_id].value
+
+        # Queue priority is the distance so far plus the heuristic estimate of the distance remaining
+        distances = {source_id: 0}
+        predecessors = {source_id: None}
+        closed = {}
+        p_queue = PriorityQueue()
+        p_queue.enqueue(heuristic(vertices[source_id].value, target_value), source_id)
+
+        while not p_queue.is_empty():
+            _, vertex = p_queue.dequeue()
+            distance = distances[vertex]
+            # Skip stale entries - a closed vertex is only reopened once a shorter path to it has been found
+            if closed.get(vertex) == distance:
+                continue
+            closed[vertex] = distance
+            if vertex == target_id:
+                return distance, _trace_path(predecessors, target_id), len(closed)
+            adj_vert = vertices[vertex].adj_dict
+            for vert in adj_vert:
+                vert_distance = distance + adj_vert[vert]
+                if vert not in distances or vert_distance < distances[vert]:
+                    distances[vert] = vert_distance
+                    predecessors[vert] = vertex
+                    p_queue.enqueue(vert_distance + heuristic(vertices[vert].value, target_value), vert)
+
+        return None, None, len(closed)
+
+
+class FrozenDirectedGraph:
+    """
+    Immutable snapshot of a DirectedGraph stored in compressed sparse row (CSR) form. Vertex identifiers are interned
+    to dense integer ids; the outbound edges of vertex i are targets[offsets[i]:offsets[i+1]] with matching weights.
+    Created with DirectedGraph.freeze().
+
+    Each edge costs 8 bytes for its target (plus 8 bytes for its weight in a weighted graph) instead of a dictionary
+    entry in both endpoints' Vertex objects, and each vertex costs an offset plus its identifier table entry instead of
+    a Vertex object and two dictionaries. On a random weighted graph with five edges per vertex the snapshot is about
+    three times smaller than the dictionary representation (8.7 MB against 25.3 MB at 50,000 vertices, measured with
+    tracemalloc). Use memory_footprint() to measure the snapshot.
+
+    :param weighted:        Bool indicating if edges of graph are weighted.
+    :param names:           List of vertex identifiers indexed by interned integer id.
+    :param values:          List of vertex values indexed by interned integer id.
+    :param offsets:         Integer array of length V + 1 holding the start of each vertex's row in targets.
+    :param targets:         Integer array of length E holding the interned id of each edge's destination.
+    :param weights:         Array of length E holding each edge's weight, or None if graph is unweighted.
+    :param typecode:        Array typecode of the weights ("q" or "d"), or None if graph is unweighted.
+    """
+
+    def __init__(self, weighted: bool, names: list, values: list, offsets, targets, weights=None, typecode=None):
+        self._weighted = weighted
+        self._names = names
+        self._values = values
+        self._index = {name: ind for ind, name in enumerate(names)}
+        self._offsets = offsets
+        self._targets = targets
+        self._weights = weights
+        # Kept separately - memory-mapped weights are memoryviews, which have no typecode attribute
+        self._typecode = typecode
+        self._size = len(names)
+
+    def _vertex_index(self, identifier: str, message: str) -> int:
+        """
+        Returns the interned integer id of the given identifier. Raises exception with the given message if the vertex
+        does not exist.
+
+        :param identifier:      String representing the identifier of the vertex.
+        :param message:         Message of the exception raised if the vertex does not exist.
+
+        :return:                Integer id of the vertex.
+        """
+        if identifier not in self._index:
+            raise GraphException(message)
+
+        return self._index[identifier]
+
+    def thaw(self) -> DirectedGraph:
+        """
+        Returns a new mutable DirectedGraph containing the vertices and edges of the snapshot.
+
+        :param:                 None.
+
+        :return:                DirectedGraph equal to the graph that was frozen.
+        """
+        graph = DirectedGraph(self._weighted)
+        names, offsets, targets, weights = self._names, self._offsets, self._targets, self._weights
+
+        for ind in range(self._size):
+            graph.add_vertex(names[ind], self._values[ind])
+
+        # Insert edges directly into both endpoints - snapshot edges are known to be valid and unique
+        vertices = graph._vertices
+        for ind in range(self._size):
+            source_id = names[ind]
+            adj_vert = vertices[source_id].adj_dict
+            for pos in range(offsets[ind], offsets[ind + 1]):
+                dest_id = names[targets[pos]]
+                weight = weights[pos] if weights is not None else None
+                adj_vert[dest_id] = weight
+                vertices[dest_id].in_dict[source_id] = weight
+
+        return graph
+
+    def save(self, path: str, include_values: bool = True) -> None:
+        """
+        Writes the snapshot to the given path in the versioned binary graph format: a header, the vertex identifier
+        table, the CSR offset, target and weight arrays (little-endian, 8 bytes per entry) and an optional section of
+        pickled vertex values.
+
+        :param path:            String representing the path of the file to write.
+        :param include_values:  Bool indicating if vertex values are pickled into the file. Defaults to True.
+
+        :return:                None.
+        """
+        encoded = [name.encode("utf-8") for name in self._names]
+        name_offsets = array("q", [0])
+        for name in encoded:
+            name_offsets.append(name_offsets[-1] + len(name))
+
+        flags = 0
+        if self._weighted:
+            flags |= _FLAG_WEIGHTED
+            if self._typecode == "d":
+                flags |= _FLAG_FLOAT_WEIGHTS
+        if include_values:
+            flags |= _FLAG_VALUES
+
+        sections = [
+            _array_bytes(name_offsets, "q"),
+            b"".join(encoded),
+            _array_bytes(self._offsets, "q"),
+            _array_bytes(self._targets, "q"),
+            _array_bytes(self._weights, self._typecode) if self._weighted else b"",
+            pickle.dumps(list(self._values), pickle.HIGHEST_PROTOCOL) if include_values else b"",
+        ]
+
+        # Lay out each section on an 8-byte boundary after the header
+        locations = []
+        position = _FILE_HEADER.size
+        for section in sections:
+            position += -position % 8
+            locations.extend((position, len(section)))
+            position += len(section)
+
+        with open(path, "wb") as file:
+            file.write(_FILE_HEADER.pack(_FILE_MAGIC, _FILE_VERSION, flags, self._size, len(self._targets), *locations))
+            for ind, section in enumerate(sections):
+                file.write(b"\0" * (locations[2 * ind] - file.tell()))
+                file.write(section)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "FrozenDirectedGraph":
+        """
+        Reads a snapshot written by save(). If mmap is True, the offset, target and weight arrays are zero-copy views
+        over a read-only memory map of the file, so processes loading the same file share its pages. Vertex values
+        are unpickled - only load files from trusted sources.
+
+        :param path:            String representing the path of the file to read.
+        :param mmap:            Bool indicating if the edge arrays are memory-mapped rather than copied. Defaults to
+                                True.
+
+        :return:                FrozenDirectedGraph read from the file.
+        """
+        with open(path, "rb") as file:
+            if mmap:
+                data = memoryview(MemoryMap(file.fileno(), 0, access=ACCESS_READ))
+            else:
+                data = memoryview(file.read())
+
+        if len(data) < _FILE_HEADER.size:
+            raise GraphException("Error: File is not a graph file.")
+        magic, version, flags, size, edge_count, *locations = _FILE_HEADER.unpack_from(data)
+        if magic != _FILE_MAGIC:
+            raise GraphException("Error: File is not a graph file.")
+        elif version != _FILE_VERSION:
+            raise GraphException("Error: Unsupported graph file version.")
+
+        sections = [data[locations[ind]:locations[ind] + locations[ind + 1]] for ind in range(0, len(locations), 2)]
+        names_view = sections[1]
+        name_offsets = _bytes_array(sections[0], "q", False)
+        names = [str(names_view[name_offsets[ind]:name_offsets[ind + 1]], "utf-8") for ind in range(size)]
+
+        offsets = _bytes_array(sections[2], "q", mmap)
+        targets = _bytes_array(sections[3], "q", mmap)
+        weights, typecode = None, None
+        if flags & _FLAG_WEIGHTED:
+            typecode = "d" if flags & _FLAG_FLOAT_WEIGHTS else "q"
+            weights = _bytes_array(sections[4], typecode, mmap)
+        values = pickle.loads(sections[5]) if flags & _FLAG_VALUES else [None] * size
+
+        return cls(bool(flags & _FLAG_WEIGHTED), names, values, offsets, targets, weights, typecode)
+
+    def all_pairs_min_path(self, method: str = "auto", workers: int = None) -> tuple:
+        """
+        Calculates the minimum distance between every pair of vertices. Row i, column j of the returned matrix holds the
+        distance from vertex names[i] to vertex names[j], or infinity if unreachable. The matrix is a NumPy float64
+        array when NumPy is installed, otherwise a list of array("d") rows.
+
+        "floyd_warshall" runs a NumPy-vectorized Floyd-Warshall in O(V^3) time and O(V^2) memory, best for small or
+        dense graphs. "dijkstra" runs Dijkstra's Algorithm once per source, fanned out across a process pool that
+        receives the CSR arrays once per worker, best for large sparse graphs. "auto" picks Floyd-Warshall when NumPy
+        is installed and the graph is small or dense.
+
+        :param method:          String selecting "floyd_warshall", "dijkstra" or "auto". Defaults to "auto".
+        :param workers:         Integer number of worker processes for "dijkstra". Defaults to the CPU count.
+
+        :return:                Tuple containing the list of vertex identifiers (the matrix's index mapping) and the
+                                distance matrix.
+        """
+        if not self._weighted:
+            raise GraphException("Error: all_pairs_min_path() requires a weighted graph. Current graph unweighted.")
+        elif method not in ("auto", "floyd_warshall", "dijkstra"):
+            raise GraphException("Error: method must be one of 'auto', 'floyd_warshall' or 'dijkstra'.")
+        elif method == "floyd_warshall" and np is None:
+            raise GraphException("Error: Floyd-Warshall requires NumPy to be installed.")
+
+        if method == "auto":
+            size, edge_count = self._size, len(self._targets)
+            small_or_dense = size <= _FLOYD_WARSHALL_MAX_SIZE and (size <= 256 or edge_count * 8 >= size * size)
+            method = "floyd_warshall" if np is not None and small_or_dense else "dijkstra"
+
+        if method == "floyd_warshall":
+            return list(self._names), self._floyd_warshall()
+
+        return list(self._names), self._parallel_dijkstra(workers)
+
+    def _floyd_warshall(self):
+        """
+        NumPy-vectorized Floyd-Warshall used by all_pairs_min_path(). Each pass relaxes every pair through one
+        intermediate vertex with a single broadcast minimum.
+
+        :param:                 None.
+
+        :return:                NumPy float64 distance matrix.
+        """
+        size = self._size
+        offsets = np.asarray(self._offsets, dtype=np.int64)
+        targets = np.asarray(self._targets, dtype=np.int64)
+        weights = np.asarray(self._weights, dtype=np.float64)
+        sources = np.repeat(np.arange(size, dtype=np.int64), np.diff(offsets))
+
+        dist = np.full((size, size), np.inf)
+        np.minimum.at(dist, (sources, targets), weights)
+        np.fill_diagonal(dist, 0.0)
+
+        for mid in range(size):
+            np.minimum(dist, dist[:, mid, None] + dist[None, mid, :], out=dist)
+
+        return dist
+
+    def _parallel_dijkstra(self, workers: int = None):
+        """
+        Per-source Dijkstra used by all_pairs_min_path(). Rows are computed in a process pool unless a single worker
+        is requested or the graph is too small to be worth it.
+
+        :param workers:         Integer number of worker processes. Defaults to the CPU count.
+
+        :return:                Distance matrix as a NumPy array, or a list of array("d") rows without NumPy.
+        """
+        workers = workers or os.cpu_count() or 1
+        arrays = (array("q", self._offsets), array("q", self._targets), array(self._typecode, self._weights))
+
+        if workers == 1 or self._size < _PARALLEL_MIN_SIZE:
+            rows = [_csr_dijkstra(*arrays, source_ind) for source_ind in range(self._size)]
+        else:
+            chunk_size = max(1, self._size // (workers * 4))
+            with ProcessPoolExecutor(workers, initializer=_init_dijkstra_worker, initargs=arrays) as executor:
+                rows = list(executor.map(_dijkstra_worker_row, range(self._size), chunksize=chunk_size))
+
+        if np is not None:
+            return np.array(rows, dtype=np.float64).reshape(self._size, self._size)
+        return rows
+
+    def bfs_hop_distances(self, source_id: str, workers: int = 1) -> tuple:
+        """
+        Level-synchronous BFS returning the number of edges on the shortest path from the source to every vertex, or
+        -1 if unreachable. Each level's frontier is expanded in one step: with NumPy installed, as vectorized gathers
+        over the CSR arrays, otherwise in pure Python. The distances are a NumPy int64 array when NumPy is installed,
+        otherwise an array("q").
+
+        With more than one worker, the CSR arrays and the distances are copied into shared memory once and frontiers
+        of at least _PARALLEL_MIN_FRONTIER vertices are split across a process pool. Smaller frontiers, and graphs
+        smaller than _PARALLEL_MIN_SIZE, are expanded in this process.
+
+        :param source_id:       String representing the identifier of the vertex we are searching FROM.
+        :param workers:         Integer number of worker processes. None uses the CPU count. Defaults to 1 (no process
+                                pool).
+
+        :return:                Tuple containing the list of vertex identifiers and the hop distances indexed alike.
+        """
+        source_ind = self._vertex_index(
+            source_id, "Error: There is no vertex in the graph with the provided source identifier.")
+        workers = workers or os.cpu_count() or 1
+
+        if workers == 1 or self._size < _PARALLEL_MIN_SIZE:
+            if np is not None:
+                offsets = np.asarray(self._offsets, dtype=np.int64)
+                targets = np.asarray(self._targets, dtype=np.int64)
+                dist = np.full(self._size, -1, dtype=np.int64)
+            else:
+                offsets, targets, dist = self._offsets, self._targets, array("q", [-1]) * self._size
+            _level_bfs(dist, source_ind, partial(_expand_frontier, offsets, targets, dist))
+            return list(self._names), dist
+
+        return list(self._names), self._pooled_bfs(source_ind, workers)
+
+    def _pooled_bfs(self, source_ind: int, workers: int):
+        """
+        Process pool BFS used by bfs_hop_distances(). Workers attach to the shared CSR arrays and distances, expand
+        their share of each large frontier, mark the unvisited vertices they reach and return them. Workers only ever
+        write the current level into the distances, so a vertex reached by two workers gets the same distance either
+        way, and merging their results removes the duplicate.
+
+        :param source_ind:      Integer id of the source vertex.
+        :param workers:         Integer number of worker processes.
+
+        :return:                Hop distances as a NumPy int64 array, or an array("q") without NumPy.
+        """
+        segments = []
+        try:
+            offsets = _shared_array(segments, self._offsets, len(self._offsets))
+            targets = _shared_array(segments, self._targets, len(self._targets))
+            dist = _shared_array(segments, None, self._size)
+            names = [(segment.name, length) for segment, length in segments]
+
+            with ProcessPoolExecutor(workers, initializer=_init_bfs_worker, initargs=(names,)) as executor:
+                def expand(frontier, level):
+                    if len(frontier) < _PARALLEL_MIN_FRONTIER:
+                        return _expand_frontier(offsets, targets, dist, frontier, level)
+                    shares = np.array_split(frontier, workers) if np is not None else [
+                        frontier[ind::workers] for ind in range(workers)]
+                    parts = list(executor.map(_bfs_worker_expand, shares, [level] * workers))
+                    if np is not None:
+                        return np.unique(np.concatenate(parts))
+                    return list(set().union(*parts))
+
+                _level_bfs(dist, source_ind, expand)
+
+            result = dist.copy() if np is not None else array("q", dist)
+        finally:
+            # Views of the segments must be released before the segments can be closed
+            offsets = targets = dist = expand = None
+            for segment, _ in segments:
+                segment.close()
+                segment.unlink()
+
+        return result
+
+    def memory_footprint(self) -> int:
+        """
+        Returns the approximate number of bytes held by the snapshot's arrays, identifier table and index.
+
+        :param:                 None.
+
+        :return:                Integer number of bytes.
+        """
+        total = sys.getsizeof(self._names) + sys.getsizeof(self._values) + sys.getsizeof(self._index)
+        total += sum(sys.getsizeof(name) for name in self._names)
+        total += sys.getsizeof(self._offsets) + sys.getsizeof(self._targets)
+        if self._weights is not None:
+            total += sys.getsizeof(self._weights)
+
+        return total
+
+    def vertex_exists(self, identifier: str) -> bool:
+        """
+        Returns True if the vertex exists in the graph, False otherwise.
+
+        :param identifier:      String representing the identifier of the vertex we are checking for.
+        :return:                Boolean. True of vertex with given identifier exists, False otherwise.
+        """
+        return identifier in self._index
+
+    def edge_exists(self, source_id: str, dest_id: str) -> bool:
+        """
+        Returns True if the edge exists in the graph, False otherwise. Uses binary search over the source's row.
+
+        :param source_id:       String representing the identifier of the vertex where the edge begins.
+        :param dest_id:         String representing the identifier of the vertex where the edge ends.
+
+        :return:                Boolean. True if edge exists, False otherwise.
+        """
+        if source_id not in self._index or dest_id not in self._index:
+            return False
+
+        source_ind = self._index[source_id]
+        dest_ind = self._index[dest_id]
+        end = self._offsets[source_ind + 1]
+        pos = bisect_left(self._targets, dest_ind, self._offsets[source_ind], end)
+
+        return pos < end and self._targets[pos] == dest_ind
+
+    def get_adjacent_vertices(self, identifier: str) -> list | None:
+        """
+        Returns a list of identifiers of the adjacent vertices for the vertex assigned to the given identifier or None
+        if no adjacent vertices exist. If the vertex does not exist, raises exception.
+
+        :param identifier:      String representing the identifier of the vertex we are getting adjacent vertices of.
+
+        :return:                List of adjacent vertices, or None if no adjacent vertices.
+        """
+        ind = self._vertex_index(identifier, "Error: There is no vertex in the graph with the provided identifier.")
+
+        start, end = self._offsets[ind], self._offsets[ind + 1]
+        if start == end:
+            return
+
+        return [self._names[dest_ind] for dest_ind in self._targets[start:end]]
+
+    def depth_first_search(self, source_id: str, target_id: str) -> bool:
+        """
+        Uses DFS to return True if target_id node is reachable from source_id node. False if unreachable.
+
+        :param source_id:       String representing the identifier of the vertex we are searching FROM.
+        :param target_id:       String representing the identifier of the vertex we are searching FOR.
+
+        :return:                Boolean. True if target reachable from source, False otherwise.
+        """
+        source_ind = self._vertex_index(
+            source_id, "Error: There is no vertex in the graph with the provided source identifier.")
+        target_ind = self._vertex_index(
+            target_id, "Error: There is no vertex in the graph with the provided target identifier.")
+
+        offsets, targets = self._offsets, self._targets
+        visited_vert = bytearray(self._size)
+        stack = [source_ind]
+
+        while stack:
+            vert_ind = stack.pop()
+            if not visited_vert[vert_ind]:
+                visited_vert[vert_ind] = 1
+                if vert_ind == target_ind:
+                    return True
+                stack.extend(targets[offsets[vert_ind]:offsets[vert_ind + 1]])
+
+        return False
+
+    def breadth_first_search(self, source_id: str, target_id: str = None) -> tuple | list:
+        """
+        Uses BFS to return a list of the vertices reachable from the source vertex. If a target_id is specified, will
+        return a tuple containing a Boolean indicating if target is reachable and the list of all vertices reachable
+        from the source vertex.
+
+        :param source_id:       String representing the identifier of the vertex we are searching FROM.
+        :param target_id:       String representing the identifier of the vertex we are searching FOR. Optional value,
+                                if none supplied, will exclusively return list of all vertices reachable.
+
+        :return:                If target_id supplied, will return tuple of (Boolean indicating target reachable, list
+                                of reachable vertices). Otherwise, will exclusively return list of reachable vertices.
+        """
+        source_ind = self._vertex_index(
+            source_id, "Error: There is no vertex in the graph with the provided source identifier.")
+        if target_id:
+            self._vertex_index(target_id, "Error: There is no vertex in the graph with the provided target identifier.")
+
+        offsets, targets = self._offsets, self._targets
+        visited_vert = bytearray(self._size)
+        visited_vert[source_ind] = 1
+        order = [source_ind]
+
+        # The visit order list doubles as the queue - head walks forward as vertices are expanded
+        head = 0
+        while head < len(order):
+            vert_ind = order[head]
+            head += 1
+            for dest_ind in targets[offsets[vert_ind]:offsets[vert_ind + 1]]:
+                if not visited_vert[dest_ind]:
+                    visited_vert[dest_ind] = 1
+                    order.append(dest_ind)
+
+        reachable_vert = [self._names[ind] for ind in order]
+        if target_id:
+            return visited_vert[self._index[target_id]] == 1, reachable_vert
+        return reachable_vert
+
+    def min_path(self, source_id: str) -> tuple:
+        """
+        Calculates the minimum distance from vertex of supplied source_id to all other reachable vertices in the graph.
+        Returns a list of vertices from nearest to farthest, and a dictionary containing each vertex and its
+        associated distance.
+
+        :param source_id:   String representing the identifier of the vertex we are searching from.
+
+        :return:            Tuple containing a list of vertices ordered from the smallest distance to the largest, and a
+                            dictionary containing each vertex and its associated distance as key-value pairs.
+        """
+        if not self._weighted:
+            raise GraphException("Error: min_path() requires a weighted graph. Current graph unweighted.")
+        source_ind = self._vertex_index(
+            source_id, "Error: There is no vertex in the graph with the provided identifier.")
+
+        offsets, targets, weights = self._offsets, self._targets, self._weights
+        visited_vert = {}
+        p_queue = PriorityQueue()
+        p_queue.enqueue(0, source_ind)
+
+        while not p_queue.is_empty():
+            distance, vert_ind = p_queue.dequeue()
+            if vert_ind not in visited_vert:
+                visited_vert[vert_ind] = distance
+                for pos in range(offsets[vert_ind], offsets[vert_ind + 1]):
+                    dest_ind = targets[pos]
+                    if dest_ind not in visited_vert:
+                        p_queue.enqueue(distance + weights[pos], dest_ind)
+
+        names = self._names
+        return [names[ind] for ind in visited_vert], {names[ind]: visited_vert[ind] for ind in visited_vert}
+
+
+class GraphView:
+    """
+    Read-only view of a DirectedGraph restricted to the vertices and edges passing the given filters, exposing the
+    graph's query and traversal API. Created with DirectedGraph.view(). The filters are called lazily, every time a
+    vertex or edge is examined, so they should be cheap and must not change the graph. An edge is only in the view if
+    both of its endpoints are. Use materialize() to copy the view into a standalone DirectedGraph.
+
+    :param graph:           DirectedGraph being viewed.
+    :param vertex_filter:   Callable taking a vertex identifier and returning True to keep the vertex, or None.
+    :param edge_filter:     Callable taking (source_id, dest_id, weight) and returning True to keep the edge, or None.
+    """
+
+    def __init__(self, graph: DirectedGraph, vertex_filter=None, edge_filter=None):
+        self._graph = graph
+        self._vertex_filter = vertex_filter
+        self._edge_filter = edge_filter
+
+    def _check_vertex(self, identifier: str, message: str) -> None:
+        """
+        Raises exception with the given message if the vertex is not in the view.
+
+        :param identifier:      String representing the identifier of the vertex.
+        :param message:         Message of the exception raised if the vertex is not in the view.
+
+        :return:                None.
+        """
+        if not self.vertex_exists(identifier):
+            raise GraphException(message)
+
+    def _adjacent(self, identifier: str):
+        """
+        Generator yielding (dest_id, weight) for each outbound edge of a vertex in the view that is also in the view.
+
+        :param identifier:      String representing the identifier of the vertex.
+
+        :return:                Generator of (dest_id, weight) tuples.
+        """
+        vertex_filter, edge_filter = self._vertex_filter, self._edge_filter
+        adj_vert = self._graph._vertices[identifier].adj_dict
+        for dest_id in adj_vert:
+            weight = adj_vert[dest_id]
+            if ((vertex_filter is None or vertex_filter(dest_id))
+                    and (edge_filter is None or edge_filter(identifier, dest_id, weight))):
+                yield dest_id, weight
+
+    def _adjacency(self, identifier: str) -> dict:
+        """
+        Adjacency accessor passed to DirectedGraph's search loops, so they only follow edges in the view.
+
+        :param identifier:      String representing the identifier of the vertex.
+
+        :return:                Dictionary mapping each adjacent vertex identifier in the view to the edge weight.
+        """
+        return dict(self._adjacent(identifier))
+
+    def _inbound(self, identifier: str):
+        """
+        Generator yielding (source_id, weight) for each inbound edge of a vertex in the view that is also in the view.
+
+        :param identifier:      String representing the identifier of the vertex.
+
+        :return:                Generator of (source_id, weight) tuples.
+        """
+        vertex_filter, edge_filter = self._vertex_filter, self._edge_filter
+        in_vert = self._graph._vertices[identifier].in_dict
+        for source_id in in_vert:
+            weight = in_vert[source_id]
+            if ((vertex_filter is None or vertex_filter(source_id))
+                    and (edge_filter is None or edge_filter(source_id, identifier, weight))):
+                yield source_id, weight
+
+    def view(self, vertex_filter=None, edge_filter=None) -> "GraphView":
+        """
+        Returns a narrower view keeping only the vertices and edges that pass both this view's filters and the given
+        ones. See DirectedGraph.view().
+
+        :param vertex_filter:   Callable taking a vertex identifier and returning True to keep the vertex, or None.
+        :param edge_filter:     Callable taking (source_id, dest_id, weight) and returning True to keep the edge, or
+                                None.
+
+        :return:                GraphView of the same graph.
+        """
+        outer_vertex, outer_edge = self._vertex_filter, self._edge_filter
+        if outer_vertex is not None and vertex_filter is not None:
+            inner_vertex = vertex_filter
+            vertex_filter = lambda identifier: outer_vertex(identifier) and inner_vertex(identifier)
+        elif vertex_filter is None:
+            vertex_filter = outer_vertex
+        if outer_edge is not None and edge_filter is not None:
+            inner_edge = edge_filter
+            edge_filter = lambda source_id, dest_id, weight: (outer_edge(source_id, dest_id, weight)
+                                                              and inner_edge(source_id, dest_id, weight))
+        elif edge_filter is None:
+            edge_filter = outer_edge
+
+        return GraphView(self._graph, vertex_filter, edge_filter)
+
+    def materialize(self) -> DirectedGraph:
+        """
+        Copies the vertices and edges currently in the view into a new DirectedGraph. Vertex values are shared with the
+        viewed graph, not copied.
+
+        :param:                 None.
+
+        :return:                DirectedGraph holding the view's vertices and edges.
+        """
+        graph = DirectedGraph(self._graph._weighted)
+        new_vertices = graph._vertices
+        vertex_filter = self._vertex_filter
+        for vert_id, vertex in self._graph._vertices.items():
+            if vertex_filter is None or vertex_filter(vert_id):
+                new_vertices[vert_id] = Vertex(vert_id, vertex.value, dict(self._adjacent(vert_id)))
+
+        # Fill the inbound indexes from the copied outbound edges
+        for vert_id, vertex in new_vertices.items():
+            adj_vert = vertex.adj_dict
+            for dest_id in adj_vert:
+                new_vertices[dest_id].in_dict[vert_id] = adj_vert[dest_id]
+        graph._size = len(new_vertices)
+
+        return graph
+
+    def vertex_exists(self, identifier: str) -> bool:
+        """
+        Returns True if the vertex exists in the graph and passes the vertex filter, False otherwise.
+
+        :param identifier:      String representing the identifier of the vertex we are checking for.
+
+        :return:                Boolean. True if the vertex is in the view, False otherwise.
+        """
+        return identifier in self._graph._vertices and (self._vertex_filter is None or self._vertex_filter(identifier))
+
+    def edge_exists(self, source_id: str, dest_id: str) -> bool:
+        """
+        Returns True if the edge exists in the graph and it and both its endpoints pass the filters, False otherwise.
+
+        :param source_id:       String representing the identifier of the vertex where the edge begins.
+        :param dest_id:         String representing the identifier of the vertex where the edge ends.
+
+        :return:                Boolean. True if the edge is in the view, False otherwise.
+        """
+        if not (self.vertex_exists(source_id) and self.vertex_exists(dest_id)):
+            return False
+        adj_vert = self._graph._vertices[source_id].adj_dict
+        if dest_id not in adj_vert:
+            return False
+
+        return self._edge_filter is None or self._edge_filter(source_id, dest_id, adj_vert[dest_id])
+
+    def get_adjacent_vertices(self, identifier: str) -> list | None:
+        """
+        Returns a list of identifiers of the adjacent vertices in the view, or None if there are none. If the vertex is
+        not in the view, raises exception.
+
+        :param identifier:      String representing the identifier of the vertex we are getting adjacent vertices of.
+
+        :return:                List of adjacent vertices, or None if no adjacent vertices.
+        """
+        self._check_vertex(identifier, "Error: There is no vertex in the graph with the provided identifier.")
+
+        return [dest_id for dest_id, _ in self._adjacent(identifier)] or None
+
+    def get_inbound_vertices(self, identifier: str) -> list | None:
+        """
+        Returns a list of identifiers of the vertices in the view with an edge into the given vertex, or None if there
+        are none. If the vertex is not in the view, raises exception.
+
+        :param identifier:      String representing the identifier of the vertex we are getting inbound vertices of.
+
+        :return:                List of inbound vertices, or None if no inbound vertices.
+        """
+        self._check_vertex(identifier, "Error: There is no vertex in the graph with the provided identifier.")
+
+        return [source_id for source_id, _ in self._inbound(identifier)] or None
+
+    def in_degree(self, identifier: str) -> int:
+        """
+        Returns the number of edges in the view ending at the given vertex. If the vertex is not in the view, raises
+        exception.
+
+        :param identifier:      String representing the identifier of the vertex.
+
+        :return:                Integer. Number of inbound edges.
+        """
+        self._check_vertex(identifier, "Error: There is no vertex in the graph with the provided identifier.")
+
+        return sum(1 for _ in self._inbound(identifier))
+
+    def out_degree(self, identifier: str) -> int:
+        """
+        Returns the number of edges in the view beginning at the given vertex. If the vertex is not in the view, raises
+        exception.
+
+        :param identifier:      String representing the identifier of the vertex.
+
+        :return:                Integer. Number of outbound edges.
+        """
+        self._check_vertex(identifier, "Error: There is no vertex in the graph with the provided identifier.")
+
+        return sum(1 for _ in self._adjacent(identifier))
+
+    def depth_first_search(self, source_id: str, target_id: str) -> bool:
+        """
+        Uses DFS to return True if target_id node is reachable from source_id node within the view. False if
+        unreachable.
+
+        :param source_id:       String representing the identifier of the vertex we are searching FROM.
+        :param target_id:       String representing the identifier of the vertex we are searching FOR.
+
+        :return:                Boolean. True if target reachable from source, False otherwise.
+        """
+        self._check_vertex(source_id, "Error: There is no vertex in the graph with the provided source identifier.")
+        self._check_vertex(target_id, "Error: There is no vertex in the graph with the provided target identifier.")
+
+        return DirectedGraph._depth_first_search(source_id, target_id, set(), ArrayStack(), self._adjacency)
+
+    def breadth_first_search(self, source_id: str, target_id: str = None) -> tuple | list:
+        """
+        Uses BFS to return a list of the vertices reachable from the source vertex within the view. If a target_id is
+        specified, will return a tuple containing a Boolean indicating if target is reachable and the list of all
+        vertices reachable from the source vertex.
+
+        :param source_id:       String representing the identifier of the vertex we are searching FROM.
+        :param target_id:       String representing the identifier of the vertex we are searching FOR. Optional value,
+                                if none supplied, will exclusively return list of all vertices reachable.
+
+        :return:                If target_id supplied, will return tuple of (Boolean indicating target reachable, list
+                                of reachable vertices). Otherwise, will exclusively return list of reachable vertices.
+        """
+        self._check_vertex(source_id, "Error: There is no vertex in the graph with the provided source identifier.")
+        if target_id:
+            self._check_vertex(target_id, "Error: There is no vertex in the graph with the provided target identifier.")
+
+        reachable_vert = []
+        target_found = False
+        for vert_id, _, _ in DirectedGraph._iter_bfs(source_id, None, ArrayQueue(), self._adjacency):
+            reachable_vert.append(vert_id)
+            if vert_id == target_id:
+                target_found = True
+
+        if target_id:
+            return target_found, reachable_vert
+        return reachable_vert
+
+    def iter_bfs(self, source_id: str, max_depth: int = None):
+        """
+        Generator performing a BFS from the source vertex within the view. See DirectedGraph.iter_bfs().
+
+        :param source_id:       String representing the identifier of the vertex we are searching FROM.
+        :param max_depth:       Integer. Vertices further than this many edges from the source are not visited.
+                                Optional value, if none supplied, all reachable vertices are visited.
+
+        :return:                Generator of (vertex_id, depth, parent) tuples.
+        """
+        self._check_vertex(source_id, "Error: There is no vertex in the graph with the provided source identifier.")
+
+        return DirectedGraph._iter_bfs(source_id, max_depth, ArrayQueue(), self._adjacency)
+
+    def min_path(self, source_id: str) -> tuple:
+        """
+        Calculates the minimum distance from the source vertex to every vertex reachable within the view.
+
+        :param source_id:   String representing the identifier of the vertex we are searching from.
+
+        :return:            Tuple containing a list of vertices ordered from the smallest distance to the largest, and a
+                            dictionary containing each vertex and its associated distance as key-value pairs.
+        """
+        if not self._graph._weighted:
+            raise GraphException("Error: min_path() requires a weighted graph. Current graph unweighted.")
+        self._check_vertex(source_id, "Error: There is no vertex in the graph with the provided identifier.")
+
+        return DirectedGraph._min_path(source_id, PriorityQueue(), self._adjacency)
+
+    def shortest_path(self, source_id: str, target_id: str) -> tuple:
+        """
+        Calculates the minimum distance from the source vertex to the target vertex within the view and the path that
+        achieves it. Stops as soon as the target is settled.
+
+        :param source_id:       String representing the identifier of the vertex we are searching FROM.
+        :param target_id:       String representing the identifier of the vertex we are searching FOR.
+
+        :return:                Tuple containing the distance and a list of the vertex identifiers along the path from
+                                source to target, or (None, None) if the target is unreachable.
+        """
+        if not self._graph._weighted:
+            raise GraphException("Error: shortest_path() requires a weighted graph. Current graph unweighted.")
+        self._check_vertex(source_id, "Error: There is no vertex in the graph with the provided source identifier.")
+        self._check_vertex(target_id, "Error: There is no vertex in the graph with the provided target identifier.")
+
+        return DirectedGraph._shortest_path(source_id, target_id, self._adjacency)
+
+
+class ShortestPathTree:
+    """
+    Minimum distances from one vertex of a weighted DirectedGraph, kept up to date as the graph changes. The tree
+    subscribes to the graph and repairs only the distances a change affects, in the manner of Ramalingam and Reps'
+    dynamic shortest path algorithm: a new or shorter edge is propagated outward from its destination, and a removed
+    or longer tree edge (or a removed vertex) recomputes only the subtree that hung from it, seeded from the rest of the
+    tree. Changes to edges outside the tree that do not shorten a path cost O(1). If the source vertex is removed,
+    every vertex becomes unreachable, even if a vertex with the same identifier is added later. Call close() to stop
+    tracking.
+
+    :param graph:           Weighted DirectedGraph to track.
+    :param source_id:       String representing the identifier of the vertex distances are measured from.
+    """
+
+    def __init__(self, graph: DirectedGraph, source_id: str):
+        if not graph._weighted:
+            raise GraphException("Error: ShortestPathTree requires a weighted graph. Current graph unweighted.")
+        elif source_id not in graph._vertices:
+            raise GraphException("Error: There is no vertex in the graph with the provided source identifier.")
+
+        self._graph = graph
+        self._source_id = source_id
+        self._dist = {}
+        self._parent = {}
+        self._children = {}
+
+        p_queue = PriorityQueue()
+        p_queue.enqueue(0, (source_id, None))
+        self._propagate(p_queue)
+        graph.subscribe(self._on_change)
+
+    @property
+    def source_id(self) -> str:
+        """String identifier of the vertex distances are measured from."""
+        return self._source_id
+
+    def distance(self, vertex_id: str):
+        """
+        Returns the minimum distance from the source to the given vertex, or None if it is unreachable.
+
+        :param vertex_id:       String representing the identifier of the vertex.
+
+        :return:                Distance to the vertex, or None if unreachable.
+        """
+        if vertex_id not in self._graph._vertices:
+            raise GraphException("Error: There is no vertex in the graph with the provided identifier.")
+
+        return self._dist.get(vertex_id)
+
+    def path(self, vertex_id: str) -> list | None:
+        """
+        Returns a minimum-distance path from the source to the given vertex, or None if it is unreachable.
+
+        :param vertex_id:       String representing the identifier of the vertex.
+
+        :return:                List of vertex identifiers from the source to the vertex, or None if unreachable.
+        """
+        if self.distance(vertex_id) is None:
+            return None
+
+        return _trace_path(self._parent, vertex_id)
+
+    def min_path(self) -> tuple:
+        """
+        Returns the current distances in the same form as DirectedGraph.min_path().
+
+        :param:                 None.
+
+        :return:                Tuple containing a list of reachable vertices ordered from the smallest distance to the
+                                largest, and a dictionary containing each vertex and its distance.
+        """
+        dist = self._dist
+        return sorted(dist, key=dist.__getitem__), dict(dist)
+
+    def close(self) -> None:
+        """
+        Unsubscribes from the graph. The tree keeps its last distances but no longer follows changes.
+
+        :param:                 None.
+
+        :return:                None.
+        """
+        self._graph.unsubscribe(self._on_change)
+
+    def _on_change(self, change: "GraphChange") -> None:
+        """
+        Graph subscriber repairing the distances affected by one change.
+
+        :param change:          GraphChange applied to the graph.
+
+        :return:                None.
+        """
+        kind = change.kind
+        if kind == "remove_vertex":
+            if change.source_id in self._dist:
+                self._repair_subtree(change.source_id)
+        elif kind == "remove_edge" or (kind == "update_edge_weight" and change.new_weight > change.old_weight):
+            # Only a tree edge carries a shortest path, so longer or removed non-tree edges change nothing
+            if self._parent.get(change.dest_id) == change.source_id and change.dest_id in self._dist:
+                self._repair_subtree(change.dest_id)
+        elif change.source_id in self._dist:
+            # A new or shorter edge can only shorten paths through its destination
+            distance = self._dist[change.source_id] + change.new_weight
+            if change.dest_id not in self._dist or distance < self._dist[change.dest_id]:
+                p_queue = PriorityQueue()
+                p_queue.enqueue(distance, (change.dest_id, change.source_id))
+                self._propagate(p_queue)
+
+    def _repair_subtree(self, root_id: str) -> None:
+        """
+        Discards the distances of the given vertex and every vertex whose tree path runs through it, then recomputes
+        them from their inbound edges from the rest of the tree. Vertices no longer in the graph are dropped.
+
+        :param root_id:         String identifier of the root of the subtree to recompute.
+
+        :return:                None.
+        """
+        dist, parent, children = self._dist, self._parent, self._children
+
+        # Collect the subtree - its list grows while it is walked
+        affected = [root_id]
+        for vertex_id in affected:
+            affected.extend(children.pop(vertex_id, ()))
+
+        root_parent = parent.get(root_id)
+        if root_parent is not None:
+            children[root_parent].discard(root_id)
+        for vertex_id in affected:
+            del dist[vertex_id]
+            del parent[vertex_id]
+
+        # Seed each detached vertex with its best inbound edge from a vertex that kept its distance
+        vertices = self._graph._vertices
+        p_queue = PriorityQueue()
+        for vertex_id in affected:
+            if vertex_id not in vertices:
+                continue
+            in_vert = vertices[vertex_id].in_dict
+            for source_id in in_vert:
+                if source_id in dist:
+                    p_queue.enqueue(dist[source_id] + in_vert[source_id], (vertex_id, source_id))
+
+        self._propagate(p_queue)
+
+    def _propagate(self, p_queue) -> None:
+        """
+        Runs Dijkstra's Algorithm from the queued (vertex_id, parent_id) candidates, settling a vertex only if its
+        candidate distance beats its current one.
+
+        :param p_queue:         PriorityQueue of (vertex_id, parent_id) tuples keyed by candidate distance.
+
+        :return:                None.
+        """
+        vertices = self._graph._vertices
+        dist, parent, children = self._dist, self._parent, self._children
+
+        while not p_queue.is_empty():
+            distance, (vertex_id, parent_id) = p_queue.dequeue()
+            if vertex_id in dist and dist[vertex_id] <= distance:
+                continue
+
+            # Move the vertex under its new parent
+            old_parent = parent.get(vertex_id)
+            if old_parent is not None:
+                children[old_parent].discard(vertex_id)
+            if parent_id is not None:
+                children.setdefault(parent_id, set()).add(vertex_id)
+            dist[vertex_id] = distance
+            parent[vertex_id] = parent_id
+
+            adj_vert = vertices[vertex_id].adj_dict
+            for vert in adj_vert:
+                vert_priority = distance + adj_vert[vert]
+                if vert not in dist or vert_priority < dist[vert]:
+                    p_queue.enqueue(vert_priority, (vert, vertex_id))
+
+
+class GraphChange:
+    """
+    One change to a DirectedGraph, as kept by its journal and passed to its subscribers.
+
+    :param sequence:        Integer position of the change, counting from 1 when recording began.
+    :param kind:            String naming the change: "add_edge", "remove_edge", "update_edge_weight" or
+                            "remove_vertex". Removing a vertex also removes its edges without separate changes.
+    :param source_id:       String identifier of the edge's source vertex, or of the removed vertex.
+    :param dest_id:         String identifier of the edge's destination vertex. None for a vertex removal.
+    :param old_weight:      Weight of the edge before the change. None for an insertion or vertex removal.
+    :param new_weight:      Weight of the edge after the change. None for a removal.
+    """
+    __slots__ = ("sequence", "kind", "source_id", "dest_id", "old_weight", "new_weight")
+
+    def __init__(self, sequence: int, kind: str, source_id: str, dest_id: str = None, old_weight=None,
+                 new_weight=None):
+        self.sequence = sequence
+        self.kind = kind
+        self.source_id = source_id
+        self.dest_id = dest_id
+        self.old_weight = old_weight
+        self.new_weight = new_weight
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"GraphChange({fields})"
+
+
+class CallStats:
+    """
+    Work done by one observed search, passed to the observer installed with DirectedGraph.set_observer().
+
+    :param operation:       String naming the method called, e.g. "min_path".
+    :param source_id:       String representing the identifier of the vertex searched from.
+    :param vertices_settled: Integer number of vertices visited (BFS, DFS) or settled (min_path).
+    :param edges_relaxed:   Integer number of edges examined from those vertices.
+    :param queue_pushes:    Integer number of items added to the stack, queue or priority queue.
+    :param queue_pops:      Integer number of items removed from it.
+    :param peak_queue_size: Integer largest number of items held at once.
+    :param wall_time:       Float. Seconds spent in the search.
+    """
+    __slots__ = ("operation", "source_id", "vertices_settled", "edges_relaxed", "queue_pushes", "queue_pops",
+                 "peak_queue_size", "wall_time")
+
+    def __init__(self, operation: str, source_id: str, vertices_settled: int, edges_relaxed: int, queue_pushes: int,
+                 queue_pops: int, peak_queue_size: int, wall_time: float):
+        self.operation = operation
+        self.source_id = source_id
+        self.vertices_settled = vertices_settled
+        self.edges_relaxed = edges_relaxed
+        self.queue_pushes = queue_pushes
+        self.queue_pops = queue_pops
+        self.peak_queue_size = peak_queue_size
+        self.wall_time = wall_time
+
+    def as_dict(self) -> dict:
+        """
+        Returns the statistics as a dictionary, for export to a metrics pipeline.
+
+        :return:                Dictionary mapping each field name to its value.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"CallStats({fields})"
+
+
+class StatsCollector:
+    """
+    Observer for DirectedGraph.set_observer() that aggregates CallStats per operation. Safe to share between threads,
+    e.g. behind a ConcurrentDirectedGraph. If on_call is supplied it is also passed every CallStats as it arrives.
+
+    :param on_call:         Callable taking a CallStats. Optional value.
+    """
+
+    _TOTALS = ("vertices_settled", "edges_relaxed", "queue_pushes", "queue_pops", "wall_time")
+
+    def __init__(self, on_call=None):
+        self._on_call = on_call
+        self._lock = threading.Lock()
+        self._summary = {}
+
+    def __call__(self, stats: CallStats) -> None:
+        with self._lock:
+            entry = self._summary.get(stats.operation)
+            if entry is None:
+                entry = self._summary[stats.operation] = dict.fromkeys(
+                    ("calls", *self._TOTALS, "max_peak_queue_size", "max_wall_time"), 0)
+            entry["calls"] += 1
+            for name in self._TOTALS:
+                entry[name] += getattr(stats, name)
+            entry["max_peak_queue_size"] = max(entry["max_peak_queue_size"], stats.peak_queue_size)
+            entry["max_wall_time"] = max(entry["max_wall_time"], stats.wall_time)
+
+        if self._on_call is not None:
+            self._on_call(stats)
+
+    def summary(self) -> dict:
+        """
+        Returns the totals collected so far.
+
+        :return:                Dictionary mapping each operation name to a dictionary of its call count, summed
+                                statistics, largest peak queue size and longest wall time.
+        """
+        with self._lock:
+            return {operation: dict(entry) for operation, entry in self._summary.items()}
+
+    def reset(self) -> None:
+        """
+        Discards the totals collected so far.
+
+        :return:                None.
+        """
+        with self._lock:
+            self._summary = {}
+
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def euclidean_heuristic(value: tuple, target_value: tuple) -> float:
+    """
+    A* heuristic returning the straight-line distance between two vertices holding (x, y) coordinates.
+
+    :param value:           Tuple of coordinates held by the vertex being estimated.
+    :param target_value:    Tuple of coordinates held by the target vertex.
+
+    :return:                Float. Euclidean distance between the coordinates.
+    """
+    return math.dist(value, target_value)
+
+
+def haversine_heuristic(value: tuple, target_value: tuple) -> float:
+    """
+    A* heuristic returning the great-circle distance in kilometres between two vertices holding (latitude, longitude)
+    coordinates in degrees. Edge weights must be in kilometres or a smaller unit (e.g. metres) for the estimate to be
+    admissible, since the estimate must never exceed the true remaining path weight.
+
+    :param value:           Tuple of (latitude, longitude) held by the vertex being estimated.
+    :param target_value:    Tuple of (latitude, longitude) held by the target vertex.
+
+    :return:                Float. Great-circle distance between the coordinates in kilometres.
+    """
+    lat_1, lon_1 = math.radians(value[0]), math.radians(value[1])
+    lat_2, lon_2 = math.radians(target_value[0]), math.radians(target_value[1])
+    a = math.sin((lat_2 - lat_1) / 2) ** 2 + math.cos(lat_1) * math.cos(lat_2) * math.sin((lon_2 - lon_1) / 2) ** 2
+
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _trace_path(predecessors: dict, vertex_id: str) -> list:
+    """
+    Follows predecessor links back from the given vertex and returns the path from the search origin to it.
+
+    :param predecessors:    Dictionary mapping each reached vertex to the vertex it was reached from (None at origin).
+    :param vertex_id:       String representing the identifier of the vertex at the end of the path.
+
+    :return:                List of vertex identifiers from the origin to the given vertex.
+    """
+    path = []
+    while vertex_id is not None:
+        path.append(vertex_id)
+        vertex_id = predecessors[vertex_id]
+    path.reverse()
+
+    return path
+
+
+def _csr_dijkstra(offsets, targets, weights, source_ind: int) -> array:
+    """
+    Dijkstra's Algorithm over CSR arrays. Returns the distance from the source to every vertex, infinity if unreachable.
+
+    :param offsets:         Integer array of row offsets.
+    :param targets:         Integer array of edge destinations.
+    :param weights:         Array of edge weights.
+    :param source_ind:      Integer id of the source vertex.
+
+    :return:                Array of float64 distances indexed by vertex id.
+    """
+    distances = array("d", [math.inf]) * (len(offsets) - 1)
+    distances[source_ind] = 0.0
+    settled = bytearray(len(offsets) - 1)
+    p_queue = [(0, source_ind)]
+    heappush, heappop = heapq.heappush, heapq.heappop
+
+    # Integer vertex ids are comparable, so plain (distance, id) tuples are safe on heapq
+    while p_queue:
+        distance, vert_ind = heappop(p_queue)
+        if settled[vert_ind]:
+            continue
+        settled[vert_ind] = 1
+        for pos in range(offsets[vert_ind], offsets[vert_ind + 1]):
+            dest_ind = targets[pos]
+            vert_priority = distance + weights[pos]
+            if vert_priority < distances[dest_ind]:
+                distances[dest_ind] = vert_priority
+                heappush(p_queue, (vert_priority, dest_ind))
+
+    return distances
+
+
+# CSR arrays installed in each all_pairs_min_path worker process by _init_dijkstra_worker
+_worker_arrays = None
+
+
+def _init_dijkstra_worker(offsets, targets, weights) -> None:
+    """
+    Process pool initializer storing the snapshot's CSR arrays once per worker.
+
+    :param offsets:         Integer array of row offsets.
+    :param targets:         Integer array of edge destinations.
+    :param weights:         Array of edge weights.
+
+    :return:                None.
+    """
+    global _worker_arrays
+    _worker_arrays = (offsets, targets, weights)
+
+
+def _dijkstra_worker_row(source_ind: int) -> array:
+    """
+    Process pool task returning one row of the all-pairs distance matrix.
+
+    :param source_ind:      Integer id of the source vertex.
+
+    :return:                Array of float64 distances indexed by vertex id.
+    """
+    return _csr_dijkstra(*_worker_arrays, source_ind)
+
+
+def _expand_frontier(offsets, targets, dist, frontier, level: int):
+    """
+    Finds the unvisited vertices with an inbound edge from the frontier, sets their distance to level and returns them,
+    each once. Vertices are unvisited while their distance is negative. Uses vectorized gathers when NumPy is
+    installed.
+
+    :param offsets:         Integer array of row offsets (a NumPy array when NumPy is installed).
+    :param targets:         Integer array of edge destinations (a NumPy array when NumPy is installed).
+    :param dist:            Integer array of hop distances (a NumPy array when NumPy is installed).
+    :param frontier:        Integer ids of the vertices to expand (a NumPy array when NumPy is installed).
+    :param level:           Integer hop distance of the newly reached vertices.
+
+    :return:                NumPy array, or list without NumPy, of the integer ids of the newly reached vertices.
+    """
+    if np is not None:
+        starts = offsets[frontier]
+        counts = offsets[frontier + 1] - starts
+        total = int(counts.sum())
+        if not total:
+            return frontier[:0]
+        # Position of every outbound edge: its row's start plus its index among all gathered edges less the row's
+        positions = np.arange(total) + np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        reached = targets[positions]
+        reached = np.unique(reached[dist[reached] < 0])
+        dist[reached] = level
+        return reached
+
+    reached = []
+    for vert_ind in frontier:
+        for dest_ind in targets[offsets[vert_ind]:offsets[vert_ind + 1]]:
+            if dist[dest_ind] < 0:
+                dist[dest_ind] = level
+                reached.append(dest_ind)
+
+    return reached
+
+
+def _level_bfs(dist, source_ind: int, expand) -> None:
+    """
+    Runs a level-synchronous BFS, writing each vertex's hop distance into dist. Every entry of dist must start at -1.
+
+    :param dist:            Integer array of hop distances (a NumPy array when NumPy is installed).
+    :param source_ind:      Integer id of the source vertex.
+    :param expand:          Callable taking a frontier and a level, marking the unvisited vertices the frontier reaches
+                            with that level and returning them, each once.
+
+    :return:                None.
+    """
+    dist[source_ind] = 0
+    frontier = np.array([source_ind], dtype=np.int64) if np is not None else [source_ind]
+    level = 0
+
+    while len(frontier):
+        level += 1
+        frontier = expand(frontier, level)
+
+
+def _shared_array(segments: list, values, length: int):
+    """
+    Creates a shared memory segment holding length 8-byte integers, appends it and the length to segments, and returns
+    a view of it. The view is filled from values, or with -1 if values is None.
+
+    :param segments:        List the (SharedMemory, length) pair is appended to.
+    :param values:          Integer sequence to copy in, or None.
+    :param length:          Integer number of items.
+
+    :return:                NumPy int64 array, or memoryview of "q" items without NumPy, over the segment.
+    """
+    # Zero-length segments are not allowed
+    segment = SharedMemory(create=True, size=max(8, length * 8))
+    segments.append((segment, length))
+    view = _shared_view(segment, length)
+    if values is None:
+        view[:] = np.full(length, -1, dtype=np.int64) if np is not None else array("q", [-1]) * length
+    else:
+        view[:] = np.asarray(values, dtype=np.int64) if np is not None else array("q", values)
+
+    return view
+
+
+def _shared_view(segment: SharedMemory, length: int):
+    """
+    Returns a view of the first length 8-byte integers in a shared memory segment.
+
+    :param segment:         SharedMemory to view.
+    :param length:          Integer number of items.
+
+    :return:                NumPy int64 array, or memoryview of "q" items without NumPy.
+    """
+    if np is not None:
+        return np.ndarray(length, dtype=np.int64, buffer=segment.buf)
+    return segment.buf[:length * 8].cast("q")
+
+
+# Shared memory segments and views attached by each BFS worker process
+_bfs_worker_state = None
+
+
+def _init_bfs_worker(names: list) -> None:
+    """
+    Process pool initializer attaching to the shared offsets, targets and distances once per worker.
+
+    :param names:           List of (segment name, length) pairs in that order.
+
+    :return:                None.
+    """
+    global _bfs_worker_state
+    # Pool workers share the creating process's resource tracker, which unlinks the segments if that process dies
+    segments = [SharedMemory(name) for name, _ in names]
+    _bfs_worker_state = (segments, *(_shared_view(segment, length) for segment, (_, length) in zip(segments, names)))
+
+
+def _bfs_worker_expand(frontier, level: int):
+    """
+    Process pool task expanding one share of a BFS frontier.
+
+    :param frontier:        Integer ids of the vertices to expand.
+    :param level:           Integer hop distance of the newly reached vertices.
+
+    :return:                Integer ids of the unvisited vertices they reach, each once.
+    """
+    _, offsets, targets, dist = _bfs_worker_state
+    return _expand_frontier(offsets, targets, dist, frontier, level)
+
+
+def _array_bytes(values, typecode: str) -> bytes:
+    """
+    Returns the little-endian bytes of the given array or memoryview of 8-byte items.
+
+    :param values:          Array or memoryview to convert.
+    :param typecode:        Array typecode of the items ("q" or "d").
+
+    :return:                Bytes of the items in little-endian order.
+    """
+    converted = array(typecode, values)
+    if sys.byteorder != "little":
+        converted.byteswap()
+
+    return converted.tobytes()
+
+
+def _bytes_array(data: memoryview, typecode: str, zero_copy: bool):
+    """
+    Returns the little-endian 8-byte items in the given buffer as an indexable sequence. If zero_copy is True and the
+    machine is little-endian, returns a memoryview over the buffer. Otherwise, returns a copied array.
+
+    :param data:            Memoryview over the section of the file holding the items.
+    :param typecode:        Array typecode of the items ("q" or "d").
+    :param zero_copy:       Bool indicating if a view over the buffer may be returned instead of a copy.
+
+    :return:                Memoryview or array of the items.
+    """
+    if zero_copy and sys.byteorder == "little":
+        return data.cast(typecode)
+
+    converted = array(typecode)
+    converted.frombytes(data)
+    if sys.byteorder != "little":
+        converted.byteswap()
+
+    return converted
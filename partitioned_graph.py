@@ -0,0 +1,611 @@
+# Partitioned Directed Graph - vertices hashed across DirectedGraph shards held by worker processes
+
+from multiprocessing import Pipe, Process
+import zlib
+
+from ds_library import PriorityQueue
+from graph import DirectedGraph, GraphException
+
+
+def shard_of(identifier: str, shards: int) -> int:
+    """
+    Returns the index of the shard holding the given vertex. Uses CRC-32 rather than hash(), which is salted per
+    process, so every process places a vertex on the same shard.
+
+    :param identifier:      String representing the identifier of the vertex.
+    :param shards:          Integer number of shards.
+
+    :return:                Integer shard index.
+    """
+    return zlib.crc32(identifier.encode()) % shards
+
+
+class PartitionedDirectedGraph:
+    """
+    Directed Graph whose vertices are hashed across shards, each a DirectedGraph held by its own worker process and
+    driven over a pipe, so the graph can grow past the memory of one process. Edges between two vertices on the same
+    shard are stored in that shard's DirectedGraph. Boundary edges, which join vertices on different shards, are
+    indexed on both shards: by source on the source's shard and by destination on the destination's shard.
+
+    breadth_first_search() and min_path() run as rounds of frontier exchange. In each round every shard with work
+    expands its frontier locally, in parallel with the other shards, and returns the boundary edge endpoints it
+    reached, grouped by shard, to be delivered in the next round. min_path() is label-correcting: each shard runs
+    Dijkstra's Algorithm over its own vertices, and a vertex is settled again if a later round brings a shorter
+    distance from another shard.
+
+    Not thread-safe - calls must not overlap. Call close(), or use the graph as a context manager, to stop the worker
+    processes.
+
+    :param shards:          Integer number of shards (worker processes). Defaults to 4.
+    :param weighted:        Bool indicating if edges of graph are weighted. Defaults to False.
+    """
+
+    def __init__(self, shards: int = 4, weighted: bool = False):
+        if shards < 1:
+            raise GraphException("Error: A partitioned graph needs at least 1 shard.")
+
+        self._shards = shards
+        self._weighted = weighted
+        self._connections = []
+        self._processes = []
+        for ind in range(shards):
+            parent_end, child_end = Pipe()
+            process = Process(target=_shard_main, args=(child_end, ind, shards, weighted), daemon=True)
+            process.start()
+            child_end.close()
+            self._connections.append(parent_end)
+            self._processes.append(process)
+
+    def __enter__(self) -> "PartitionedDirectedGraph":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stops the worker processes. The graph's contents are discarded.
+
+        :param:                 None.
+
+        :return:                None.
+        """
+        for connection, process in zip(self._connections, self._processes):
+            if process.is_alive():
+                connection.send(("close", ()))
+            process.join()
+            connection.close()
+        self._connections = []
+        self._processes = []
+
+    def _call(self, ind: int, command: str, *args):
+        """
+        Runs a command on one shard and returns its result. Exceptions raised by the shard are raised here.
+
+        :param ind:             Integer shard index.
+        :param command:         String naming a _Shard method.
+        :param args:            Arguments passed to the method.
+
+        :return:                Result of the method.
+        """
+        return self._call_many({ind: (command, args)})[ind]
+
+    def _call_many(self, calls: dict) -> dict:
+        """
+        Runs one command on each of several shards at once. Every command is sent before any reply is read, so the
+        shards work in parallel. If any shard raises, the first exception is raised once all replies are in.
+
+        :param calls:           Dictionary mapping shard index to a (command, args) tuple.
+
+        :return:                Dictionary mapping shard index to the command's result.
+        """
+        if not self._connections:
+            raise GraphException("Error: Partitioned graph is closed.")
+
+        for ind, call in calls.items():
+            self._connections[ind].send(call)
+
+        results, error = {}, None
+        for ind in calls:
+            succeeded, result = self._connections[ind].recv()
+            if succeeded:
+                results[ind] = result
+            elif error is None:
+                error = result
+        if error is not None:
+            raise error
+
+        return results
+
+    def _broadcast(self, command: str, *args) -> dict:
+        """
+        Runs the same command on every shard at once.
+
+        :param command:         String naming a _Shard method.
+        :param args:            Arguments passed to the method.
+
+        :return:                Dictionary mapping shard index to the command's result.
+        """
+        return self._call_many({ind: (command, args) for ind in range(self._shards)})
+
+    def add_vertex(self, identifier: str, value: object) -> None:
+        """
+        Creates a new vertex on its shard. If a vertex with that identifier already exists, its value is replaced.
+
+        :param identifier:      String representing the unique identifier of the new vertex.
+        :param value:           Value that the new vertex will hold.
+
+        :return:                None.
+        """
+        self.add_vertices([(identifier, value)])
+
+    def add_vertices(self, vertices) -> int:
+        """
+        Adds each (identifier, value) pair in the given iterable, sending one batch to each shard.
+
+        :param vertices:        Iterable of (identifier, value) tuples.
+
+        :return:                Integer. Number of new vertices added to the graph.
+        """
+        batches = {}
+        for identifier, value in vertices:
+            batches.setdefault(shard_of(identifier, self._shards), []).append((identifier, value))
+
+        calls = {ind: ("add_vertices", (batch,)) for ind, batch in batches.items()}
+        return sum(self._call_many(calls).values())
+
+    def remove_vertex(self, identifier: str) -> None:
+        """
+        Removes the vertex with the given identifier and all of its edges, including boundary edges indexed on other
+        shards.
+
+        :param identifier:      String representing the identifier of the vertex to be removed.
+
+        :return:                None.
+        """
+        dest_ids, source_ids = self._call(shard_of(identifier, self._shards), "remove_vertex", identifier)
+
+        # Drop the other half of each boundary edge from the shard at its far end
+        drops = {}
+        for dest_id in dest_ids:
+            drops.setdefault(shard_of(dest_id, self._shards), ([], []))[1].append((identifier, dest_id))
+        for source_id in source_ids:
+            drops.setdefault(shard_of(source_id, self._shards), ([], []))[0].append((source_id, identifier))
+        self._call_many({ind: ("drop_boundary", pairs) for ind, pairs in drops.items()})
+
+    def add_edge(self, source_id: str, dest_id: str, weight: int = None) -> None:
+        """
+        Creates a new edge between two vertices. Follows the rules of DirectedGraph.add_edge() - if the edge already
+        exists, does nothing.
+
+        :param source_id:       String representing the identifier of the vertex where the edge begins.
+        :param dest_id:         String representing the identifier of the vertex where the edge ends.
+        :param weight:          Integer representing the weight of the edge. Applies to weighted graphs only.
+
+        :return:                None.
+        """
+        self.add_edges([(source_id, dest_id, weight)])
+
+    def add_edges(self, edges, on_missing: str = "raise") -> dict:
+        """
+        Adds each edge in the given iterable. Follows the rules of DirectedGraph.add_edges(). Endpoints are checked
+        with one batch per shard, then edges are sent with one batch per shard.
+
+        :param edges:           Iterable of (source_id, dest_id) or (source_id, dest_id, weight) tuples.
+        :param on_missing:      String determining how edges with a missing endpoint or weight are handled. "create"
+                                adds missing vertices with a value of None, "skip" rejects the edge, "raise" raises
+                                exception before any edge is added. A missing weight cannot be created, so it raises
+                                exception under "create" too. Defaults to "raise".
+
+        :return:                Dictionary with counts of "inserted", "duplicate" and "rejected" edges.
+        """
+        if on_missing not in ("create", "skip", "raise"):
+            raise GraphException("Error: on_missing must be one of 'create', 'skip' or 'raise'.")
+
+        shards, weighted = self._shards, self._weighted
+        accepted = []
+        rejected = 0
+        for edge in edges:
+            if len(edge) < 2:
+                raise GraphException("Error: Each edge must be a (source_id, dest_id[, weight]) tuple.")
+            weight = edge[2] if weighted and len(edge) > 2 else None
+            if weighted and not weight:
+                if on_missing != "skip":
+                    raise GraphException("Error: Graph is weighted - all edges must be supplied with a weight.")
+                rejected += 1
+                continue
+            accepted.append((edge[0], edge[1], weight))
+
+        # Ask each shard which of its endpoints are missing
+        endpoints = {}
+        for source_id, dest_id, _ in accepted:
+            endpoints.setdefault(shard_of(source_id, shards), set()).add(source_id)
+            endpoints.setdefault(shard_of(dest_id, shards), set()).add(dest_id)
+        replies = self._call_many({ind: ("missing", (list(ids),)) for ind, ids in endpoints.items()})
+        missing = set().union(*replies.values())
+
+        if missing:
+            if on_missing == "raise":
+                for source_id, dest_id, _ in accepted:
+                    if source_id in missing or dest_id in missing:
+                        end = "source" if source_id in missing else "destination"
+                        raise GraphException(
+                            f"Error: There is no vertex in the graph with the provided {end} identifier.")
+            elif on_missing == "skip":
+                kept = [edge for edge in accepted if edge[0] not in missing and edge[1] not in missing]
+                rejected += len(accepted) - len(kept)
+                accepted = kept
+            else:
+                self.add_vertices((identifier, None) for identifier in missing)
+
+        # Local edges go to their shard's DirectedGraph, boundary edges to both endpoints' shards
+        batches = {}
+        for source_id, dest_id, weight in accepted:
+            source_shard, dest_shard = shard_of(source_id, shards), shard_of(dest_id, shards)
+            if source_shard == dest_shard:
+                batches.setdefault(source_shard, ([], [], []))[0].append((source_id, dest_id, weight))
+            else:
+                batches.setdefault(source_shard, ([], [], []))[1].append((source_id, dest_id, weight))
+                batches.setdefault(dest_shard, ([], [], []))[2].append((source_id, dest_id, weight))
+
+        replies = self._call_many({ind: ("add_edges", batch) for ind, batch in batches.items()})
+        inserted = sum(reply[0] for reply in replies.values())
+        duplicate = sum(reply[1] for reply in replies.values())
+
+        return {"inserted": inserted, "duplicate": duplicate, "rejected": rejected}
+
+    def remove_edge(self, source_id: str, dest_id: str) -> None:
+        """
+        Removes the edge from source to destination vertices. If edge does not exist, raises exception.
+
+        :param source_id:       String representing the identifier of the vertex where the edge begins.
+        :param dest_id:         String representing the identifier of the vertex where the edge ends.
+
+        :return:                None.
+        """
+        source_shard, dest_shard = shard_of(source_id, self._shards), shard_of(dest_id, self._shards)
+        self._call(source_shard, "remove_edge", source_id, dest_id, source_shard != dest_shard)
+        if source_shard != dest_shard:
+            self._call(dest_shard, "drop_boundary", [], [(source_id, dest_id)])
+
+    def edge_exists(self, source_id: str, dest_id: str) -> bool:
+        """
+        Returns True if the edge exists in the graph, False otherwise.
+
+        :param source_id:       String representing the identifier of the vertex where the edge begins.
+        :param dest_id:         String representing the identifier of the vertex where the edge ends.
+
+        :return:                Boolean. True if edge exists, False otherwise.
+        """
+        return self._call(shard_of(source_id, self._shards), "edge_exists", source_id, dest_id)
+
+    def vertex_exists(self, identifier: str) -> bool:
+        """
+        Returns True if the vertex exists in the graph, False otherwise.
+
+        :param identifier:      String representing the identifier of the vertex we are checking for.
+
+        :return:                Boolean. True if vertex with given identifier exists, False otherwise.
+        """
+        return self._call(shard_of(identifier, self._shards), "vertex_exists", identifier)
+
+    def get_adjacent_vertices(self, identifier: str) -> list | None:
+        """
+        Returns a list of identifiers of the adjacent vertices, or None if there are none. If the vertex does not
+        exist, raises exception.
+
+        :param identifier:      String representing the identifier of the vertex we are getting adjacent vertices of.
+
+        :return:                List of adjacent vertices, or None if no adjacent vertices.
+        """
+        return self._call(shard_of(identifier, self._shards), "adjacent", identifier)
+
+    def get_inbound_vertices(self, identifier: str) -> list | None:
+        """
+        Returns a list of identifiers of the vertices with an edge into the given vertex, or None if there are none.
+        If the vertex does not exist, raises exception.
+
+        :param identifier:      String representing the identifier of the vertex we are getting inbound vertices of.
+
+        :return:                List of inbound vertices, or None if no inbound vertices.
+        """
+        return self._call(shard_of(identifier, self._shards), "inbound", identifier)
+
+    def in_degree(self, identifier: str) -> int:
+        """
+        Returns the number of edges ending at the given vertex. If the vertex does not exist, raises exception.
+
+        :param identifier:      String representing the identifier of the vertex.
+
+        :return:                Integer. Number of inbound edges.
+        """
+        return len(self.get_inbound_vertices(identifier) or ())
+
+    def out_degree(self, identifier: str) -> int:
+        """
+        Returns the number of edges beginning at the given vertex. If the vertex does not exist, raises exception.
+
+        :param identifier:      String representing the identifier of the vertex.
+
+        :return:                Integer. Number of outbound edges.
+        """
+        return len(self.get_adjacent_vertices(identifier) or ())
+
+    def shard_stats(self) -> list:
+        """
+        Returns the size of each shard, to check the balance of the partitioning.
+
+        :param:                 None.
+
+        :return:                List with one dictionary per shard holding its "vertices", "local_edges" and
+                                "boundary_edges" (outbound boundary edges) counts.
+        """
+        replies = self._broadcast("stats")
+        return [replies[ind] for ind in range(self._shards)]
+
+    def breadth_first_search(self, source_id: str, target_id: str = None) -> tuple | list:
+        """
+        Uses a level-synchronous BFS to return a list of the vertices reachable from the source vertex, in order of
+        the number of edges from the source. If a target_id is specified, will return a tuple containing a Boolean
+        indicating if target is reachable and the list of all vertices reachable from the source vertex.
+
+        :param source_id:       String representing the identifier of the vertex we are searching FROM.
+        :param target_id:       String representing the identifier of the vertex we are searching FOR. Optional value,
+                                if none supplied, will exclusively return list of all vertices reachable.
+
+        :return:                If target_id supplied, will return tuple of (Boolean indicating target reachable, list
+                                of reachable vertices). Otherwise, will exclusively return list of reachable vertices.
+        """
+        if not self.vertex_exists(source_id):
+            raise GraphException("Error: There is no vertex in the graph with the provided source identifier.")
+        elif target_id and not self.vertex_exists(target_id):
+            raise GraphException("Error: There is no vertex in the graph with the provided target identifier.")
+
+        self._broadcast("begin_search")
+        reachable_vert = []
+        incoming = {shard_of(source_id, self._shards): [source_id]}
+        try:
+            # Each round expands one level - shards keep their own next level and return the rest
+            while incoming:
+                replies = self._call_many({ind: ("bfs_step", (candidates,)) for ind, candidates in incoming.items()})
+                incoming = {}
+                for ind, (frontier, remote, has_pending) in replies.items():
+                    reachable_vert.extend(frontier)
+                    if has_pending:
+                        incoming.setdefault(ind, [])
+                    for dest_shard, dest_ids in remote.items():
+                        incoming.setdefault(dest_shard, []).extend(dest_ids)
+        finally:
+            self._broadcast("end_search")
+
+        if target_id:
+            return target_id in set(reachable_vert), reachable_vert
+        return reachable_vert
+
+    def min_path(self, source_id: str) -> tuple:
+        """
+        Calculates the minimum distance from the source vertex to all other reachable vertices in the graph.
+
+        :param source_id:   String representing the identifier of the vertex we are searching from.
+
+        :return:            Tuple containing a list of vertices ordered from the smallest distance to the largest, and a
+                            dictionary containing each vertex and its associated distance as key-value pairs.
+        """
+        if not self._weighted:
+            raise GraphException("Error: min_path() requires a weighted graph. Current graph unweighted.")
+        elif not self.vertex_exists(source_id):
+            raise GraphException("Error: There is no vertex in the graph with the provided identifier.")
+
+        self._broadcast("begin_search")
+        incoming = {shard_of(source_id, self._shards): [(source_id, 0)]}
+        try:
+            # Rounds continue until no shard finds a shorter distance to a vertex on another shard
+            while incoming:
+                replies = self._call_many({ind: ("min_path_step", (relaxed,)) for ind, relaxed in incoming.items()})
+                incoming = {}
+                for remote in replies.values():
+                    for dest_shard, relaxed in remote.items():
+                        incoming.setdefault(dest_shard, []).extend(relaxed)
+            replies = self._broadcast("distances")
+        finally:
+            self._broadcast("end_search")
+
+        distances = {}
+        for shard_distances in replies.values():
+            distances.update(shard_distances)
+
+        return sorted(distances, key=distances.__getitem__), distances
+
+
+class _Shard:
+    """
+    State held by one shard's worker process: a DirectedGraph of the shard's vertices and the edges between them, plus
+    both indexes of the boundary edges touching the shard. Commands from the coordinator call its methods by name.
+
+    :param index:           Integer index of this shard.
+    :param shards:          Integer number of shards.
+    :param weighted:        Bool indicating if edges of graph are weighted.
+    """
+
+    def __init__(self, index: int, shards: int, weighted: bool):
+        self._index = index
+        self._shards = shards
+        self._graph = DirectedGraph(weighted)
+        self._boundary_out = {}
+        self._boundary_in = {}
+        self._search = None
+
+    def _check_vertex(self, identifier: str) -> None:
+        if identifier not in self._graph._vertices:
+            raise GraphException("Error: There is no vertex in the graph with the provided identifier.")
+
+    def add_vertices(self, vertices: list) -> int:
+        return self._graph.add_vertices(vertices)
+
+    def missing(self, identifiers: list) -> list:
+        vertices = self._graph._vertices
+        return [identifier for identifier in identifiers if identifier not in vertices]
+
+    def remove_vertex(self, identifier: str) -> tuple:
+        self._graph.remove_vertex(identifier)
+        return list(self._boundary_out.pop(identifier, ())), list(self._boundary_in.pop(identifier, ()))
+
+    def drop_boundary(self, out_pairs: list, in_pairs: list) -> None:
+        for source_id, dest_id in out_pairs:
+            row = self._boundary_out[source_id]
+            del row[dest_id]
+            if not row:
+                del self._boundary_out[source_id]
+        for source_id, dest_id in in_pairs:
+            row = self._boundary_in[dest_id]
+            del row[source_id]
+            if not row:
+                del self._boundary_in[dest_id]
+
+    def add_edges(self, local_edges: list, out_edges: list, in_edges: list) -> tuple:
+        counts = self._graph.add_edges(local_edges)
+        inserted, duplicate = counts["inserted"], counts["duplicate"]
+
+        # An existing boundary edge keeps its weight, matching DirectedGraph.add_edge()
+        for source_id, dest_id, weight in out_edges:
+            row = self._boundary_out.setdefault(source_id, {})
+            if dest_id in row:
+                duplicate += 1
+            else:
+                row[dest_id] = weight
+                inserted += 1
+        for source_id, dest_id, weight in in_edges:
+            self._boundary_in.setdefault(dest_id, {}).setdefault(source_id, weight)
+
+        return inserted, duplicate
+
+    def remove_edge(self, source_id: str, dest_id: str, boundary: bool) -> None:
+        if not boundary:
+            self._graph.remove_edge(source_id, dest_id)
+        elif dest_id in self._boundary_out.get(source_id, ()):
+            self.drop_boundary([(source_id, dest_id)], [])
+        else:
+            raise GraphException("Error: No edge exists between the source vertex and destination vertex.")
+
+    def edge_exists(self, source_id: str, dest_id: str) -> bool:
+        return self._graph.edge_exists(source_id, dest_id) or dest_id in self._boundary_out.get(source_id, ())
+
+    def vertex_exists(self, identifier: str) -> bool:
+        return self._graph.vertex_exists(identifier)
+
+    def adjacent(self, identifier: str) -> list | None:
+        self._check_vertex(identifier)
+        return [*self._graph._vertices[identifier].adj_dict, *self._boundary_out.get(identifier, ())] or None
+
+    def inbound(self, identifier: str) -> list | None:
+        self._check_vertex(identifier)
+        return [*self._graph._vertices[identifier].in_dict, *self._boundary_in.get(identifier, ())] or None
+
+    def stats(self) -> dict:
+        return {
+            "vertices": self._graph._size,
+            "local_edges": sum(len(vertex.adj_dict) for vertex in self._graph._vertices.values()),
+            "boundary_edges": sum(len(row) for row in self._boundary_out.values()),
+        }
+
+    def begin_search(self) -> None:
+        # visited doubles as the distance table of min_path; pending holds this shard's next BFS level; sent holds the
+        # shortest distance already sent to each remote vertex
+        self._search = {"visited": {}, "pending": [], "sent": {}}
+
+    def end_search(self) -> None:
+        self._search = None
+
+    def bfs_step(self, candidates: list) -> tuple:
+        """
+        Visits the unvisited vertices among the candidates and this shard's pending vertices, keeps their local
+        neighbours as the next pending level, and returns the newly visited vertices, their remote neighbours grouped
+        by shard, and whether any vertices are pending.
+        """
+        vertices, boundary_out = self._graph._vertices, self._boundary_out
+        visited, shards = self._search["visited"], self._shards
+
+        frontier = []
+        for vert_id in (*self._search["pending"], *candidates):
+            if vert_id not in visited:
+                visited[vert_id] = True
+                frontier.append(vert_id)
+
+        pending, remote = [], {}
+        for vert_id in frontier:
+            pending.extend(dest_id for dest_id in vertices[vert_id].adj_dict if dest_id not in visited)
+            for dest_id in boundary_out.get(vert_id, ()):
+                remote.setdefault(shard_of(dest_id, shards), []).append(dest_id)
+        self._search["pending"] = pending
+
+        return frontier, remote, bool(pending)
+
+    def min_path_step(self, relaxed: list) -> dict:
+        """
+        Applies the (vertex_id, distance) pairs that improve on known distances, runs Dijkstra's Algorithm over this
+        shard's vertices from them, and returns the improved distances to remote vertices as (vertex_id, distance)
+        lists grouped by shard.
+        """
+        vertices, boundary_out = self._graph._vertices, self._boundary_out
+        dist, sent = self._search["visited"], self._search["sent"]
+
+        p_queue = PriorityQueue()
+        for vert_id, distance in relaxed:
+            if vert_id not in dist or distance < dist[vert_id]:
+                dist[vert_id] = distance
+                p_queue.enqueue(distance, vert_id)
+
+        remote = {}
+        while not p_queue.is_empty():
+            distance, vert_id = p_queue.dequeue()
+            # Skip entries superseded by a shorter distance found after they were queued
+            if distance > dist[vert_id]:
+                continue
+            adj_vert = vertices[vert_id].adj_dict
+            for dest_id in adj_vert:
+                vert_priority = distance + adj_vert[dest_id]
+                if dest_id not in dist or vert_priority < dist[dest_id]:
+                    dist[dest_id] = vert_priority
+                    p_queue.enqueue(vert_priority, dest_id)
+            row = boundary_out.get(vert_id, {})
+            for dest_id in row:
+                vert_priority = distance + row[dest_id]
+                if dest_id not in sent or vert_priority < sent[dest_id]:
+                    sent[dest_id] = vert_priority
+                    remote[dest_id] = vert_priority
+
+        grouped = {}
+        for dest_id, distance in remote.items():
+            grouped.setdefault(shard_of(dest_id, self._shards), []).append((dest_id, distance))
+
+        return grouped
+
+    def distances(self) -> dict:
+        return self._search["visited"]
+
+
+def _shard_main(connection, index: int, shards: int, weighted: bool) -> None:
+    """
+    Worker process loop: receives (command, args) tuples, runs the named _Shard method and replies with
+    (True, result), or (False, exception) if it raised, until told to close.
+
+    :param connection:      Connection to the coordinating PartitionedDirectedGraph.
+    :param index:           Integer index of this shard.
+    :param shards:          Integer number of shards.
+    :param weighted:        Bool indicating if edges of graph are weighted.
+
+    :return:                None.
+    """
+    shard = _Shard(index, shards, weighted)
+    while True:
+        try:
+            command, args = connection.recv()
+        except EOFError:
+            break
+        if command == "close":
+            break
+        try:
+            connection.send((True, getattr(shard, command)(*args)))
+        except Exception as error:
+            connection.send((False, error))
+    connection.close()
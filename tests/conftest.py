@@ -0,0 +1,54 @@
+# Graph builders shared by the test modules. Import them with: from tests.conftest import chain, random_graph
+
+import random
+
+from graph import DirectedGraph
+
+
+def random_graph(rnd: random.Random, size: int, edge_count: int = None, weighted: bool = True,
+                 acyclic: bool = False) -> DirectedGraph:
+    """
+    Returns a graph on vertices "0" to str(size - 1), each holding its own identifier as its value, with edges of
+    weight 1 to 9 between random endpoints. Vertices are inserted in a shuffled order.
+
+    :param rnd:             random.Random supplying every choice, so a seed reproduces the graph.
+    :param size:            Integer number of vertices.
+    :param edge_count:      Integer number of edges to draw. Duplicates are ignored, so the graph may have fewer.
+                            Defaults to a random count between 0 and 4 * size.
+    :param weighted:        Boolean determining whether the graph is weighted. Defaults to True.
+    :param acyclic:         Boolean. If True, every edge follows the shuffled insertion order, making the graph a DAG
+                            whose topological order differs from its identifiers' order. Defaults to False.
+
+    :return:                DirectedGraph.
+    """
+    graph = DirectedGraph(weighted)
+    ids = [str(ind) for ind in range(size)]
+    rnd.shuffle(ids)
+    graph.add_vertices((vert_id, vert_id) for vert_id in ids)
+
+    if edge_count is None:
+        edge_count = rnd.randint(0, 4 * size)
+    for _ in range(edge_count):
+        source, dest = rnd.randrange(size), rnd.randrange(size)
+        if acyclic:
+            if source == dest:
+                continue
+            source, dest = min(source, dest), max(source, dest)
+        graph.add_edge(ids[source], ids[dest], rnd.randint(1, 9))
+
+    return graph
+
+
+def chain(size: int) -> DirectedGraph:
+    """
+    Returns an unweighted path graph "0" -> "1" -> ... -> str(size - 1).
+
+    :param size:            Integer number of vertices.
+
+    :return:                DirectedGraph.
+    """
+    graph = DirectedGraph()
+    graph.add_vertices((str(ind), None) for ind in range(size))
+    graph.add_edges((str(ind), str(ind + 1)) for ind in range(size - 1))
+
+    return graph
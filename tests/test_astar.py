@@ -0,0 +1,36 @@
+# Checks that astar() returns shortest paths for admissible heuristics, including inconsistent ones
+
+import random
+
+from graph import DirectedGraph
+from tests.conftest import random_graph
+
+
+def test_inconsistent_heuristic_reopens_vertex():
+    # h(A) = 5 is admissible (A is 6 from T) but not consistent (A -> B costs 1 and h(B) = 0), so B is first
+    # expanded through the longer direct edge and must be reopened once A reaches it more cheaply
+    graph = DirectedGraph(True)
+    graph.add_vertices([("S", 0), ("A", 5), ("B", 0), ("T", 0)])
+    graph.add_edges([("S", "A", 1), ("S", "B", 3), ("A", "B", 1), ("B", "T", 5)])
+
+    assert graph.astar("S", "T", lambda value, target_value: value) == (7, ["S", "A", "B", "T"])
+
+
+def test_random_admissible_heuristics_match_shortest_path():
+    rnd = random.Random(6)
+    for _ in range(100):
+        size = rnd.randint(2, 25)
+        graph = random_graph(rnd, size)
+        source, target = str(rnd.randrange(size)), str(rnd.randrange(size))
+
+        # Scale each vertex's true remaining distance by its own random factor - admissible, rarely consistent
+        estimate = {}
+        for vert_id in graph._vertices:
+            remaining = graph.shortest_path(vert_id, target)[0]
+            estimate[vert_id] = 0 if remaining is None else remaining * rnd.random()
+
+        distance, path = graph.astar(source, target, lambda value, target_value: estimate[value])
+        assert distance == graph.shortest_path(source, target)[0]
+        if path is not None:
+            assert path[0] == source and path[-1] == target
+            assert sum(graph._vertices[a].adj_dict[b] for a, b in zip(path, path[1:])) == distance
@@ -0,0 +1,72 @@
+# Checks AsyncDirectedGraph error handling and concurrency limits
+
+import asyncio
+import time
+
+import pytest
+
+from async_graph import AsyncDirectedGraph
+from graph import GraphException
+from tests.conftest import chain
+
+
+@pytest.mark.parametrize("mode", ["cooperative", "executor"])
+def test_removed_vertex_raises_graph_exception(mode):
+    graph = chain(50)
+
+    def traversal():
+        # Removing a vertex ahead of the search makes the next expansion fail with KeyError
+        for item in graph.iter_bfs("0"):
+            if item[0] == "10":
+                graph.remove_vertex("11")
+                graph._vertices["10"].adj_dict["11"] = None
+            yield item
+
+    async_graph = AsyncDirectedGraph(graph, mode)
+    with pytest.raises(GraphException) as info:
+        asyncio.run(async_graph._traverse(traversal, lambda item: False))
+    assert isinstance(info.value.__cause__, KeyError)
+
+
+@pytest.mark.parametrize("mode", ["cooperative", "executor"])
+def test_consume_errors_are_not_translated(mode):
+    def consume(item: tuple) -> bool:
+        raise KeyError("consume")
+
+    async_graph = AsyncDirectedGraph(chain(5), mode)
+    with pytest.raises(KeyError):
+        asyncio.run(async_graph._traverse(lambda: async_graph.graph.iter_bfs("0"), consume))
+
+
+def test_bad_arguments_raise_graph_exception():
+    with pytest.raises(GraphException):
+        AsyncDirectedGraph(chain(1), mode="threads")
+    with pytest.raises(GraphException):
+        AsyncDirectedGraph(chain(1), yield_every=0)
+
+
+def test_cancelled_executor_call_keeps_slot_until_thread_stops():
+    times = {"first": [], "second": []}
+
+    def slow_traversal(name: str, count: int):
+        for ind in range(count):
+            time.sleep(0.001)
+            times[name].append(time.perf_counter())
+            yield ind,
+
+    async def main():
+        async_graph = AsyncDirectedGraph(chain(1), "executor", yield_every=100, max_concurrency=1)
+        first = asyncio.ensure_future(async_graph._traverse(lambda: slow_traversal("first", 10_000),
+                                                            lambda item: False))
+        await asyncio.sleep(0.02)
+        first.cancel()
+        second = asyncio.ensure_future(async_graph._traverse(lambda: slow_traversal("second", 10),
+                                                             lambda item: False))
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        await second
+
+    asyncio.run(main())
+    # The first thread stopped at a checkpoint, and only then did the second one start
+    assert 0 < len(times["first"]) < 10_000 and len(times["second"]) == 10
+    assert max(times["first"]) < min(times["second"])
@@ -0,0 +1,26 @@
+# Checks add_edges() and from_edge_list() error handling
+
+import pytest
+
+from graph import DirectedGraph, GraphException
+
+
+def test_from_edge_list_raises_on_missing_weight():
+    with pytest.raises(GraphException):
+        DirectedGraph.from_edge_list([("a", "b", 3), ("a", "c")], weighted=True)
+
+
+def test_add_edges_missing_weight_by_mode():
+    graph = DirectedGraph(True)
+    graph.add_vertices([("a", None), ("b", None)])
+    for on_missing in ("raise", "create"):
+        with pytest.raises(GraphException):
+            graph.add_edges([("a", "b")], on_missing=on_missing)
+
+    counts = graph.add_edges([("a", "b"), ("a", "b", 2)], on_missing="skip")
+    assert counts == {"inserted": 1, "duplicate": 0, "rejected": 1}
+
+
+def test_add_edges_rejects_short_tuples():
+    with pytest.raises(GraphException):
+        DirectedGraph().add_edges([("a",)], on_missing="create")
@@ -0,0 +1,134 @@
+# Checks strongly_connected_components, topological_sort, has_cycle and condensation against brute-force reachability
+
+import random
+
+import pytest
+
+from graph import DirectedGraph, GraphException
+from tests.conftest import random_graph
+
+
+def adjacent(graph: DirectedGraph, vert_id: str) -> list:
+    """get_adjacent_vertices() returns None for a vertex without outbound edges."""
+    return graph.get_adjacent_vertices(vert_id) or []
+
+
+def reachability(graph: DirectedGraph) -> dict:
+    """Maps each vertex to the set of vertices reachable from it by a path of one or more edges."""
+    reach = {}
+    for vert_id in graph._vertices:
+        seen = set()
+        frontier = adjacent(graph, vert_id)
+        while frontier:
+            vertex = frontier.pop()
+            if vertex not in seen:
+                seen.add(vertex)
+                frontier.extend(adjacent(graph, vertex))
+        reach[vert_id] = seen
+
+    return reach
+
+
+def random_cases(count: int = 60, acyclic: bool = False):
+    rnd = random.Random(1013)
+    for _ in range(count):
+        size = rnd.randint(1, 30)
+        yield random_graph(rnd, size, rnd.randint(0, 3 * size), acyclic=acyclic)
+
+
+def test_scc_matches_mutual_reachability():
+    for graph in random_cases():
+        reach = reachability(graph)
+        components = graph.strongly_connected_components()
+
+        members = [vert_id for component in components for vert_id in component]
+        assert sorted(members) == sorted(graph._vertices)
+
+        component_of = {vert_id: ind for ind, component in enumerate(components) for vert_id in component}
+        for source in graph._vertices:
+            for dest in graph._vertices:
+                mutual = source == dest or (dest in reach[source] and source in reach[dest])
+                assert (component_of[source] == component_of[dest]) == mutual
+
+
+def test_scc_reverse_topological_order():
+    for graph in random_cases():
+        components = graph.strongly_connected_components()
+        component_of = {vert_id: ind for ind, component in enumerate(components) for vert_id in component}
+        for source in graph._vertices:
+            for dest in adjacent(graph, source):
+                assert component_of[source] >= component_of[dest]
+
+
+def test_has_cycle_matches_reachability():
+    for graph in random_cases():
+        reach = reachability(graph)
+        assert graph.has_cycle() == any(vert_id in reach[vert_id] for vert_id in graph._vertices)
+
+
+def test_topological_sort_on_dags():
+    for graph in random_cases(acyclic=True):
+        order = graph.topological_sort()
+        assert sorted(order) == sorted(graph._vertices)
+        position = {vert_id: ind for ind, vert_id in enumerate(order)}
+        for source in graph._vertices:
+            for dest in adjacent(graph, source):
+                assert position[source] < position[dest]
+
+
+def test_topological_sort_raises_on_cycle():
+    for graph in random_cases():
+        if graph.has_cycle():
+            with pytest.raises(GraphException):
+                graph.topological_sort()
+
+
+def test_condensation_matches_components():
+    for graph in random_cases():
+        condensed = graph.condensation()
+        assert not condensed.has_cycle()
+
+        component_of = {}
+        for comp_id in condensed._vertices:
+            for vert_id in condensed._vertices[comp_id].value:
+                component_of[vert_id] = comp_id
+        assert sorted(component_of) == sorted(graph._vertices)
+        reach = reachability(graph)
+        for source in graph._vertices:
+            for dest in graph._vertices:
+                mutual = source == dest or (dest in reach[source] and source in reach[dest])
+                assert (component_of[source] == component_of[dest]) == mutual
+
+        # Expected edges between distinct components, keeping the lightest weight
+        expected = {}
+        for source in graph._vertices:
+            adj_vert = graph._vertices[source].adj_dict
+            for dest in adj_vert:
+                key = (component_of[source], component_of[dest])
+                if key[0] != key[1]:
+                    expected[key] = min(expected.get(key, adj_vert[dest]), adj_vert[dest])
+
+        actual = {(comp_id, dest): weight for comp_id in condensed._vertices
+                  for dest, weight in condensed._vertices[comp_id].adj_dict.items()}
+        assert actual == expected
+        # Component identifiers are numbered in topological order
+        assert all(int(source) < int(dest) for source, dest in actual)
+
+
+def test_large_graph_does_not_recurse():
+    size = 200_000
+    chain = DirectedGraph()
+    chain.add_vertices((str(ind), None) for ind in range(size))
+    chain.add_edges((str(ind), str(ind + 1)) for ind in range(size - 1))
+
+    assert not chain.has_cycle()
+    assert chain.topological_sort() == [str(ind) for ind in range(size)]
+    assert len(chain.strongly_connected_components()) == size
+    assert len(chain.condensation()._vertices) == size
+
+    # Closing the chain into a ring makes one component as deep as the graph
+    chain.add_edge(str(size - 1), "0")
+    assert chain.has_cycle()
+    components = chain.strongly_connected_components()
+    assert len(components) == 1 and len(components[0]) == size
+    assert len(chain.condensation()._vertices) == 1
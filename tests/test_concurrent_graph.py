@@ -0,0 +1,67 @@
+# Checks ConcurrentDirectedGraph reachability queries against lock holders and concurrent writers
+
+import random
+import threading
+
+from concurrent_graph import ConcurrentDirectedGraph
+from tests.conftest import chain
+
+
+def test_is_reachable_runs_alongside_readers():
+    for cached in (False, True):
+        concurrent = ConcurrentDirectedGraph(chain(10))
+        if cached:
+            concurrent.enable_reachability_cache()
+        results = []
+
+        # A reader holding the lock must not block reachability queries from other threads
+        concurrent._lock.acquire_read()
+        try:
+            worker = threading.Thread(target=lambda: results.append(concurrent.is_reachable("0", "9")))
+            worker.start()
+            worker.join(timeout=5)
+            assert not worker.is_alive()
+        finally:
+            concurrent._lock.release_read()
+        assert results == [True]
+
+
+def test_cached_queries_with_concurrent_writer():
+    rnd = random.Random(14)
+    size = 60
+    concurrent = ConcurrentDirectedGraph(chain(size))
+    concurrent.enable_reachability_cache(maxsize=8)
+    edges = [(str(rnd.randrange(size)), str(rnd.randrange(size))) for _ in range(200)]
+    errors = []
+
+    def reader(seed: int) -> None:
+        reader_rnd = random.Random(seed)
+        try:
+            for _ in range(300):
+                concurrent.is_reachable(str(reader_rnd.randrange(size)), str(reader_rnd.randrange(size)))
+        except Exception as error:
+            errors.append(error)
+
+    def writer() -> None:
+        for ind, (source_id, dest_id) in enumerate(edges):
+            concurrent.add_edge(source_id, dest_id)
+            # Remove every third edge again so cached sets are invalidated as well as patched
+            if ind % 3 == 0:
+                concurrent.remove_edge(source_id, dest_id)
+
+    threads = [threading.Thread(target=reader, args=(seed,)) for seed in range(4)] + [threading.Thread(target=writer)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+
+    # Cached answers must match an uncached search of the final graph
+    graph = concurrent._graph
+    for source_id in map(str, range(0, size, 7)):
+        for target_id in map(str, range(size)):
+            assert concurrent.is_reachable(source_id, target_id) == graph.depth_first_search(source_id, target_id)
+    assert concurrent.reachability_cache_stats()["hits"] > 0
+
+    concurrent.disable_reachability_cache()
+    assert concurrent.reachability_cache_stats()["size"] == 0
@@ -0,0 +1,26 @@
+# Checks that CountingQueue only counts removals that succeed
+
+import pytest
+
+from ds_library import (ArrayQueue, ArrayStack, CountingQueue, MinHeapEmptyException, PriorityQueue,
+                        QueueEmptyException, StackEmptyException)
+
+
+def test_empty_pop_is_not_counted():
+    stack = CountingQueue(ArrayStack())
+    with pytest.raises(StackEmptyException):
+        stack.pop()
+    assert stack.pops == 0
+
+    stack.push(1)
+    assert stack.pop() == 1
+    assert (stack.pushes, stack.pops, stack.peak_size) == (1, 1, 1)
+
+
+@pytest.mark.parametrize("container, error", [(ArrayQueue, QueueEmptyException),
+                                              (PriorityQueue, MinHeapEmptyException)])
+def test_empty_dequeue_is_not_counted(container, error):
+    queue = CountingQueue(container())
+    with pytest.raises(error):
+        queue.dequeue()
+    assert queue.pops == 0
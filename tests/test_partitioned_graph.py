@@ -0,0 +1,85 @@
+# Checks PartitionedDirectedGraph against a single DirectedGraph receiving the same operations
+
+import random
+
+import pytest
+
+from graph import DirectedGraph, GraphException
+from partitioned_graph import PartitionedDirectedGraph
+from tests.conftest import random_graph
+
+
+def same_result(partitioned: PartitionedDirectedGraph, graph: DirectedGraph, operation) -> None:
+    """Runs the operation on both graphs and asserts they return the same value or raise the same error."""
+    results = []
+    for target in (partitioned, graph):
+        try:
+            results.append(("ok", operation(target)))
+        except GraphException as error:
+            results.append(("error", str(error)))
+    assert results[0] == results[1]
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_matches_single_graph(seed):
+    rnd = random.Random(seed)
+    size = rnd.randint(5, 60)
+    weighted = seed % 2 == 0
+    graph = random_graph(rnd, size, 4 * size, weighted)
+
+    with PartitionedDirectedGraph(rnd.choice([1, 2, 3, 5]), weighted) as partitioned:
+        # Copy the graph, plus edges to missing vertices that both must reject
+        partitioned.add_vertices((vert_id, vertex.value) for vert_id, vertex in graph._vertices.items())
+        edges = [(vert_id, dest_id, weight) for vert_id, vertex in graph._vertices.items()
+                 for dest_id, weight in vertex.adj_dict.items()]
+        missing = [(str(rnd.randrange(size)), str(size + ind), 1) for ind in range(3)]
+        assert partitioned.add_edges(edges, on_missing="skip")["inserted"] == len(edges)
+        assert partitioned.add_edges(missing, on_missing="skip") == graph.add_edges(missing, on_missing="skip")
+
+        for step in range(120):
+            source, dest = str(rnd.randrange(size + 2)), str(rnd.randrange(size + 2))
+            operation = rnd.random()
+            if operation < 0.3:
+                same_result(partitioned, graph, lambda target: target.add_edge(source, dest, 4))
+            elif operation < 0.45:
+                same_result(partitioned, graph, lambda target: target.remove_edge(source, dest))
+            elif operation < 0.5:
+                same_result(partitioned, graph, lambda target: target.remove_vertex(source))
+            elif operation < 0.55:
+                same_result(partitioned, graph, lambda target: target.add_vertex(source, 1))
+
+            same_result(partitioned, graph, lambda target: target.edge_exists(source, dest))
+            same_result(partitioned, graph, lambda target: target.vertex_exists(source))
+            same_result(partitioned, graph, lambda target: sorted(target.get_adjacent_vertices(source) or []))
+            same_result(partitioned, graph, lambda target: sorted(target.get_inbound_vertices(source) or []))
+            same_result(partitioned, graph, lambda target: target.in_degree(source))
+            same_result(partitioned, graph, lambda target: target.out_degree(source))
+
+            if step % 10 == 0 and graph.vertex_exists(source):
+                # BFS order may differ between shards, but every level must come before the next
+                reachable = partitioned.breadth_first_search(source)
+                assert sorted(reachable) == sorted(graph.breadth_first_search(source))
+                hops = {vert_id: depth for vert_id, depth, _ in graph.iter_bfs(source)}
+                assert [hops[vert_id] for vert_id in reachable] == sorted(hops.values())
+                if graph.vertex_exists(dest):
+                    found = partitioned.breadth_first_search(source, dest)[0]
+                    assert found == graph.breadth_first_search(source, dest)[0]
+                if weighted:
+                    order, distances = partitioned.min_path(source)
+                    assert distances == graph.min_path(source)[1]
+                    assert [distances[vert_id] for vert_id in order] == sorted(distances.values())
+
+        stats = partitioned.shard_stats()
+        assert sum(shard["vertices"] for shard in stats) == graph._size
+        assert (sum(shard["local_edges"] + shard["boundary_edges"] for shard in stats)
+                == sum(len(vertex.adj_dict) for vertex in graph._vertices.values()))
+
+
+@pytest.mark.parametrize("on_missing", ["raise", "create", "skip"])
+def test_add_edges_errors_match_single_graph(on_missing):
+    graph = DirectedGraph(True)
+    graph.add_vertices([("a", None), ("b", None)])
+    with PartitionedDirectedGraph(2, True) as partitioned:
+        partitioned.add_vertices([("a", None), ("b", None)])
+        for edges in ([("a", "b")], [("a",)], [("a", "b", 2), ("b", "a")]):
+            same_result(partitioned, graph, lambda target: target.add_edges(edges, on_missing=on_missing))
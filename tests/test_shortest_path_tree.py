@@ -0,0 +1,84 @@
+# Checks the incrementally maintained ShortestPathTree and the change journal against fresh min_path() results
+
+import random
+
+import pytest
+
+from graph import DirectedGraph, GraphException, ShortestPathTree
+from tests.conftest import random_graph
+
+
+def mutate(graph: DirectedGraph, rnd: random.Random, source_id: str, size: int) -> None:
+    """Applies one random add, remove or reweight, never removing the tree's source."""
+    ids = list(graph._vertices)
+    source, dest = rnd.choice(ids), rnd.choice(ids)
+    operation = rnd.random()
+    if operation < 0.35:
+        graph.add_edge(source, dest, rnd.randint(1, 9))
+    elif operation < 0.6:
+        if graph.edge_exists(source, dest):
+            graph.remove_edge(source, dest)
+    elif operation < 0.9:
+        if graph.edge_exists(source, dest):
+            graph.update_edge_weight(source, dest, rnd.randint(1, 9))
+    elif operation < 0.95:
+        graph.add_edges([(source, str(rnd.randrange(size + 5)), rnd.randint(1, 9))], on_missing="create")
+    elif source != source_id:
+        graph.remove_vertex(source)
+
+
+def test_tree_matches_min_path_under_mutation():
+    for seed in range(60):
+        rnd = random.Random(seed)
+        size = rnd.randint(2, 40)
+        graph = random_graph(rnd, size)
+        tree = ShortestPathTree(graph, "0")
+
+        for _ in range(200):
+            mutate(graph, rnd, "0", size)
+            expected = graph.min_path("0")[1]
+            assert tree.min_path()[1] == expected
+
+            for vert_id in expected:
+                path = tree.path(vert_id)
+                assert path[0] == "0" and path[-1] == vert_id
+                assert sum(graph._vertices[a].adj_dict[b] for a, b in zip(path, path[1:])) == expected[vert_id]
+
+        tree.close()
+
+
+def test_tree_empties_when_source_removed():
+    graph = random_graph(random.Random(7), 10)
+    tree = ShortestPathTree(graph, "0")
+    graph.remove_vertex("0")
+    assert tree.min_path()[1] == {}
+    tree.close()
+
+
+def test_journal_keeps_latest_changes_in_order():
+    rnd = random.Random(21)
+    graph = random_graph(rnd, 20)
+    graph.enable_journal(maxlen=50)
+    seen = []
+    graph.subscribe(seen.append)
+    for _ in range(200):
+        mutate(graph, rnd, "0", 20)
+
+    changes = graph.journal()
+    assert 0 < len(changes) <= 50
+    assert [change.sequence for change in changes] == [change.sequence for change in seen[-len(changes):]]
+    assert graph.journal(since=changes[-1].sequence) == []
+
+
+def test_update_edge_weight_errors():
+    graph = DirectedGraph(True)
+    graph.add_vertex("a", 1)
+    graph.add_vertex("b", 1)
+    graph.add_edge("a", "b", 3)
+
+    with pytest.raises(GraphException):
+        graph.update_edge_weight("b", "a", 2)
+    with pytest.raises(GraphException):
+        graph.update_edge_weight("a", "b", 0)
+    with pytest.raises(GraphException):
+        DirectedGraph().update_edge_weight("a", "b", 1)